@@ -0,0 +1,409 @@
+#!/usr/bin/env python
+#
+# Micro-benchmarks for troposphere internals.
+#
+# These are meant to be run by hand (from the top of the source tree) when
+# changing hot paths such as object construction or property assignment.
+# Run the same benchmark against two revisions to compare them, e.g.:
+#
+#   python scripts/benchmark.py setattr
+#   git stash && python scripts/benchmark.py setattr && git stash pop
+
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def measure(func, number, repeat=5):
+    """Returns the best time in seconds of a single call to func."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_setattr(args):
+    """Per-assignment cost of setting properties on existing objects."""
+    from troposphere import Ref, Tags, appmesh, ec2, ecs, iam
+
+    sg = ec2.SecurityGroup("SecurityGroup", GroupDescription="desc")
+    ingress = ec2.SecurityGroupIngress("Ingress", IpProtocol="tcp")
+    container = ecs.ContainerDefinition(Name="app", Image="nginx")
+    role = iam.Role("Role", AssumeRolePolicyDocument={})
+    tls = appmesh.VirtualGatewayClientPolicyTls()
+
+    cases = [
+        # plain type
+        ("ec2.SecurityGroup.GroupDescription (str)", sg, "GroupDescription", "d"),
+        # helper function bypasses validation
+        ("ec2.SecurityGroup.VpcId (Ref)", sg, "VpcId", Ref("Vpc")),
+        ("ec2.SecurityGroup.Tags (Tags)", sg, "Tags", Tags(Name="sg")),
+        # validator function
+        ("ec2.SecurityGroupIngress.FromPort (integer)", ingress, "FromPort", 80),
+        ("ecs.ContainerDefinition.Essential (boolean)", container, "Essential", 1),
+        ("ecs.ContainerDefinition.Memory (integer)", container, "Memory", 512),
+        # list of types
+        (
+            "ecs.ContainerDefinition.PortMappings ([PortMapping] x10)",
+            container,
+            "PortMappings",
+            [ecs.PortMapping(ContainerPort=i) for i in range(10)],
+        ),
+        ("iam.Role.ManagedPolicyArns ([str] x5)", role, "ManagedPolicyArns", ["a"] * 5),
+        # list of a single validator function
+        ("appmesh.VirtualGatewayClientPolicyTls.Ports", tls, "Ports", [443] * 5),
+    ]
+
+    for name, obj, prop, value in cases:
+        seconds = measure(lambda: setattr(obj, prop, value), args.number)
+        print("%-60s %10.1f ns" % (name, seconds * 1e9))
+
+
+def bench_construct(args):
+    """Cost of constructing objects with keyword arguments."""
+    from troposphere import Ref, Sub, ecs, iam
+
+    policy = {"Version": "2012-10-17", "Statement": []}
+    cases = [
+        ("ecs.PortMapping (1 prop)", lambda: ecs.PortMapping(ContainerPort=80)),
+        (
+            "ecs.ContainerDefinition (6 props)",
+            lambda: ecs.ContainerDefinition(
+                Name="app",
+                Image="nginx",
+                Essential=True,
+                Memory=512,
+                Cpu=256,
+                PortMappings=[],
+            ),
+        ),
+        (
+            "ecs.TaskDefinition (5 props)",
+            lambda: ecs.TaskDefinition(
+                "TaskDefinition",
+                Family="app",
+                Cpu="256",
+                Memory="512",
+                NetworkMode="awsvpc",
+                ExecutionRoleArn=Ref("Role"),
+            ),
+        ),
+        (
+            "iam.Role (4 props)",
+            lambda: iam.Role(
+                "Role",
+                AssumeRolePolicyDocument=policy,
+                Path="/",
+                ManagedPolicyArns=["arn"],
+                RoleName=Sub("${AWS::StackName}-role"),
+            ),
+        ),
+        (
+            "iam.Policy (2 props)",
+            lambda: iam.Policy(PolicyName="policy", PolicyDocument=policy),
+        ),
+    ]
+    for name, construct in cases:
+        seconds = measure(construct, args.number // 10)
+        print("%-60s %10.1f ns" % (name, seconds * 1e9))
+
+
+def build_template(resources=500):
+    """Builds a template with a mix of resources sharing Tags and policies."""
+    from troposphere import (
+        GetAtt,
+        Join,
+        Output,
+        Parameter,
+        Ref,
+        Sub,
+        Tags,
+        Template,
+        ec2,
+        iam,
+    )
+
+    t = Template(Description="Benchmark template")
+    vpc = t.add_parameter(Parameter("VpcId", Type="AWS::EC2::VPC::Id"))
+    tags = Tags(Application="benchmark", Owner="team", Environment="test")
+    policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["s3:GetObject", "s3:PutObject"],
+                "Resource": [Join("", ["arn:aws:s3:::bucket", "/*"])],
+            }
+        ],
+    }
+    for i in range(resources // 2):
+        sg = t.add_resource(
+            ec2.SecurityGroup(
+                "SecurityGroup%d" % i,
+                GroupDescription="Security group %d" % i,
+                VpcId=Ref(vpc),
+                SecurityGroupIngress=[
+                    ec2.SecurityGroupRule(
+                        IpProtocol="tcp",
+                        FromPort=port,
+                        ToPort=port,
+                        CidrIp="10.0.0.0/8",
+                    )
+                    for port in (22, 80, 443)
+                ],
+                Tags=tags,
+            )
+        )
+        t.add_resource(
+            iam.Role(
+                "Role%d" % i,
+                AssumeRolePolicyDocument=policy,
+                Policies=[
+                    iam.Policy(
+                        PolicyName=Sub("${AWS::StackName}-%d" % i),
+                        PolicyDocument=policy,
+                    )
+                ],
+                Tags=tags,
+            )
+        )
+        if i < 100:
+            t.add_output(Output("SecurityGroup%dId" % i, Value=GetAtt(sg, "GroupId")))
+    return t
+
+
+def bench_render(args):
+    """Wall time of rendering a 500-resource template."""
+    t = build_template()
+    devnull = open(os.devnull, "w")
+    for name, render in (
+        ("Template.to_dict()", t.to_dict),
+        ("Template.to_json()", t.to_json),
+        ("Template.write_json()", lambda: t.write_json(devnull)),
+        ("Template.to_yaml()", t.to_yaml),
+        ("Template.to_yaml(clean_up=True)", lambda: t.to_yaml(clean_up=True)),
+    ):
+        seconds = measure(render, max(1, args.number // 10000))
+        print("%-60s %10.2f ms" % (name, seconds * 1e3))
+
+    # Serializing the encoded template with each installed JSON backend
+    from troposphere import json_backend
+
+    data = t.to_dict()
+    for backend in json_backend.BACKENDS:
+        try:
+            json_backend.set_backend(backend)
+        except ImportError:
+            continue
+        for name, kwargs in (
+            ("pretty", {"indent": 4, "sort_keys": True, "separators": (",", ": ")}),
+            ("minified", {"sort_keys": True, "separators": (",", ":")}),
+        ):
+            seconds = measure(
+                lambda: json_backend.dumps(data, **kwargs),
+                max(1, args.number // 10000),
+            )
+            print(
+                "%-60s %10.2f ms" % ("%s backend, %s" % (backend, name), seconds * 1e3)
+            )
+    json_backend.set_backend(None)
+
+    # Re-rendering after changing a single resource
+    cached = build_template()
+    cached.set_resource_cache()
+    role = cached.resources["Role0"]
+
+    for name, render in (
+        ("Template.to_dict() cached, 1 resource changed", cached.to_dict),
+        ("Template.to_json() cached, 1 resource changed", cached.to_json),
+        ("Template.fingerprint() cached, 1 resource changed", cached.fingerprint),
+    ):
+
+        def rerender():
+            role.Path = "/"
+            render()
+
+        rerender()
+        seconds = measure(rerender, max(1, args.number // 10000))
+        print("%-60s %10.2f ms" % (name, seconds * 1e3))
+
+
+def bench_memory(args):
+    """Peak memory allocated rendering and importing a 500-resource template."""
+    import tracemalloc
+
+    t = build_template()
+    devnull = open(os.devnull, "w")
+    for name, render in (
+        ("Template.to_json()", t.to_json),
+        ("Template.write_json()", lambda: t.write_json(devnull)),
+    ):
+        tracemalloc.start()
+        render()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("%-60s %10.2f MB" % (name, peak / 2**20))
+
+    # Importing the rendered template from a file
+    import json
+    import tempfile
+
+    from troposphere.template_generator import TemplateGenerator
+
+    path = os.path.join(tempfile.mkdtemp(), "template.json")
+    with open(path, "w") as f:
+        t.write_json(f)
+
+    def generate():
+        with open(path) as f:
+            TemplateGenerator(json.load(f))
+
+    generate()
+    for name, generate in (
+        ("TemplateGenerator()", generate),
+        (
+            "TemplateGenerator.iter_resources()",
+            lambda: [r.title for _, r in TemplateGenerator.iter_resources(path)],
+        ),
+    ):
+        tracemalloc.start()
+        generate()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("%-60s %10.2f MB" % (name, peak / 2**20))
+    os.remove(path)
+    os.rmdir(os.path.dirname(path))
+
+
+def bench_import(args):
+    """Wall time of TemplateGenerator on 2,000 resources in 4 templates."""
+    from troposphere import AWSObject
+    from troposphere.template_generator import TemplateGenerator
+
+    class CustomQueue(AWSObject):
+        resource_type = "Custom::Queue"
+        props = {"ServiceToken": (str, True), "QueueName": (str, False)}
+
+    # Templates are limited to MAX_RESOURCES so the resources are split up
+    data = build_template().to_dict()
+    custom = build_template(400).to_dict()
+    for i in range(100):
+        custom["Resources"]["Queue%d" % i] = {
+            "Type": CustomQueue.resource_type,
+            "Properties": {"ServiceToken": "arn", "QueueName": "queue%d" % i},
+        }
+
+    def generate(template, **kwargs):
+        for _ in range(4):
+            TemplateGenerator(template, **kwargs)
+
+    # Imports the modules used so they are not part of the first run
+    generate(data)
+    for name, func in (
+        ("TemplateGenerator() 4 x 500 resources", lambda: generate(data)),
+        (
+            "TemplateGenerator() 4 x 500 resources, 100 CustomMembers",
+            lambda: generate(custom, CustomMembers=[CustomQueue]),
+        ),
+    ):
+        seconds = measure(func, max(1, args.number // 100000))
+        print("%-60s %10.2f ms" % (name, seconds * 1e3))
+
+
+def bench_batch(args):
+    """Wall time of TemplateGenerator.from_files() on 200 template files."""
+    import shutil
+    import tempfile
+
+    from troposphere.template_generator import TemplateGenerator
+
+    root = os.path.join(os.path.dirname(__file__), "..", "tests", "examples_output")
+    directory = tempfile.mkdtemp()
+    paths = []
+    examples = sorted(n for n in os.listdir(root) if not n.startswith("OpenStack"))
+    for i in range(200):
+        path = os.path.join(directory, "%d.json" % i)
+        shutil.copy(os.path.join(root, examples[i % len(examples)]), path)
+        paths.append(path)
+    try:
+        for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+            seconds = measure(
+                lambda: TemplateGenerator.from_files(paths, workers=workers), 1, 3
+            )
+            name = "TemplateGenerator.from_files() workers=%d" % workers
+            print("%-60s %10.2f ms" % (name, seconds * 1e3))
+    finally:
+        shutil.rmtree(directory)
+
+
+STARTUP_TEMPLATE = {
+    "Resources": {
+        "Bucket": {"Type": "AWS::S3::Bucket"},
+        "Topic": {"Type": "AWS::SNS::Topic"},
+        "Queue": {"Type": "AWS::SQS::Queue"},
+        "Role": {
+            "Type": "AWS::IAM::Role",
+            "Properties": {"AssumeRolePolicyDocument": {}},
+        },
+        "Function": {
+            "Type": "AWS::Lambda::Function",
+            "Properties": {
+                "Code": {"ZipFile": "pass"},
+                "Role": {"Fn::GetAtt": ["Role", "Arn"]},
+            },
+        },
+    }
+}
+
+STARTUP_CODE = """
+import time
+start = time.perf_counter()
+from troposphere.template_generator import TemplateGenerator
+TemplateGenerator(%r)%s
+print(time.perf_counter() - start)
+"""
+
+
+def bench_startup(args):
+    """Cold start of TemplateGenerator on a 5-resource template."""
+    root = os.path.join(os.path.dirname(__file__), "..")
+    for name, suffix in (
+        ("TemplateGenerator() importing all modules", ".inspect_members"),
+        ("TemplateGenerator() using the registry", ""),
+    ):
+        code = STARTUP_CODE % (STARTUP_TEMPLATE, suffix)
+        seconds = min(
+            float(subprocess.check_output([sys.executable, "-c", code], cwd=root))
+            for _ in range(5)
+        )
+        print("%-60s %10.2f ms" % (name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--number", type=int, default=200000)
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    subparsers.add_parser("setattr", help=bench_setattr.__doc__).set_defaults(
+        func=bench_setattr
+    )
+    subparsers.add_parser("construct", help=bench_construct.__doc__).set_defaults(
+        func=bench_construct
+    )
+    subparsers.add_parser("render", help=bench_render.__doc__).set_defaults(
+        func=bench_render
+    )
+    subparsers.add_parser("memory", help=bench_memory.__doc__).set_defaults(
+        func=bench_memory
+    )
+    subparsers.add_parser("import", help=bench_import.__doc__).set_defaults(
+        func=bench_import
+    )
+    subparsers.add_parser("batch", help=bench_batch.__doc__).set_defaults(
+        func=bench_batch
+    )
+    subparsers.add_parser("startup", help=bench_startup.__doc__).set_defaults(
+        func=bench_startup
+    )
+    args = parser.parse_args()
+    args.func(args)
@@ -3,6 +3,10 @@
 
 import argparse
 import ast
+import concurrent.futures
+import contextlib
+import hashlib
+import io
 import json
 import os
 import re
@@ -42,6 +46,16 @@ import yaml
 # will still pass. This incudes import declarations, class output ordering,
 # and spacing considerations.
 #
+# With --output-dir each module is written to its own file instead of stdout.
+# Only new modules and those marked as autogenerated are written, the hand
+# maintained ones are left alone. Adding --incremental keeps a cache of the
+# hash of the inputs of each module (its slice of the patched specification,
+# its patch and validator files and this script) and only regenerates the
+# modules whose inputs changed, in parallel across --jobs processes. When
+# only the specification version changed the header line is updated in place.
+#
+#   python scripts/gen.py --output-dir troposphere --incremental spec.json
+#
 # Todo:
 # - Currently only handles the single files (not the all-in-one)
 #   (Note: but will deal with things like spec/GuardDuty*)
@@ -64,6 +78,9 @@ copyright_header = """\
 """
 spec_version = ""
 
+autogenerated_marker = "*** Do not modify - this file is autogenerated ***"
+version_re = re.compile(r"^# Resource specification version: .*$", re.MULTILINE)
+
 
 class Node:
     """Node object for building a per-file/service dependecy tree.
@@ -228,7 +245,7 @@ class File:
         seen[t.name] = True
         class_validator = self.class_validators.get(t.name, None)
         if stub:
-            output_class_stub(t.name, t.props, class_validator)
+            output_class_stub(t.name, t.props, t.resource_name)
             return
         if t.resource_name:
             output_class(t.name, t.props, class_validator, t.resource_name)
@@ -274,7 +291,10 @@ class File:
         self._get_file_validators()
 
         print(copyright_header % spec_version)
-        self._output_imports()
+        if stub:
+            sys.stdout.write(stub_header)
+        else:
+            self._output_imports()
 
         seen = {}
         for class_name, properties in sorted(self.resources.items()):
@@ -342,7 +362,7 @@ map_type = {
 
 map_type3 = {
     "Boolean": "bool",
-    "Double": "double",
+    "Double": "float",
     "Integer": "int",
     "Json": "dict",
     "Long": "int",
@@ -375,26 +395,6 @@ def get_type(value):
     raise ValueError("get_type")
 
 
-def get_type3(value):
-    if "PrimitiveType" in value:
-        return map_type3.get(value["PrimitiveType"], value["PrimitiveType"])
-    if value["Type"] == "List":
-        if "ItemType" in value:
-            return "[%s]" % value["ItemType"]
-        else:
-            return "[%s]" % map_type3.get(value["PrimitiveItemType"])
-    elif value["Type"] == "Map":
-        return "dict"
-    else:
-        # Non-primitive (Property) name
-        return value["Type"]
-
-    import pprint
-
-    pprint.pprint(value)
-    raise ValueError("get_type")
-
-
 def output_class(class_name, properties, class_validator, resource_name=None):
     print()
     print()
@@ -425,6 +425,38 @@ def output_class(class_name, properties, class_validator, resource_name=None):
         print(f"       {class_validator}(self)")
 
 
+stub_header = """\
+from typing import Any, List, Optional, Union
+
+from . import AWSHelperFn, AWSObject, AWSProperty, Tags, Template
+"""
+
+
+def get_stub_type(key, value):
+    """Return the type annotation of a property in a stub."""
+
+    def or_helper(value_type):
+        if value_type == "Any":
+            return value_type
+        return f"Union[{value_type}, AWSHelperFn]"
+
+    if key == "Tags":
+        return "Tags"
+    if "PrimitiveType" in value:
+        # Primitive types replaced by a validator function accept Any
+        return or_helper(map_type3.get(value["PrimitiveType"], "Any"))
+    if "Type" not in value or value["Type"] == "Map":
+        return or_helper("dict")
+    if value["Type"] == "List":
+        if "ItemType" in value:
+            item_type = value["ItemType"]
+        else:
+            item_type = map_type3.get(value["PrimitiveItemType"], "Any")
+        return f"List[{or_helper(item_type)}]"
+    # Non-primitive (Property) name
+    return or_helper(value["Type"])
+
+
 def output_class_stub(class_name, properties, resource_name=None):
     print()
     print()
@@ -432,36 +464,156 @@ def output_class_stub(class_name, properties, resource_name=None):
         print(f"class {class_name}(AWSObject):")
         print("    resource_type: str")
         print()
-        sys.stdout.write("    def __init__(self, title")
+        print("    def __init__(")
+        print("        self,")
+        print("        title: str,")
+        print("        template: Optional[Template] = ...,")
+        print("        validation: bool = ...,")
     else:
         print(f"class {class_name}(AWSProperty):")
         print()
-        sys.stdout.write("    def __init__(self")
+        print("    def __init__(")
+        print("        self,")
+        print("        title: Optional[str] = ...,")
 
+    # Properties can only be passed by keyword
+    if properties:
+        print("        *,")
     for key, value in sorted(properties.items()):
-        if key == "Tags":
-            value_type = "Tags"
-        else:
-            value_type = get_type3(value)
-
-        if value_type.startswith("["):  # Means that args are a list
-            sys.stdout.write(f", {key}:List{value_type}=...")
-        else:
-            sys.stdout.write(f", {key}:{value_type}=...")
-
-    print(") -> None: ...")
+        print(f"        {key}: {get_stub_type(key, value)} = ...,")
+    print("    ) -> None: ...")
     print()
 
     for key, value in sorted(properties.items()):
-        if key == "Tags":
-            value_type = "Tags"
-        else:
-            value_type = get_type3(value)
+        print(f"    {key}: {get_stub_type(key, value)}")
+
+
+index_header = """\
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+#
+# *** Do not modify - this file is autogenerated ***
+\"\"\"
+Index of the classes TemplateGenerator can create so that it only has to
+import the modules used by a template.
+
+Regenerate with: python scripts/gen.py --index > troposphere/registry.py
+\"\"\"
+"""
+
+
+def output_index():
+    """Output troposphere/registry.py for TemplateGenerator."""
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+    from troposphere.template_generator import _build_registry
+
+    modules, resources, functions = _build_registry()
 
-        if value_type.startswith("["):  # Means that args are a list
-            print(f"    {key}: List{value_type}")
+    print(index_header)
+    print("MODULES = (")
+    for name in modules:
+        print('    "%s",' % name)
+    print(")")
+    print()
+    print("RESOURCE_TYPES = {")
+    for resource_type, path in sorted(resources.items()):
+        print('    "%s": "%s",' % (resource_type, path))
+    print("}")
+    print()
+    print("FUNCTIONS = {")
+    for name, path in sorted(functions.items()):
+        print('    "%s": "%s",' % (name, path))
+    print("}")
+
+
+def module_inputs_hash(file, patch_dir):
+    """Return a hash of everything the module for file is generated from."""
+    h = hashlib.sha256()
+    spec_slice = [file.resources, file.resource_names, file.properties]
+    h.update(json.dumps(spec_slice, sort_keys=True).encode("utf-8"))
+    inputs = [__file__, f"troposphere/validators/{file.filename}.py"]
+    for patch_file in sorted(os.listdir(patch_dir)):
+        if patch_file.lower() == f"{file.filename}.json":
+            inputs.append(os.path.join(patch_dir, patch_file))
+    for filename in inputs:
+        h.update(filename.encode("utf-8"))
+        try:
+            with open(filename, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+        except FileNotFoundError:
+            h.update(b"-")
+    h.update(b"stub" if stub else b"")
+    return h.hexdigest()
+
+
+def generate_module(file, stub_output, version):
+    """Return the source of the module for file, run by the --jobs workers."""
+    global stub, spec_version
+    stub = stub_output
+    spec_version = version
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        file.output()
+    return output.getvalue()
+
+
+def output_modules(r, output_dir, names, incremental, cache_file, patch_dir, jobs):
+    """Write the modules in names to output_dir, see --output-dir."""
+    extension = ".pyi" if stub else ".py"
+    cache = {}
+    if incremental:
+        try:
+            with open(cache_file) as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            pass
+
+    hashes = {}
+    changed = []
+    counts = {"generated": 0, "version updated": 0, "unchanged": 0, "skipped": 0}
+    for name in names:
+        path = os.path.join(output_dir, name + extension)
+        contents = None
+        if os.path.exists(path):
+            with open(path) as f:
+                contents = f.read()
+            if autogenerated_marker not in contents:
+                # A hand maintained module
+                counts["skipped"] += 1
+                continue
+        hashes[name] = module_inputs_hash(r.files[name], patch_dir)
+        if contents is None or cache.get(name + extension) != hashes[name]:
+            changed.append(name)
+            continue
+        header = f"# Resource specification version: {spec_version}"
+        updated = version_re.sub(header, contents, count=1)
+        if updated != contents:
+            with open(path, "w") as f:
+                f.write(updated)
+            counts["version updated"] += 1
         else:
-            print(f"    {key}: {value_type}")
+            counts["unchanged"] += 1
+
+    with concurrent.futures.ProcessPoolExecutor(max(1, jobs)) as executor:
+        sources = executor.map(
+            generate_module,
+            [r.files[name] for name in changed],
+            [stub] * len(changed),
+            [spec_version] * len(changed),
+        )
+        for name, source in zip(changed, sources):
+            with open(os.path.join(output_dir, name + extension), "w") as f:
+                f.write(source)
+            counts["generated"] += 1
+
+    if incremental:
+        for name, value in hashes.items():
+            cache[name + extension] = value
+        with open(cache_file, "w") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    print(", ".join(f"{v} {k}" for k, v in counts.items()), file=sys.stderr)
 
 
 def process_file(filename, stub=False):
@@ -494,17 +646,55 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--stub", action="store_true", default=False)
     parser.add_argument("--name", action="store")
-    parser.add_argument("filename", nargs="+")
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        default=False,
+        help="output the TemplateGenerator index instead of a module",
+    )
+    parser.add_argument(
+        "--output-dir",
+        action="store",
+        help="write each autogenerated module to its own file in this directory",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="with --output-dir, only regenerate modules whose inputs changed",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store",
+        help="input hashes for --incremental (default: OUTPUT_DIR/.gen-cache.json)",
+    )
+    parser.add_argument(
+        "--jobs",
+        action="store",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes generating modules with --output-dir",
+    )
+    parser.add_argument("--patch-dir", action="store", default="scripts/patches")
+    parser.add_argument("filename", nargs="*")
     args = parser.parse_args()
 
+    if args.index:
+        output_index()
+        sys.exit(0)
+    if not args.filename:
+        parser.error("a resource specification file is required")
+    if args.incremental and not args.output_dir:
+        parser.error("--incremental requires --output-dir")
+
     stub = args.stub
 
     f = open(args.filename[0])
     resource_spec = json.load(f)
 
     # Apply json patches
-    patch_dir = "scripts/patches"
-    for patch_file in os.listdir(patch_dir):
+    patch_dir = args.patch_dir
+    for patch_file in sorted(os.listdir(patch_dir)):
         if patch_file.endswith(".json"):
             patch = json.loads(open(os.path.join(patch_dir, patch_file)).read())
             resource_spec = jsonpatch.apply_patch(resource_spec, patch)
@@ -513,7 +703,18 @@ if __name__ == "__main__":
 
     r = Resources(resource_spec)
 
-    if args.name:
+    if args.output_dir:
+        names = [args.name.lower()] if args.name else sorted(r.files)
+        output_modules(
+            r,
+            args.output_dir,
+            names,
+            args.incremental,
+            args.cache or os.path.join(args.output_dir, ".gen-cache.json"),
+            patch_dir,
+            args.jobs,
+        )
+    elif args.name:
         r.output_file(args.name.lower())
     else:
         r.output_files()
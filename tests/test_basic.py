@@ -1,7 +1,10 @@
 import pickle
+import subprocess
+import sys
 import unittest
 
 from troposphere import (
+    AWSHelperFn,
     AWSObject,
     AWSProperty,
     Cidr,
@@ -14,9 +17,11 @@ from troposphere import (
     Region,
     Split,
     Sub,
+    Tags,
     Template,
     cloudformation,
     depends_on_helper,
+    encode_to_dict,
 )
 from troposphere.ec2 import Instance, NetworkInterface, Route, SecurityGroupRule
 from troposphere.elasticloadbalancing import HealthCheck
@@ -87,6 +92,61 @@ class TestBasic(unittest.TestCase):
         p = pickle.dumps(b)
         b2 = pickle.loads(p)
         self.assertEqual(b2.BucketName, b.BucketName)
+        b2.BucketName = "other-bucket"
+        self.assertEqual(b2.BucketName, "other-bucket")
+        with self.assertRaises(TypeError):
+            b2.BucketName = 1
+
+    def test_class_meta_shared(self):
+        b1 = Bucket("B1")
+        b2 = Bucket("B2", BucketName="test-bucket")
+        self.assertIs(b1._class_meta(), b2._class_meta())
+        self.assertEqual(b1.propnames, frozenset(Bucket.props))
+        # Only slots are used unless a subclass adds its own attributes
+        self.assertEqual(b2.__dict__, {})
+
+    def test_class_meta_props_updated(self):
+        class Recursive(AWSProperty):
+            props = {"Name": (str, False)}
+
+        Recursive(Name="foo")
+        Recursive.props["Children"] = ([Recursive], False)
+        r = Recursive(Name="foo", Children=[Recursive(Name="bar")])
+        self.assertEqual(r.to_dict(), {"Name": "foo", "Children": [{"Name": "bar"}]})
+
+    def test_init_attributes(self):
+        # Resource attributes passed as keywords are not properties
+        b = Bucket("B", DependsOn=Bucket("Other"), Condition="IsProd")
+        self.assertEqual(
+            b.to_dict(),
+            {"Type": "AWS::S3::Bucket", "DependsOn": "Other", "Condition": "IsProd"},
+        )
+        with self.assertRaises(AttributeError):
+            Bucket("B", NotAProperty=1)
+        with self.assertRaises(TypeError):
+            Bucket("B", BucketName=1)
+
+    def test_init_subclass_setattr(self):
+        assigned = []
+
+        class LoggingBucket(Bucket):
+            def __setattr__(self, name, value):
+                assigned.append(name)
+                super().__setattr__(name, value)
+
+        b = LoggingBucket("B", BucketName="name")
+        self.assertIn("BucketName", assigned)
+        self.assertIn("title", assigned)
+        self.assertEqual(b.BucketName, "name")
+
+    def test_class_defaults(self):
+        class DefaultBucket(Bucket):
+            BucketName = "default-bucket"
+
+        b1 = DefaultBucket("B1")
+        self.assertEqual(b1.properties["BucketName"], "default-bucket")
+        b2 = DefaultBucket("B2", BucketName="other-bucket")
+        self.assertEqual(b2.properties["BucketName"], "other-bucket")
 
 
 def double(x):
@@ -576,5 +636,140 @@ class TestAttributes(unittest.TestCase):
         self.assertEqual(t.to_yaml(), test_updatereplacepolicy_yaml)
 
 
+class TestEncodeToDict(unittest.TestCase):
+    def test_deep_nesting(self):
+        value = "leaf"
+        for _ in range(5000):
+            value = If("Condition", value, NoValue)
+        d = encode_to_dict(value)
+        for _ in range(5000):
+            d = d["Fn::If"][1]
+        self.assertEqual(d, "leaf")
+
+    def test_plain_data_copied(self):
+        metadata = {"Key": ["a", {"b": 1}]}
+        encoded = encode_to_dict({"Metadata": metadata, "Ref": Ref("Foo")})
+        self.assertEqual(encoded["Metadata"], metadata)
+        self.assertIsNot(encoded["Metadata"], metadata)
+        self.assertIsNot(encoded["Metadata"]["Key"][1], metadata["Key"][1])
+        self.assertEqual(encoded["Ref"], {"Ref": "Foo"})
+
+    def test_object_state_not_aliased(self):
+        b = Bucket("B1", BucketName="test-bucket")
+        d = b.to_dict()
+        d["Properties"]["BucketName"] = "changed"
+        self.assertEqual(b.BucketName, "test-bucket")
+
+        instance = Instance("I1", ImageId="ami", SecurityGroups=["sg-1"])
+        instance.to_dict()["Properties"]["SecurityGroups"].append("sg-2")
+        self.assertEqual(instance.SecurityGroups, ["sg-1"])
+
+        t = Template(Metadata={"Owner": {"Team": "a"}})
+        t.add_resource(instance)
+        for cache in (False, True):
+            t.set_resource_cache(cache)
+            d = t.to_dict()
+            self.assertIsNot(d["Metadata"], t.metadata)
+            d["Metadata"]["Owner"]["Team"] = "b"
+            d["Resources"]["I1"]["Properties"]["SecurityGroups"].append("sg-2")
+            self.assertEqual(t.metadata, {"Owner": {"Team": "a"}})
+            self.assertEqual(t.to_dict(), t.to_dict())
+            self.assertEqual(
+                t.to_dict()["Resources"]["I1"]["Properties"]["SecurityGroups"],
+                ["sg-1"],
+            )
+
+    def test_shared_subtree(self):
+        tags = Tags(Name="shared")
+        t = Template()
+        for i in range(3):
+            t.add_resource(Bucket("B%d" % i, Tags=tags))
+        # Encoded once, the shared form is only used internally
+        resources = t._encode()["Resources"]
+        self.assertIs(
+            resources["B0"]["Properties"]["Tags"], resources["B2"]["Properties"]["Tags"]
+        )
+
+        resources = t.to_dict()["Resources"]
+        self.assertEqual(
+            resources["B0"]["Properties"]["Tags"], [{"Key": "Name", "Value": "shared"}]
+        )
+        self.assertIsNot(
+            resources["B0"]["Properties"]["Tags"], resources["B2"]["Properties"]["Tags"]
+        )
+        self.assertIsNot(
+            resources["B0"]["Properties"]["Tags"][0],
+            resources["B2"]["Properties"]["Tags"][0],
+        )
+        resources["B0"]["Properties"]["Tags"].append({"Key": "Env", "Value": "prod"})
+        self.assertEqual(len(resources["B2"]["Properties"]["Tags"]), 1)
+
+    def test_shared_subtree_yaml_anchors(self):
+        import yaml
+
+        tags = Tags(Name="shared")
+        t = Template()
+        for i in range(3):
+            t.add_resource(Bucket("B%d" % i, Tags=tags))
+        self.assertNotIn("&id", yaml.safe_dump(t.to_dict()))
+        self.assertNotIn("&id", yaml.safe_dump(encode_to_dict(t.resources)))
+
+    def test_custom_to_dict(self):
+        class Doubled(AWSHelperFn):
+            def __init__(self, data):
+                self.data = data
+
+            def to_dict(self):
+                return [self.data, self.data]
+
+        self.assertEqual(
+            encode_to_dict({"Value": Doubled(Ref("Foo"))}),
+            {"Value": [{"Ref": "Foo"}, {"Ref": "Foo"}]},
+        )
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_submodule_attribute(self):
+        import troposphere
+
+        self.assertIs(troposphere.s3.Bucket, Bucket)
+        self.assertIn("ec2", dir(troposphere))
+        with self.assertRaises(AttributeError):
+            troposphere.nosuchmodule
+
+    def test_import_submodules(self):
+        # What "import troposphere" does before Python 3.7
+        code = """if True:
+            import troposphere
+            troposphere._import_submodules()
+            print(sorted(vars(troposphere)))
+        """
+        names = subprocess.check_output(
+            [sys.executable, "-c", code], universal_newlines=True
+        )
+        for name in ("ec2", "serverless", "openstack", "deploy"):
+            self.assertIn("'%s'" % name, names)
+
+    @unittest.skipIf(
+        sys.version_info < (3, 7), "submodules are imported up front before 3.7"
+    )
+    def test_import_troposphere(self):
+        # Needs a fresh interpreter to see which modules get imported
+        code = """if True:
+            import sys
+            import troposphere
+            t = troposphere.Template()
+            t.add_resource(troposphere.sqs.Queue("Queue"))
+            t.to_json()
+            print(" ".join(sorted(sys.modules)))
+        """
+        modules = subprocess.check_output(
+            [sys.executable, "-c", code], universal_newlines=True
+        ).split()
+        self.assertIn("troposphere.sqs", modules)
+        for name in ("troposphere.ec2", "troposphere.serverless", "cfn_flip", "yaml"):
+            self.assertNotIn(name, modules)
+
+
 if __name__ == "__main__":
     unittest.main()
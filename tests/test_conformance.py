@@ -0,0 +1,245 @@
+"""
+Round-trip conformance of every resource type in troposphere.
+
+For each resource type in troposphere.registry an object is built with a
+minimal set of properties synthesized from the props of its class, then
+rendered with to_dict() and imported again with TemplateGenerator, which
+must give back the same template. The resource types are spread over a
+process pool.
+
+Run this module directly to print how long each step takes per class,
+slowest first, to spot slow constructors and validators:
+
+    python -m tests.test_conformance [count]
+"""
+
+import concurrent.futures
+import importlib
+import inspect
+import sys
+import time
+import types
+import unittest
+
+from troposphere import BaseAWSObject, Ref, Tags, Template, registry
+from troposphere.template_generator import TemplateGenerator
+
+# Values tried in turn for properties validated by a function
+VALIDATOR_SAMPLES = ["1", 1, True, 1.0, "x", {"Key": "Value"}, ["x"]]
+
+SAMPLES = {
+    bool: True,
+    dict: {"Key": "Value"},
+    float: 1.0,
+    int: 1,
+    list: ["x"],
+    str: "x",
+}
+
+# Nested required properties are replaced by a Ref below this depth
+MAX_DEPTH = 8
+
+# Properties added to the synthesized ones where a class validator needs
+# one of several optional properties, or specific values
+PROPERTIES = {
+    "AWS::ACMPCA::Certificate": {
+        "SigningAlgorithm": "SHA256WITHRSA",
+        "Validity": {"Type": "DAYS", "Value": 1},
+    },
+    "AWS::ACMPCA::CertificateAuthority": {
+        "KeyAlgorithm": "RSA_2048",
+        "SigningAlgorithm": "SHA256WITHRSA",
+        "Type": "ROOT",
+    },
+    "AWS::ApiGatewayV2::Model": {"Schema": {"type": "object"}},
+    "AWS::AutoScaling::AutoScalingGroup": {"AvailabilityZones": ["us-east-1a"]},
+    "AWS::Backup::BackupSelection": {
+        "BackupSelection": {
+            "IamRoleArn": "arn",
+            "Resources": ["arn"],
+            "SelectionName": "x",
+        }
+    },
+    "AWS::CloudFormation::WaitCondition": {"Handle": "x", "Timeout": 1},
+    "AWS::CloudWatch::Alarm": {"Statistic": "Average"},
+    "AWS::CloudWatch::Dashboard": {"DashboardBody": {"widgets": []}},
+    "AWS::CodeBuild::Project": {
+        "Artifacts": {"Type": "NO_ARTIFACTS"},
+        "Environment": {
+            "ComputeType": "BUILD_GENERAL1_SMALL",
+            "Image": "x",
+            "Type": "LINUX_CONTAINER",
+        },
+        "Source": {"Type": "NO_SOURCE"},
+    },
+    "AWS::DynamoDB::Table": {"BillingMode": "PAY_PER_REQUEST"},
+    "AWS::EC2::NetworkAclEntry": {"CidrBlock": "10.0.0.0/8"},
+    "AWS::EC2::Route": {"DestinationCidrBlock": "10.0.0.0/8", "GatewayId": "x"},
+    "AWS::EC2::SecurityGroupEgress": {"CidrIp": "10.0.0.0/8", "IpProtocol": "-1"},
+    "AWS::EC2::SecurityGroupIngress": {"CidrIp": "10.0.0.0/8", "IpProtocol": "-1"},
+    "AWS::EC2::SpotFleet": {
+        "SpotFleetRequestConfigData": {
+            "IamFleetRole": "arn",
+            "LaunchSpecifications": [{"ImageId": "ami", "InstanceType": "t3.micro"}],
+            "TargetCapacity": 1,
+        }
+    },
+    "AWS::EC2::VPNConnection": {"VpnGatewayId": "x"},
+    "AWS::ElastiCache::ReplicationGroup": {"NumCacheClusters": 1},
+    "AWS::ElasticLoadBalancingV2::Listener": {
+        "DefaultActions": [{"Type": "forward", "TargetGroupArn": "arn"}]
+    },
+    "AWS::ElasticLoadBalancingV2::ListenerRule": {
+        "Actions": [{"Type": "forward", "TargetGroupArn": "arn"}]
+    },
+    "AWS::ElasticLoadBalancingV2::LoadBalancer": {"Subnets": ["x"]},
+    "AWS::ElasticLoadBalancingV2::TargetGroup": {"TargetType": "lambda"},
+    "AWS::Lambda::Function": {"Code": {"ZipFile": "x"}},
+    "AWS::NetworkFirewall::RuleGroup": {"Type": "STATELESS"},
+    "AWS::RDS::DBInstance": {
+        "Engine": "postgres",
+        "MasterUserPassword": "x",
+        "MasterUsername": "x",
+    },
+    "AWS::Serverless::Function": {"CodeUri": "x"},
+    "AWS::WAF::WebACL": {"DefaultAction": {"Type": "ALLOW"}},
+    "AWS::WAFRegional::WebACL": {"DefaultAction": {"Type": "ALLOW"}},
+}
+
+
+def resource_types():
+    """Returns the CloudFormation resource types in the registry."""
+    return sorted(t for t in registry.RESOURCE_TYPES if "::" in t)
+
+
+def resource_class(resource_type):
+    module_name, class_name = registry.RESOURCE_TYPES[resource_type].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def sample(expected_type, depth):
+    """Returns a value which validates as expected_type."""
+    if isinstance(expected_type, list):
+        return [sample(expected_type[0], depth)]
+    if isinstance(expected_type, tuple):
+        # Prefer building nested objects, then dicts for JSON documents
+        for choice in expected_type:
+            if inspect.isclass(choice) and issubclass(choice, BaseAWSObject):
+                return sample(choice, depth)
+        if dict in expected_type:
+            return sample(dict, depth)
+        return sample(expected_type[0], depth)
+    if isinstance(expected_type, types.FunctionType):
+        for value in VALIDATOR_SAMPLES:
+            try:
+                expected_type(value)
+            except Exception:
+                continue
+            return value
+        return Ref("Value")
+    if expected_type is Tags:
+        return Tags(Key="Value")
+    if inspect.isclass(expected_type) and issubclass(expected_type, BaseAWSObject):
+        if depth >= MAX_DEPTH:
+            return Ref("Value")
+        return build(expected_type, depth=depth + 1)
+    return SAMPLES.get(expected_type, Ref("Value"))
+
+
+def build(cls, title=None, properties=None, depth=0):
+    """Returns an object of cls with its required properties set."""
+    kwargs = {
+        name: sample(expected_type, depth)
+        for name, (expected_type, required) in cls.props.items()
+        if required
+    }
+    if properties:
+        kwargs.update(properties)
+    if title is None:
+        return cls(**kwargs)
+    return cls(title, **kwargs)
+
+
+def round_trip(resource_type):
+    """
+    Returns (resource_type, error, timings) where error is None if the
+    round trip succeeded and timings has the seconds each step took.
+    """
+    timings = {}
+    try:
+        cls = resource_class(resource_type)
+
+        start = time.perf_counter()
+        # Properties given as dicts are built through from_dict()
+        properties = PROPERTIES.get(resource_type, {})
+        properties = cls._from_dict("Resource", **properties).properties
+        resource = build(cls, "Resource", properties)
+        timings["construct"] = time.perf_counter() - start
+
+        template = Template()
+        template.add_resource(resource)
+        start = time.perf_counter()
+        expected = template.to_dict()
+        timings["render"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        generated = TemplateGenerator(expected).to_dict()
+        timings["import"] = time.perf_counter() - start
+
+        if generated != expected:
+            return resource_type, "%r != %r" % (generated, expected), timings
+    except Exception as ex:
+        return resource_type, "%s: %s" % (type(ex).__name__, ex), timings
+    return resource_type, None, timings
+
+
+def round_trip_all():
+    """Returns the round_trip() results of all resource types."""
+    names = resource_types()
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        return list(executor.map(round_trip, names, chunksize=32))
+
+
+class TestConformance(unittest.TestCase):
+    def test_round_trip(self):
+        results = round_trip_all()
+        self.assertGreater(len(results), 500)
+        for resource_type, error, timings in results:
+            with self.subTest(resource_type=resource_type):
+                self.assertIsNone(error)
+
+    def test_sample(self):
+        from troposphere.serverless import Application, ApplicationLocation
+
+        self.assertEqual(sample([str], 0), ["x"])
+        self.assertIsInstance(
+            sample(Application.props["Location"][0], 0), ApplicationLocation
+        )
+        self.assertEqual(sample((str, dict), 0), {"Key": "Value"})
+        self.assertEqual(sample(lambda x: x, 0), "1")
+        self.assertIsInstance(sample(object, 0), Ref)
+
+
+def report(count):
+    """Prints the timings of the count slowest resource types."""
+    results = round_trip_all()
+    failed = [(t, error) for t, error, _ in results if error]
+    results.sort(key=lambda result: sum(result[2].values()), reverse=True)
+    print("%-60s %10s %10s %10s" % ("", "construct", "render", "import"))
+    for resource_type, _, timings in results[:count]:
+        print(
+            "%-60s %10s %10s %10s"
+            % (
+                resource_type,
+                *(
+                    "%.1f us" % (timings[step] * 1e6) if step in timings else "-"
+                    for step in ("construct", "render", "import")
+                ),
+            )
+        )
+    for resource_type, error in failed:
+        print("%s failed: %s" % (resource_type, error))
+
+
+if __name__ == "__main__":
+    report(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
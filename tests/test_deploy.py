@@ -0,0 +1,451 @@
+import argparse
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from troposphere import Parameter, Template, deploy
+from troposphere.deploy import (
+    CREATED,
+    FAILED,
+    FINGERPRINT_TAG,
+    NO_CHANGES,
+    PENDING,
+    UNCHANGED,
+    UPDATED,
+    Deployer,
+    Stack,
+    deployed_fingerprint,
+    load_template,
+    parse_stack,
+)
+from troposphere.s3 import Bucket
+from troposphere.sqs import Queue
+
+
+class StubClientError(Exception):
+    """An error with the response of a botocore ClientError."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+class StubS3:
+    """In-memory S3 client."""
+
+    class meta:
+        endpoint_url = "http://localhost:4566"
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects["%s/%s/%s" % (self.meta.endpoint_url, Bucket, Key)] = Body
+
+
+class StubCloudFormation:
+    """
+    In-memory CloudFormation client with the change set calls, applying
+    executed change sets at once. Stacks named in fail roll back.
+    """
+
+    def __init__(self, s3=None):
+        self.s3 = s3
+        self.stacks = {}
+        self.change_sets = {}
+        self.calls = []
+        self.fail = set()
+        self.lock = threading.Lock()
+
+    def _call(self, name):
+        with self.lock:
+            self.calls.append(name)
+
+    def _stack(self, name):
+        if name not in self.stacks:
+            raise StubClientError(
+                "ValidationError", "Stack with id %s does not exist" % name
+            )
+        return self.stacks[name]
+
+    def describe_stacks(self, StackName):
+        self._call("describe_stacks")
+        stack = self._stack(StackName)
+        description = {k: v for k, v in stack.items() if k != "TemplateBody"}
+        # The values of NoEcho parameters are masked
+        declared = deploy._load_body(stack["TemplateBody"]).get("Parameters", {})
+        description["Parameters"] = [
+            dict(p, ParameterValue="****")
+            if deploy._is_no_echo(declared.get(p["ParameterKey"], {}))
+            else p
+            for p in stack["Parameters"]
+        ]
+        return {"Stacks": [description]}
+
+    def get_template(self, StackName, TemplateStage):
+        self._call("get_template")
+        body = self._stack(StackName)["TemplateBody"]
+        try:
+            # boto3 returns JSON bodies decoded
+            return {"TemplateBody": json.loads(body)}
+        except ValueError:
+            return {"TemplateBody": body}
+
+    def create_change_set(self, **kwargs):
+        self._call("create_change_set")
+        name = kwargs["StackName"]
+        if "TemplateURL" in kwargs:
+            body = self.s3.objects[kwargs["TemplateURL"]].decode("utf-8")
+        else:
+            body = kwargs["TemplateBody"]
+        data = deploy._load_body(body)
+        parameters = {
+            k: deploy._parameter_value(v["Default"])
+            for k, v in data.get("Parameters", {}).items()
+            if "Default" in v
+        }
+        for p in kwargs["Parameters"]:
+            parameters[p["ParameterKey"]] = p["ParameterValue"]
+        new = {
+            "StackName": name,
+            "TemplateBody": body,
+            "Parameters": [
+                {"ParameterKey": k, "ParameterValue": v} for k, v in parameters.items()
+            ],
+            "Tags": kwargs["Tags"],
+        }
+        if kwargs["ChangeSetType"] == "CREATE":
+            self.stacks[name] = dict(new, StackStatus="REVIEW_IN_PROGRESS")
+            changed = True
+        else:
+            old = self._stack(name)
+            changed = any(old[k] != new[k] for k in new)
+        change_set = {"Status": "CREATE_COMPLETE", "New": new}
+        if not changed:
+            change_set = {
+                "Status": "FAILED",
+                "StatusReason": "The submitted information didn't contain changes.",
+            }
+        self.change_sets[(name, kwargs["ChangeSetName"])] = change_set
+
+    def describe_change_set(self, StackName, ChangeSetName):
+        self._call("describe_change_set")
+        return self.change_sets[(StackName, ChangeSetName)]
+
+    def delete_change_set(self, StackName, ChangeSetName):
+        self._call("delete_change_set")
+        del self.change_sets[(StackName, ChangeSetName)]
+
+    def execute_change_set(self, StackName, ChangeSetName):
+        self._call("execute_change_set")
+        change_set = self.change_sets.pop((StackName, ChangeSetName))
+        stack = self.stacks[StackName]
+        create = stack["StackStatus"] == "REVIEW_IN_PROGRESS"
+        if StackName in self.fail:
+            stack["StackStatus"] = (
+                "ROLLBACK_COMPLETE" if create else "UPDATE_ROLLBACK_COMPLETE"
+            )
+            stack["StackStatusReason"] = "Resource creation failed"
+            return
+        stack.update(change_set["New"])
+        stack["StackStatus"] = "CREATE_COMPLETE" if create else "UPDATE_COMPLETE"
+
+
+def queue_template(queues=1, description=None):
+    t = Template(Description=description)
+    for i in range(queues):
+        t.add_resource(Queue("Queue%d" % i))
+    return t
+
+
+class TestDeploy(unittest.TestCase):
+    def setUp(self):
+        self.s3 = StubS3()
+        self.cfn = {}
+        self.factory_calls = []
+
+    def client_factory(self, service, region):
+        self.factory_calls.append((service, region))
+        if service == "s3":
+            return self.s3
+        return self.cfn.setdefault(region, StubCloudFormation(self.s3))
+
+    def deployer(self, **kwargs):
+        kwargs.setdefault("poll_interval", 0)
+        return Deployer(client_factory=self.client_factory, **kwargs)
+
+    def deploy(self, stack, **kwargs):
+        (result,) = self.deployer(**kwargs).deploy([stack])
+        return result
+
+    def test_create_and_unchanged(self):
+        result = self.deploy(Stack("web", queue_template()))
+        self.assertEqual(result.status, CREATED)
+        self.assertIsNone(result.reason)
+        stack = self.cfn["us-east-1"].stacks["web"]
+        self.assertEqual(stack["StackStatus"], "CREATE_COMPLETE")
+        self.assertEqual(json.loads(stack["TemplateBody"]), queue_template().to_dict())
+
+        calls = self.cfn["us-east-1"].calls
+        del calls[:]
+        result = self.deploy(Stack("web", queue_template()))
+        self.assertEqual(result.status, UNCHANGED)
+        self.assertEqual(calls, ["describe_stacks", "get_template"])
+
+    def test_update(self):
+        self.deploy(Stack("web", queue_template(1)))
+        result = self.deploy(Stack("web", queue_template(2)))
+        self.assertEqual(result.status, UPDATED)
+        self.assertEqual(
+            json.loads(self.cfn["us-east-1"].stacks["web"]["TemplateBody"]),
+            queue_template(2).to_dict(),
+        )
+        # tags and parameters are part of the fingerprint
+        result = self.deploy(Stack("web", queue_template(2), tags={"team": "a"}))
+        self.assertEqual(result.status, UPDATED)
+        result = self.deploy(Stack("web", queue_template(2), tags={"team": "a"}))
+        self.assertEqual(result.status, UNCHANGED)
+
+    def test_force(self):
+        self.deploy(Stack("web", queue_template()))
+        result = self.deploy(Stack("web", queue_template()), force=True)
+        self.assertEqual(result.status, NO_CHANGES)
+        self.assertIsNone(result.change_set)
+        self.assertEqual(self.cfn["us-east-1"].change_sets, {})
+
+    def test_parameter_defaults(self):
+        t = queue_template()
+        t.add_parameter(Parameter("Size", Type="Number", Default=3))
+        t.add_parameter(Parameter("Name", Type="String"))
+        stack = Stack("web", t, parameters={"Name": "x"})
+        self.assertEqual(stack.parameter_values(), {"Size": "3", "Name": "x"})
+        self.assertEqual(self.deploy(stack).status, CREATED)
+        stack = Stack("web", t, parameters={"Name": "x"})
+        self.assertEqual(self.deploy(stack).status, UNCHANGED)
+        stack = Stack("web", t, parameters={"Name": "x", "Size": 4})
+        self.assertEqual(self.deploy(stack).status, UPDATED)
+
+    def test_no_echo_parameter(self):
+        t = queue_template()
+        t.add_parameter(Parameter("Password", Type="String", NoEcho=True))
+        t.add_parameter(Parameter("Name", Type="String"))
+        parameters = {"Password": "secret", "Name": "x"}
+        self.assertEqual(
+            self.deploy(Stack("web", t, parameters=parameters)).status, CREATED
+        )
+        description = self.cfn["us-east-1"].describe_stacks(StackName="web")
+        self.assertIn(
+            {"ParameterKey": "Password", "ParameterValue": "****"},
+            description["Stacks"][0]["Parameters"],
+        )
+        stack = Stack("web", t, parameters=parameters)
+        self.assertEqual(self.deploy(stack).status, UNCHANGED)
+        # Other parameters are still compared
+        stack = Stack("web", t, parameters={"Password": "secret", "Name": "y"})
+        self.assertEqual(self.deploy(stack).status, UPDATED)
+        # A new value only is seen from the recorded fingerprint
+        stack = Stack("web", t, parameters={"Password": "other", "Name": "y"})
+        self.assertEqual(self.deploy(stack).status, UPDATED)
+        deployed = self.cfn["us-east-1"].stacks["web"]
+        self.assertIn(
+            {"ParameterKey": "Password", "ParameterValue": "other"},
+            deployed["Parameters"],
+        )
+        self.assertNotIn("other", str(deployed["Tags"]))
+        self.assertEqual(self.deploy(stack).status, UNCHANGED)
+
+    def test_fingerprint_tag(self):
+        stack = Stack("web", queue_template(), tags={"team": "a"})
+        self.deploy(stack)
+        deployed = self.cfn["us-east-1"].stacks["web"]
+        self.assertEqual(
+            deployed["Tags"],
+            [
+                {"Key": "team", "Value": "a"},
+                {"Key": FINGERPRINT_TAG, "Value": stack.fingerprint()},
+            ],
+        )
+
+        # Stacks without the tag, e.g. deployed otherwise, are deployed
+        deployed["Tags"] = [{"Key": "team", "Value": "a"}]
+        stack = Stack("web", queue_template(), tags={"team": "a"})
+        self.assertEqual(self.deploy(stack).status, UPDATED)
+        self.assertEqual(self.deploy(stack).status, UNCHANGED)
+
+        # So are stacks changed outside of troposphere
+        deployed["TemplateBody"] = queue_template(2).to_json()
+        self.assertEqual(self.deploy(stack).status, UPDATED)
+        self.assertEqual(
+            json.loads(deployed["TemplateBody"]), queue_template().to_dict()
+        )
+
+    def test_no_execute(self):
+        result = self.deploy(Stack("web", queue_template()), execute=False)
+        self.assertEqual(result.status, PENDING)
+        self.assertIsNotNone(result.change_set)
+        stacks = self.cfn["us-east-1"].stacks
+        self.assertEqual(stacks["web"]["StackStatus"], "REVIEW_IN_PROGRESS")
+        # a stack only reviewed is created
+        self.assertEqual(self.deploy(Stack("web", queue_template())).status, CREATED)
+
+    def test_rollback(self):
+        self.client_factory("cloudformation", "us-east-1").fail.add("web")
+        result = self.deploy(Stack("web", queue_template()))
+        self.assertEqual(result.status, FAILED)
+        self.assertEqual(result.reason, "Resource creation failed")
+        result = self.deploy(Stack("web", queue_template()))
+        self.assertEqual(result.status, FAILED)
+        self.assertEqual(result.reason, "stack is ROLLBACK_COMPLETE")
+
+    def test_upload(self):
+        large = queue_template(1, description="x" * deploy.MAX_TEMPLATE_BODY_SIZE)
+        result = self.deploy(Stack("web", large))
+        self.assertEqual(result.status, FAILED)
+        self.assertIn("a bucket is needed", result.reason)
+        self.assertEqual(self.s3.objects, {})
+
+        result = self.deploy(Stack("web", large), bucket="templates", prefix="cfn/")
+        self.assertEqual(result.status, CREATED)
+        (url,) = self.s3.objects
+        self.assertEqual(
+            url,
+            "http://localhost:4566/templates/cfn/web-%s.json" % result.fingerprint[:16],
+        )
+
+        # small templates are passed inline
+        self.s3.objects.clear()
+        result = self.deploy(Stack("web", queue_template()), bucket="templates")
+        self.assertEqual(result.status, UPDATED)
+        self.assertEqual(self.s3.objects, {})
+
+    def test_concurrent(self):
+        regions = ["us-east-1", "eu-west-1"]
+        stacks = [
+            Stack("stack%d" % i, queue_template(i + 1), regions[i % 2])
+            for i in range(10)
+        ]
+        results = self.deployer(jobs=4).deploy(stacks)
+        self.assertEqual([r.stack for r in results], stacks)
+        self.assertEqual({r.status for r in results}, {CREATED})
+        self.assertEqual(sorted(self.cfn), sorted(regions))
+        self.assertEqual(len(self.cfn["eu-west-1"].stacks), 5)
+        # one client per service and region
+        self.assertEqual(
+            sorted(self.factory_calls), sorted(("cloudformation", r) for r in regions)
+        )
+
+    def test_yaml(self):
+        body = "Resources:\n  Topic:\n    Type: AWS::SNS::Topic\n"
+        body += "Outputs:\n  Arn:\n    Value: !Ref Topic\n"
+        self.assertEqual(self.deploy(Stack("web", body)).status, CREATED)
+        self.assertEqual(self.deploy(Stack("web", body)).status, UNCHANGED)
+
+    def test_deployed_fingerprint(self):
+        t = queue_template()
+        description = {
+            "Parameters": [],
+            "Tags": [{"Key": "team", "Value": "a"}],
+        }
+        stack = Stack("web", t, tags={"team": "a"})
+        self.assertEqual(
+            deployed_fingerprint(description, t.to_json()), stack.fingerprint()
+        )
+        self.assertEqual(
+            deployed_fingerprint(description, t.to_dict()), stack.fingerprint()
+        )
+        self.assertNotEqual(deployed_fingerprint({}, t.to_json()), stack.fingerprint())
+        # The recorded fingerprint is not part of it
+        description["Tags"].append({"Key": FINGERPRINT_TAG, "Value": "x"})
+        self.assertEqual(
+            deployed_fingerprint(description, t.to_dict()), stack.fingerprint()
+        )
+
+
+def make_template():
+    t = Template()
+    t.add_resource(Bucket("Bucket"))
+    return t
+
+
+template = make_template()
+
+
+class TestCommandLine(unittest.TestCase):
+    def test_load_template(self):
+        self.assertIs(load_template("tests.test_deploy:template"), template)
+        self.assertEqual(load_template("tests.test_deploy:make_template"), template)
+        with self.assertRaises(TypeError):
+            load_template("tests.test_deploy:TestCommandLine")
+        with self.assertRaises(ValueError):
+            load_template("tests.test_deploy")
+
+        with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+            f.write("from troposphere import Template\n")
+            f.write("template = Template(Description='from file')\n")
+        try:
+            loaded = load_template(f.name + ":template")
+            self.assertEqual(loaded.description, "from file")
+        finally:
+            os.unlink(f.name)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            f.write(template.to_json())
+        try:
+            self.assertEqual(load_template(f.name), template.to_json())
+        finally:
+            os.unlink(f.name)
+
+    def test_parse_stack(self):
+        stack = parse_stack("web=tests.test_deploy:template", "eu-west-1")
+        self.assertEqual((stack.name, stack.region), ("web", "eu-west-1"))
+        stack = parse_stack("web@us-west-2=tests.test_deploy:template")
+        self.assertEqual((stack.name, stack.region), ("web", "us-west-2"))
+        with self.assertRaises(ValueError):
+            parse_stack("tests.test_deploy:template")
+
+    def test_run(self):
+        parser = argparse.ArgumentParser()
+        deploy.add_arguments(parser)
+        args = parser.parse_args(
+            [
+                "web=tests.test_deploy:template",
+                "db@eu-west-1=tests.test_deploy:make_template",
+                "-p",
+                "Env=prod",
+                "-t",
+                "team=a",
+                "-r",
+                "us-east-1",
+                "--poll-interval",
+                "0",
+                "--quiet",
+            ]
+        )
+        cfn = StubCloudFormation()
+        out = io.StringIO()
+        self.assertEqual(deploy.run(args, lambda s, r: cfn, out), 0)
+        self.assertEqual(sorted(cfn.stacks), ["db", "web"])
+        self.assertEqual(
+            cfn.stacks["web"]["Parameters"],
+            [{"ParameterKey": "Env", "ParameterValue": "prod"}],
+        )
+        lines = out.getvalue().splitlines()
+        self.assertEqual(
+            [line.split() for line in lines],
+            [
+                ["web@us-east-1", "created"],
+                ["db@eu-west-1", "created"],
+            ],
+        )
+
+        cfn.fail.add("web")
+        args.force = True
+        args.tags = ["team=b"]
+        self.assertEqual(deploy.run(args, lambda s, r: cfn, io.StringIO()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import json
+import unittest
+from unittest import mock
+
+from troposphere import Output, Parameter, Ref, Tags, Template
+from troposphere.diff import ABSENT, Change, diff_templates, diff_values
+from troposphere.s3 import Bucket
+from troposphere.sqs import Queue, RedrivePolicy
+from troposphere.template_generator import TemplateGenerator
+
+
+def template(name="bucket", receive_count=1, tags=None):
+    t = Template()
+    t.add_parameter(Parameter("Env", Type="String"))
+    t.add_mapping("Region", {"us-east-1": {"Ami": "ami-1"}})
+    t.add_condition("Always", {"Fn::Equals": ["a", "a"]})
+    t.add_resource(Bucket("Bucket", BucketName=name, Tags=Tags(tags or {"a": "1"})))
+    t.add_resource(
+        Queue("Queue", RedrivePolicy=RedrivePolicy(maxReceiveCount=receive_count))
+    )
+    t.add_output(Output("BucketName", Value=Ref("Bucket")))
+    return t
+
+
+class TestDiffValues(unittest.TestCase):
+    def test_values(self):
+        old = {"a": 1, "b": [1, 2, {"c": "x"}], "d": {"e": 1}}
+        new = {"a": 2, "b": [1, 3, {"c": "y"}, 4], "f": None}
+        self.assertEqual(
+            diff_values(old, new),
+            [
+                Change("a", 1, 2),
+                Change("b[1]", 2, 3),
+                Change("b[2].c", "x", "y"),
+                Change("b[3]", ABSENT, 4),
+                Change("d", {"e": 1}, ABSENT),
+                Change("f", ABSENT, None),
+            ],
+        )
+        self.assertEqual(diff_values(old, old), [])
+        self.assertEqual(diff_values(1, "1", "Value"), [Change("Value", 1, "1")])
+
+
+class TestDiffTemplates(unittest.TestCase):
+    def test_same(self):
+        diff = diff_templates(template(), template())
+        self.assertFalse(diff)
+        for section in diff.sections.values():
+            self.assertFalse(section)
+
+    def test_modified(self):
+        old = template()
+        new = template(name="other", receive_count=5, tags={"a": "1", "b": "2"})
+        diff = diff_templates(old, new)
+        self.assertTrue(diff)
+        self.assertEqual(diff.resources.added, [])
+        self.assertEqual(diff.resources.removed, [])
+        self.assertEqual(
+            diff.resources.modified,
+            {
+                "Bucket": [
+                    Change("Properties.BucketName", "bucket", "other"),
+                    Change("Properties.Tags[1]", ABSENT, {"Key": "b", "Value": "2"}),
+                ],
+                "Queue": [
+                    Change("Properties.RedrivePolicy.maxReceiveCount", 1, 5),
+                ],
+            },
+        )
+        self.assertFalse(diff.parameters)
+        self.assertFalse(diff.outputs)
+
+    def test_added_and_removed(self):
+        old = template()
+        new = template()
+        del new.resources["Queue"]
+        new.add_resource(Queue("NewQueue"))
+        new.add_parameter(Parameter("Size", Type="Number"))
+        new.outputs.clear()
+        new.add_mapping("Region", {"us-west-2": {"Ami": "ami-2"}})
+        new.conditions["Always"] = {"Fn::Equals": ["a", "b"]}
+        diff = diff_templates(old, new)
+        self.assertEqual(diff.resources.added, ["NewQueue"])
+        self.assertEqual(diff.resources.removed, ["Queue"])
+        self.assertEqual(diff.resources.modified, {})
+        self.assertEqual(diff.parameters.added, ["Size"])
+        self.assertEqual(diff.outputs.removed, ["BucketName"])
+        self.assertEqual(
+            diff.mappings.modified,
+            {"Region": [Change("us-west-2", ABSENT, {"Ami": "ami-2"})]},
+        )
+        self.assertEqual(
+            diff.conditions.modified,
+            {"Always": [Change("Fn::Equals[1]", "a", "b")]},
+        )
+
+    def test_fingerprints_skip_unchanged(self):
+        old = template()
+        new = template(name="other")
+        old.set_resource_cache()
+        new.set_resource_cache()
+        diff_templates(old, new)
+        # Unchanged resources are not encoded again
+        cached = new.resources["Queue"]._encoded
+        self.assertEqual(set(diff_templates(old, new).resources.modified), {"Bucket"})
+        self.assertIs(new.resources["Queue"]._encoded, cached)
+
+    def test_no_fingerprints_without_cache(self):
+        old = template()
+        new = template(name="other")
+        with mock.patch.object(
+            Template, "resource_fingerprints", side_effect=AssertionError
+        ):
+            diff = diff_templates(old, new)
+            self.assertEqual(set(diff.resources.modified), {"Bucket"})
+            # one of the templates without the cache
+            new.set_resource_cache()
+            diff = diff_templates(old, new)
+            self.assertEqual(set(diff.resources.modified), {"Bucket"})
+
+    def test_dicts(self):
+        old = template()
+        new = template(name="other")
+        old_dict = json.loads(old.to_json())
+        generated = TemplateGenerator(json.loads(new.to_json()))
+        expected = {"Bucket": [Change("Properties.BucketName", "bucket", "other")]}
+        for a, b in (
+            (old_dict, new),
+            (old, json.loads(new.to_json())),
+            (old_dict, json.loads(new.to_json())),
+            (old, generated),
+            (old_dict, generated),
+        ):
+            diff = diff_templates(a, b)
+            self.assertEqual(diff.resources.modified, expected)
+            self.assertFalse(diff.parameters)
+            self.assertFalse(diff.mappings)
+        self.assertFalse(diff_templates(old_dict, old))
+
+
+if __name__ == "__main__":
+    unittest.main()
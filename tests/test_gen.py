@@ -0,0 +1,159 @@
+import ast
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SPEC = {
+    "ResourceSpecificationVersion": "1.0.0",
+    "PropertyTypes": {
+        "AWS::Example::Thing.Setting": {
+            "Properties": {
+                "Enabled": {"PrimitiveType": "Boolean", "Required": False},
+            }
+        },
+    },
+    "ResourceTypes": {
+        "AWS::Example::Thing": {
+            "Properties": {
+                "Name": {"PrimitiveType": "String", "Required": True},
+                "Setting": {"Type": "Setting", "Required": False},
+            }
+        },
+        "AWS::Other::Widget": {
+            "Properties": {
+                "Size": {"PrimitiveType": "Integer", "Required": False},
+            }
+        },
+        "AWS::Manual::Gadget": {
+            "Properties": {
+                "Name": {"PrimitiveType": "String", "Required": False},
+            }
+        },
+    },
+}
+
+
+class TestIncrementalGen(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.output_dir = os.path.join(self.directory, "out")
+        self.patch_dir = os.path.join(self.directory, "patches")
+        os.mkdir(self.output_dir)
+        os.mkdir(self.patch_dir)
+        # A hand maintained module is never overwritten
+        with open(os.path.join(self.output_dir, "manual.py"), "w") as f:
+            f.write("# hand written\n")
+
+    def gen(self, spec, *args):
+        path = os.path.join(self.directory, "spec.json")
+        with open(path, "w") as f:
+            json.dump(spec, f)
+        process = subprocess.run(
+            [sys.executable, "scripts/gen.py", "--patch-dir", self.patch_dir]
+            + list(args)
+            + [path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        return process.stdout, process.stderr
+
+    def read(self, name):
+        with open(os.path.join(self.output_dir, name)) as f:
+            return f.read()
+
+    def incremental(self, spec):
+        return self.gen(
+            spec, "--output-dir", self.output_dir, "--incremental", "--jobs", "2"
+        )[1]
+
+    def test_incremental(self):
+        self.assertIn(
+            "2 generated, 0 version updated, 0 unchanged, 1 skipped",
+            self.incremental(SPEC),
+        )
+        self.assertEqual(self.read("manual.py"), "# hand written\n")
+        # Same output as writing a single module to stdout
+        stdout, _ = self.gen(SPEC, "--name", "example")
+        self.assertEqual(self.read("example.py"), stdout)
+        self.assertIn("class Setting(AWSProperty):", stdout)
+
+        self.assertIn(
+            "0 generated, 0 version updated, 2 unchanged", self.incremental(SPEC)
+        )
+
+        spec = copy.deepcopy(SPEC)
+        spec["ResourceSpecificationVersion"] = "2.0.0"
+        self.assertIn(
+            "0 generated, 2 version updated, 0 unchanged", self.incremental(spec)
+        )
+        self.assertIn("# Resource specification version: 2.0.0", self.read("other.py"))
+
+        properties = spec["PropertyTypes"]["AWS::Example::Thing.Setting"]
+        properties["Properties"]["Level"] = {
+            "PrimitiveType": "Integer",
+            "Required": False,
+        }
+        self.assertIn(
+            "1 generated, 0 version updated, 1 unchanged", self.incremental(spec)
+        )
+        self.assertIn('"Level": (integer, False),', self.read("example.py"))
+
+        # A patch of the service
+        with open(os.path.join(self.patch_dir, "Other.json"), "w") as f:
+            json.dump(
+                [
+                    {
+                        "op": "add",
+                        "path": "/ResourceTypes/AWS::Other::Widget/Properties/Name",
+                        "value": {"PrimitiveType": "String", "Required": True},
+                    }
+                ],
+                f,
+            )
+        self.assertIn(
+            "1 generated, 0 version updated, 1 unchanged", self.incremental(spec)
+        )
+        self.assertIn('"Name": (str, True),', self.read("other.py"))
+
+    def test_deleted_module(self):
+        self.incremental(SPEC)
+        os.remove(os.path.join(self.output_dir, "other.py"))
+        self.assertIn(
+            "1 generated, 0 version updated, 1 unchanged", self.incremental(SPEC)
+        )
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, "other.py")))
+
+    def test_stub(self):
+        self.gen(SPEC, "--output-dir", self.output_dir, "--stub")
+        stub = self.read("example.pyi")
+        ast.parse(stub)
+        self.assertIn("from . import AWSHelperFn, AWSObject", stub)
+        self.assertIn(
+            "class Thing(AWSObject):\n"
+            "    resource_type: str\n"
+            "\n"
+            "    def __init__(\n"
+            "        self,\n"
+            "        title: str,\n"
+            "        template: Optional[Template] = ...,\n"
+            "        validation: bool = ...,\n"
+            "        *,\n"
+            "        Name: Union[str, AWSHelperFn] = ...,\n"
+            "        Setting: Union[Setting, AWSHelperFn] = ...,\n"
+            "    ) -> None: ...\n",
+            stub,
+        )
+        self.assertIn("    Enabled: Union[bool, AWSHelperFn]\n", stub)
+        ast.parse(self.read("other.pyi"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import sys
+import unittest
+
+from troposphere import (
+    GetAtt,
+    If,
+    Join,
+    Parameter,
+    Ref,
+    Sub,
+    Tags,
+    Template,
+)
+from troposphere.ec2 import Instance, SecurityGroup
+from troposphere.graph import CycleError, DependencyGraph
+from troposphere.iam import Policy, Role
+from troposphere.s3 import Bucket
+from troposphere.sqs import Queue
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def template(self):
+        t = Template()
+        t.add_parameter(Parameter("Env", Type="String"))
+        bucket = t.add_resource(Bucket("Bucket", BucketName=Ref("Env")))
+        queue = t.add_resource(Queue("Queue", DependsOn=bucket))
+        t.add_resource(
+            Role(
+                "Role",
+                AssumeRolePolicyDocument={},
+                Policies=[
+                    Policy(
+                        PolicyName=Sub("${AWS::StackName}-${Env}"),
+                        PolicyDocument={
+                            "Resource": [
+                                GetAtt(bucket, "Arn"),
+                                Sub("${Queue.Arn}/${!Literal}"),
+                            ]
+                        },
+                    )
+                ],
+                Tags=Tags(Name=Join("-", [Ref(queue), "role"])),
+            )
+        )
+        return t
+
+    def test_references(self):
+        graph = self.template().dependency_graph()
+        self.assertEqual(graph.references("Bucket"), {"Env": ["Ref"]})
+        self.assertEqual(graph.references("Queue"), {"Bucket": ["DependsOn"]})
+        self.assertEqual(
+            graph.references("Role"),
+            {"Env": ["Sub"], "Bucket": ["GetAtt"], "Queue": ["Ref", "Sub"]},
+        )
+        self.assertEqual(graph.dependencies("Role"), ["Bucket", "Queue"])
+        self.assertEqual(graph.dependencies("Bucket"), [])
+
+    def test_dependents(self):
+        graph = self.template().dependency_graph()
+        self.assertEqual(sorted(graph.dependents("Bucket")), ["Queue", "Role"])
+        self.assertEqual(graph.dependents("Env"), ["Bucket", "Role"])
+        self.assertEqual(graph.dependents("Role"), [])
+
+    def test_sub_variables(self):
+        t = Template()
+        t.add_resource(Bucket("Bucket"))
+        t.add_resource(
+            Queue(
+                "Queue",
+                QueueName=Sub("${Name}-${Other}", Name=Ref("Bucket"), Other="literal"),
+            )
+        )
+        self.assertEqual(t.dependency_graph().references("Queue"), {"Bucket": ["Ref"]})
+
+    def test_topological_order(self):
+        t = self.template()
+        t.add_resource(Bucket("Logs"))
+        graph = t.dependency_graph()
+        self.assertEqual(graph.topological_order(), ["Bucket", "Queue", "Role", "Logs"])
+        self.assertIsNone(graph.find_cycle())
+
+    def test_cycle(self):
+        t = Template()
+        t.add_resource(Bucket("A", DependsOn="B"))
+        t.add_resource(Bucket("B", BucketName=If("Cond", Ref("C"), "b")))
+        t.add_resource(Queue("C", QueueName=GetAtt("A", "Arn")))
+        graph = t.dependency_graph()
+        self.assertEqual(graph.find_cycle(), ["A", "B", "C", "A"])
+        with self.assertRaises(CycleError) as cm:
+            graph.topological_order()
+        self.assertEqual(cm.exception.path, ["A", "B", "C", "A"])
+        self.assertIn("A -> B -> C -> A", str(cm.exception))
+        self.assertIsInstance(cm.exception, ValueError)
+
+    def test_self_reference(self):
+        t = Template()
+        t.add_resource(Bucket("A", BucketName=Ref("A")))
+        self.assertEqual(t.dependency_graph().find_cycle(), ["A", "A"])
+
+    def test_dangling(self):
+        t = self.template()
+        t.add_resource(
+            Instance(
+                "Instance",
+                DependsOn=["Env", "Missing"],
+                ImageId=Ref("AWS::NoValue"),
+                SubnetId=Ref("Subnet"),
+                SecurityGroups=[GetAtt("Env", "Value")],
+            )
+        )
+        self.assertEqual(
+            t.dependency_graph().dangling(),
+            [
+                ("Instance", "Env"),
+                ("Instance", "Missing"),
+                ("Instance", "Subnet"),
+            ],
+        )
+        self.assertEqual(self.template().dependency_graph().dangling(), [])
+
+    def test_incremental(self):
+        t = self.template()
+        graph = t.dependency_graph()
+        self.assertEqual(len(graph), 3)
+        t.add_resource(SecurityGroup("SG", GroupDescription=Ref("Queue")))
+        self.assertIs(t.dependency_graph(), graph)
+        self.assertIn("SG", graph)
+        self.assertEqual(sorted(graph.dependents("Queue")), ["Role", "SG"])
+
+        # Changes made directly to Template.resources are picked up
+        del t.resources["Role"]
+        t.resources["Other"] = Bucket("Other", BucketName=Ref("Bucket"))
+        graph = t.dependency_graph()
+        self.assertNotIn("Role", graph)
+        self.assertEqual(graph.dependents("Queue"), ["SG"])
+        self.assertEqual(graph.dependents("Bucket"), ["Queue", "Other"])
+
+        # Changes to a resource which was already scanned are picked up
+        t.resources["Other"].BucketName = "other"
+        self.assertEqual(graph.dependents("Bucket"), ["Queue"])
+
+        # Changes made in place to plain data need a rebuild
+        t.resources["Other"].properties["BucketName"] = Ref("Bucket")
+        self.assertEqual(graph.dependents("Bucket"), ["Queue"])
+        graph = t.dependency_graph(rebuild=True)
+        self.assertEqual(graph.dependents("Bucket"), ["Queue", "Other"])
+
+    def test_changed_resources(self):
+        t = Template()
+        t.add_resource(Bucket("A", DependsOn="B"))
+        t.add_resource(Bucket("B", BucketName=If("Cond", Ref("C"), "b")))
+        c = t.add_resource(Queue("C", QueueName=GetAtt("A", "Arn")))
+        graph = t.dependency_graph()
+        self.assertEqual(graph.find_cycle(), ["A", "B", "C", "A"])
+        c.QueueName = "literal"
+        self.assertIsNone(graph.find_cycle())
+        self.assertEqual(t.dependency_graph().topological_order(), ["C", "B", "A"])
+
+        # Changes to objects nested in a resource too
+        t = self.template()
+        graph = t.dependency_graph()
+        self.assertEqual(graph.dependencies("Role"), ["Bucket", "Queue"])
+        policy = t.resources["Role"].Policies[0]
+        policy.PolicyDocument = {}
+        self.assertEqual(graph.dependencies("Role"), ["Queue"])
+
+    def test_unvalidated(self):
+        # The graph is built without validating the resources
+        t = Template()
+        t.add_resource(Role("Role", Path=Ref("Path")))
+        self.assertEqual(t.dependency_graph().references("Role"), {"Path": ["Ref"]})
+
+    def test_long_chain(self):
+        # Deeper than the recursion limit, ordered without recursing
+        n = sys.getrecursionlimit() * 2
+        resources = {}
+        for i in range(n):
+            # each queue depends on the next one in the template
+            queue = Queue("Queue%d" % i)
+            if i < n - 1:
+                queue.DependsOn = "Queue%d" % (i + 1)
+            resources[queue.title] = queue
+        order = DependencyGraph(resources).topological_order()
+        self.assertEqual(order, list(reversed(list(resources))))
+
+
+if __name__ == "__main__":
+    unittest.main()
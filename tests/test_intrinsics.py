@@ -0,0 +1,200 @@
+import unittest
+
+from troposphere import (
+    And,
+    Base64,
+    Condition,
+    Equals,
+    FindInMap,
+    GetAtt,
+    GetAZs,
+    If,
+    Join,
+    Not,
+    NoValue,
+    Or,
+    Output,
+    Parameter,
+    Ref,
+    Select,
+    Split,
+    Sub,
+    Tags,
+    Template,
+)
+from troposphere.intrinsics import NO_VALUE, UnresolvedError, evaluate
+from troposphere.s3 import Bucket
+from troposphere.sqs import Queue, RedrivePolicy
+
+PARAMETERS = {"Env": "prod", "AWS::Region": "us-east-1", "Zones": ["a", "b"]}
+MAPPINGS = {"Region": {"us-east-1": {"Ami": "ami-1", "Sizes": ["s", "m"]}}}
+CONDITIONS = {
+    "IsProd": Equals(Ref("Env"), "prod"),
+    "IsDev": Not(Condition("IsProd")),
+    "Either": Or(Condition("IsProd"), Condition("IsDev")),
+    "Both": And(Condition("IsProd"), Condition("IsDev")),
+    "Unknown": Equals(Ref("Other"), "x"),
+    "Loop": Not(Condition("Loop")),
+}
+
+
+class TestEvaluate(unittest.TestCase):
+    def evaluate(self, value):
+        return evaluate(value, PARAMETERS, MAPPINGS, CONDITIONS)
+
+    def test_functions(self):
+        for value, expected in (
+            (Ref("Env"), "prod"),
+            (NoValue, NO_VALUE),
+            (Join("-", [Ref("Env"), "app", 1]), "prod-app-1"),
+            (Join(",", Ref("Zones")), "a,b"),
+            (Sub("${Env}-${AWS::Region}-${!Literal}"), "prod-us-east-1-${Literal}"),
+            (Sub("${Env}-${Name}", Name=Ref("AWS::Region")), "prod-us-east-1"),
+            (Select(1, Ref("Zones")), "b"),
+            (Select("0", Split(",", "x,y")), "x"),
+            (FindInMap("Region", Ref("AWS::Region"), "Ami"), "ami-1"),
+            (FindInMap("Region", "us-east-1", "Sizes"), ["s", "m"]),
+            (Base64(Join("", ["a", "b"])), "YWI="),
+            (If("IsProd", "big", "small"), "big"),
+            (If("IsDev", "big", NoValue), NO_VALUE),
+            (Condition("Either"), True),
+            (Condition("Both"), False),
+            (Equals([1, Ref("Env")], [1, "prod"]), True),
+            ({"Key": [Ref("Env"), If("IsDev", 1, NoValue)]}, {"Key": ["prod"]}),
+            (Tags(Env=Ref("Env")), [{"Key": "Env", "Value": "prod"}]),
+            (
+                RedrivePolicy(maxReceiveCount=Select(0, [3])),
+                {"maxReceiveCount": 3},
+            ),
+        ):
+            self.assertEqual(self.evaluate(value), expected, value)
+
+    def test_unresolved(self):
+        for value in (
+            Ref("Other"),
+            Ref("Bucket"),
+            GetAtt("Bucket", "Arn"),
+            GetAZs(""),
+            Sub("${Bucket.Arn}"),
+            Join("-", ["a", GetAtt("Bucket", "Arn")]),
+            Select(5, Ref("Zones")),
+            FindInMap("Region", "eu-west-1", "Ami"),
+            If("Unknown", 1, 2),
+            If("Missing", 1, 2),
+            If("Loop", 1, 2),
+            # The unknown condition is not skipped
+            Or(Condition("IsProd"), Condition("Unknown")),
+        ):
+            with self.assertRaises(UnresolvedError):
+                self.evaluate(value)
+
+    def test_policy_condition(self):
+        statement = {"Condition": {"StringEquals": {"aws:SourceAccount": "1"}}}
+        self.assertEqual(self.evaluate(statement), statement)
+
+
+class TestFoldConstants(unittest.TestCase):
+    def template(self):
+        t = Template()
+        t.add_parameter(Parameter("Env", Type="String", Default="dev"))
+        t.add_parameter(Parameter("Zones", Type="CommaDelimitedList", Default="a,b"))
+        t.add_mapping("Region", MAPPINGS["Region"])
+        t.add_condition("IsProd", Equals(Ref("Env"), "prod"))
+        t.add_condition("IsDev", Not(Condition("IsProd")))
+        t.add_condition("Unknown", Equals(GetAZs(""), "x"))
+        t.add_condition("Unused", Condition("IsProd"))
+        t.add_resource(
+            Bucket(
+                "Bucket",
+                Condition="IsDev",
+                BucketName=Join("-", [Ref("Env"), Select(1, Ref("Zones"))]),
+                Tags=Tags(
+                    Name=Sub("${Env}-${AWS::StackName}"),
+                    Size=If("IsProd", "big", "small"),
+                ),
+            )
+        )
+        t.add_resource(
+            Queue(
+                "Queue",
+                QueueName=If("Unknown", Ref("Env"), NoValue),
+                DelaySeconds=If("IsProd", 10, NoValue),
+                RedrivePolicy=RedrivePolicy(
+                    deadLetterTargetArn=GetAtt("Bucket", "Arn"),
+                    maxReceiveCount=FindInMap("Region", "us-east-1", "Ami"),
+                ),
+            )
+        )
+        t.add_output(Output("Name", Value=Join("", [Ref("Bucket"), Ref("Env")])))
+        return t
+
+    def test_fold(self):
+        t = self.template()
+        removed = t.fold_constants(use_defaults=True)
+        self.assertEqual(sorted(removed), ["IsDev", "IsProd", "Unused"])
+        self.assertEqual(list(t.conditions), ["Unknown"])
+        data = t.to_dict()
+        self.assertEqual(
+            data["Resources"]["Bucket"],
+            {
+                "Type": "AWS::S3::Bucket",
+                "Properties": {
+                    "BucketName": "dev-b",
+                    "Tags": [
+                        {"Key": "Name", "Value": {"Fn::Sub": "dev-${AWS::StackName}"}},
+                        {"Key": "Size", "Value": "small"},
+                    ],
+                },
+            },
+        )
+        self.assertEqual(
+            data["Resources"]["Queue"]["Properties"],
+            {
+                "QueueName": {"Fn::If": ["Unknown", "dev", {"Ref": "AWS::NoValue"}]},
+                "RedrivePolicy": {
+                    "deadLetterTargetArn": {"Fn::GetAtt": ["Bucket", "Arn"]},
+                    "maxReceiveCount": "ami-1",
+                },
+            },
+        )
+        self.assertEqual(
+            data["Outputs"]["Name"]["Value"],
+            {"Fn::Join": ["", [{"Ref": "Bucket"}, "dev"]]},
+        )
+
+    def test_parameters(self):
+        t = self.template()
+        t.fold_constants({"Env": "prod"})
+        data = t.to_dict()
+        bucket = data["Resources"]["Bucket"]
+        # The condition is now known to be false and kept with the resource
+        self.assertEqual(bucket["Condition"], "IsDev")
+        self.assertEqual(
+            bucket["Properties"]["BucketName"],
+            {"Fn::Join": ["-", ["prod", {"Fn::Select": [1, {"Ref": "Zones"}]}]]},
+        )
+        self.assertEqual(data["Resources"]["Queue"]["Properties"]["DelaySeconds"], 10)
+        self.assertEqual(sorted(t.conditions), ["IsDev", "IsProd", "Unknown"])
+
+    def test_nothing_known(self):
+        t = self.template()
+        before = t.to_dict()
+        self.assertEqual(t.fold_constants(), ["Unused"])
+        del before["Conditions"]["Unused"]
+        # Only the FindInMap with literal keys is known
+        queue = before["Resources"]["Queue"]["Properties"]
+        queue["RedrivePolicy"]["maxReceiveCount"] = "ami-1"
+        self.assertEqual(t.to_dict(), before)
+
+    def test_resource_cache(self):
+        t = self.template()
+        t.set_resource_cache()
+        t.to_dict()
+        t.fold_constants(use_defaults=True)
+        self.assertEqual(
+            t.to_dict()["Resources"]["Bucket"]["Properties"]["BucketName"], "dev-b"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
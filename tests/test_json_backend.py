@@ -0,0 +1,138 @@
+import json
+import os
+import unittest
+from unittest import mock
+
+from troposphere import Template, json_backend
+from troposphere.s3 import Bucket
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .test_json_writer import example_templates
+
+# The formatting of Template.to_json() and to_json(minify=True)
+PRETTY = {"indent": 4, "sort_keys": True, "separators": (",", ": ")}
+MINIFIED = {"sort_keys": True, "separators": (",", ":"), "ensure_ascii": False}
+
+
+class TestBackendSelection(unittest.TestCase):
+    def tearDown(self):
+        json_backend.set_backend(None)
+
+    def test_default(self):
+        json_backend.set_backend(None)
+        expected = "orjson" if orjson is not None else "json"
+        self.assertEqual(json_backend.get_backend().name, expected)
+
+    def test_fallback(self):
+        # orjson is not installed
+        with mock.patch.dict("sys.modules", {"orjson": None}):
+            json_backend.set_backend(None)
+            self.assertIsInstance(
+                json_backend.get_backend(), json_backend.StdlibBackend
+            )
+            with self.assertRaises(ImportError):
+                json_backend.set_backend("orjson")
+
+    def test_custom(self):
+        calls = []
+
+        class Backend(json_backend.StdlibBackend):
+            def dumps(self, obj, *args):
+                calls.append(args)
+                return super().dumps(obj, *args)
+
+        t = Template()
+        t.add_resource(Bucket("Bucket"))
+        expected = t.to_json()
+        json_backend.set_backend(Backend())
+        self.assertEqual(t.to_json(), expected)
+        self.assertEqual(calls, [(4, True, (",", ": "), True)])
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonBackend(unittest.TestCase):
+    def setUp(self):
+        self.backend = json_backend.OrjsonBackend()
+
+    def assertSame(self, data, **kwargs):
+        self.assertEqual(self.backend.dumps(data, **kwargs), json.dumps(data, **kwargs))
+
+    def test_examples_output(self):
+        for filename in sorted(os.listdir("tests/examples_output")):
+            with open(os.path.join("tests/examples_output", filename)) as f:
+                expected = f.read()
+            if not expected:
+                continue
+            with self.subTest(filename=filename):
+                data = json.loads(expected)
+                self.assertEqual(self.backend.dumps(data, **PRETTY) + "\n", expected)
+                self.assertSame(data, **MINIFIED)
+
+    def test_examples(self):
+        json_backend.set_backend("orjson")
+        try:
+            for name, template, expected in example_templates():
+                with self.subTest(example=name):
+                    self.assertEqual(template.to_json() + "\n", expected)
+        finally:
+            json_backend.set_backend(None)
+
+    def test_formatting(self):
+        data = {
+            "b": [1, -2, True, False, None, "café   \x7f \U0001d11e", [], {}],
+            "a": {"nested": {"x": '\x00\x1f"\\/\t\n'}, "empty": "", "  ": "  lead"},
+            "c": (1, ("tuple",)),
+        }
+        for kwargs in (
+            PRETTY,
+            MINIFIED,
+            {"indent": 0},
+            {"indent": 2, "ensure_ascii": False},
+            {"indent": "\t"},
+            {},
+            {"separators": (",", ":")},
+            {"indent": 4, "separators": (", ", ": ")},
+        ):
+            with self.subTest(**kwargs):
+                self.assertSame(data, **kwargs)
+
+    def test_floats(self):
+        for value in (0.5, -0.0, 100.0, 1e15, 1e16, 1e-4, 1e-5, 2.5e-7, 1.5e300):
+            with self.subTest(value=value):
+                self.assertSame({"x": [value]}, **PRETTY)
+                self.assertSame({"x": [value]}, **MINIFIED)
+        self.assertSame({"x": "1e16 0.00001"}, **PRETTY)
+
+    def test_non_finite_floats(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.subTest(value=value):
+                self.assertSame({"x": [value, None]}, **PRETTY)
+                self.assertSame({"x": value}, **MINIFIED)
+                self.assertSame([value])
+
+    def test_fallback(self):
+        deep = "leaf"
+        # orjson is limited to 255 levels
+        for _ in range(300):
+            deep = [deep]
+        for i, data in enumerate(
+            [
+                {1: "int key", "a": "b"},
+                {"big": 2**64},
+                {"surrogate": "\ud800"},
+                deep,
+            ]
+        ):
+            with self.subTest(i=i):
+                self.assertSame(data, indent=4)
+                self.assertSame(data, separators=(",", ":"))
+        with self.assertRaises(TypeError):
+            self.backend.dumps({"foo": object()}, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import contextlib
+import io
+import json
+import os
+import unittest
+
+from troposphere import Join, Ref, Tags, Template, json_writer
+from troposphere.ec2 import NetworkInterface
+from troposphere.s3 import Bucket
+
+
+def example_templates():
+    """Yields (name, template, expected output) for the examples."""
+    for filename in sorted(os.listdir("examples")):
+        if not filename.endswith(".py"):
+            continue
+        name = filename[:-3]
+        with open("tests/examples_output/%s.template" % name) as f:
+            expected = f.read()
+        namespace = {"__name__": "__main__"}
+        with open(os.path.join("examples", filename)) as f:
+            code = compile(f.read(), filename, "exec")
+        with contextlib.redirect_stdout(io.StringIO()):
+            exec(code, namespace)
+        for value in namespace.values():
+            if isinstance(value, Template):
+                yield name, value, expected
+
+
+class TestJSONWriter(unittest.TestCase):
+    def dump(self, obj, **kwargs):
+        fp = io.StringIO()
+        json_writer.dump(obj, fp, **kwargs)
+        return fp.getvalue()
+
+    def test_formatting(self):
+        data = {
+            "b": [1, 2.5, True, False, None, "café", [], {}],
+            "a": {"nested": {"x": float("inf")}},
+            1: "int key",
+        }
+        for kwargs in (
+            {},
+            {"indent": 4, "separators": (",", ": ")},
+            {"indent": "\t"},
+            {"indent": 0},
+            {"separators": (",", ":")},
+            {"ensure_ascii": False},
+        ):
+            self.assertEqual(self.dump(data, **kwargs), json.dumps(data, **kwargs))
+        del data[1]
+        self.assertEqual(
+            self.dump(data, sort_keys=True), json.dumps(data, sort_keys=True)
+        )
+
+    def test_scalars(self):
+        for value in ("foo", 1, 1.5, None, True, [], {}):
+            self.assertEqual(self.dump(value), json.dumps(value))
+
+    def test_objects(self):
+        data = {"Value": Join("", ["a", Ref("B")]), "Tags": Tags(Name="foo")}
+        self.assertEqual(
+            self.dump(data, indent=4, sort_keys=True),
+            json.dumps(
+                {
+                    "Value": {"Fn::Join": ["", ["a", {"Ref": "B"}]]},
+                    "Tags": [{"Key": "Name", "Value": "foo"}],
+                },
+                indent=4,
+                sort_keys=True,
+            ),
+        )
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            self.dump({"foo": object()})
+
+    def test_deep_nesting(self):
+        data = "leaf"
+        for _ in range(5000):
+            data = [data]
+        out = self.dump(data)
+        self.assertEqual(out, "[" * 5000 + '"leaf"' + "]" * 5000)
+
+    def test_write_json(self):
+        t = Template()
+        t.add_resource(Bucket("Bucket", BucketName="foo", Tags=Tags(Name="foo")))
+        fp = io.StringIO()
+        t.write_json(fp)
+        self.assertEqual(fp.getvalue(), t.to_json())
+        fp = io.StringIO()
+        t.write_json(fp, indent=None, separators=(",", ":"))
+        self.assertEqual(fp.getvalue(), t.to_json(indent=None, separators=(",", ":")))
+
+    def test_write_json_validation(self):
+        t = Template()
+        t.add_resource(NetworkInterface("networkinterface"))
+        with self.assertRaises(ValueError):
+            t.write_json(io.StringIO())
+
+    def test_examples(self):
+        for name, template, expected in example_templates():
+            with self.subTest(example=name):
+                fp = io.StringIO()
+                template.write_json(fp)
+                self.assertEqual(fp.getvalue() + "\n", expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
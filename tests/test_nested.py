@@ -0,0 +1,274 @@
+import json
+import unittest
+
+from troposphere import (
+    AWS_NO_VALUE,
+    Equals,
+    GetAtt,
+    If,
+    Output,
+    Parameter,
+    Ref,
+    Sub,
+    Tags,
+    Template,
+)
+from troposphere.nested import split_template
+from troposphere.s3 import Bucket
+from troposphere.serverless import (
+    SERVERLESS_TRANSFORM,
+    Function,
+    FunctionGlobals,
+    Globals,
+)
+from troposphere.sns import Topic
+from troposphere.sqs import Queue, RedrivePolicy
+
+URL = "https://bucket.s3.amazonaws.com/{name}.json"
+
+
+class TestSplitTemplate(unittest.TestCase):
+    def chain_template(self, n):
+        """Queues each referencing the previous one"""
+        t = Template()
+        t.add_parameter(Parameter("Env", Type="String"))
+        for i in range(n):
+            queue = Queue("Queue%d" % i, QueueName=Sub("${Env}-%d" % i))
+            if i:
+                queue.RedrivePolicy = RedrivePolicy(
+                    deadLetterTargetArn=GetAtt("Queue%d" % (i - 1), "Arn")
+                )
+                queue.DependsOn = "Queue%d" % (i - 1)
+            t.resources[queue.title] = queue
+        return t
+
+    def test_max_resources(self):
+        t = self.chain_template(1200)
+        before = t.to_json()
+        parent, children = split_template(t, URL)
+        self.assertEqual(t.to_json(), before)
+        self.assertEqual(list(children), ["Nested1", "Nested2", "Nested3"])
+        self.assertEqual([len(c.resources) for c in children.values()], [500, 500, 200])
+
+        # The chain is cut once between each child
+        child = children["Nested2"].to_dict()
+        first = child["Resources"]["Queue500"]
+        self.assertNotIn("DependsOn", first)
+        self.assertEqual(
+            first["Properties"]["RedrivePolicy"],
+            {"deadLetterTargetArn": {"Ref": "Queue499Arn"}},
+        )
+        self.assertEqual(
+            child["Parameters"],
+            {"Env": {"Type": "String"}, "Queue499Arn": {"Type": "String"}},
+        )
+        self.assertEqual(
+            child["Resources"]["Queue501"]["Properties"]["RedrivePolicy"],
+            {"deadLetterTargetArn": {"Fn::GetAtt": ["Queue500", "Arn"]}},
+        )
+        self.assertEqual(
+            child["Outputs"],
+            {"Queue999Arn": {"Value": {"Fn::GetAtt": ["Queue999", "Arn"]}}},
+        )
+        self.assertEqual(
+            children["Nested1"].to_dict()["Outputs"],
+            {"Queue499Arn": {"Value": {"Fn::GetAtt": ["Queue499", "Arn"]}}},
+        )
+
+        stack = parent.to_dict()["Resources"]["Nested2"]
+        self.assertEqual(
+            stack,
+            {
+                "Type": "AWS::CloudFormation::Stack",
+                "DependsOn": ["Nested1"],
+                "Properties": {
+                    "TemplateURL": "https://bucket.s3.amazonaws.com/Nested2.json",
+                    "Parameters": {
+                        "Env": {"Ref": "Env"},
+                        "Queue499Arn": {
+                            "Fn::GetAtt": ["Nested1", "Outputs.Queue499Arn"]
+                        },
+                    },
+                },
+            },
+        )
+        self.assertEqual(parent.to_dict()["Parameters"], {"Env": {"Type": "String"}})
+
+    def test_groups_kept_together(self):
+        t = Template()
+        for i in range(30):
+            topic = Topic("Topic%d" % i)
+            t.resources[topic.title] = topic
+            queue = Queue("Queue%d" % i, QueueName=Ref(topic))
+            t.resources[queue.title] = queue
+        parent, children = split_template(t, URL, max_resources=7)
+        for child in children.values():
+            self.assertEqual(len(child.resources), 6)
+            self.assertEqual(child.parameters, {})
+            self.assertEqual(child.outputs, {})
+
+    def test_max_size(self):
+        t = Template()
+        for i in range(100):
+            t.add_resource(
+                Queue("Queue%d" % i, QueueName="queue-%d-%s" % (i, "x" * 500))
+            )
+        parent, children = split_template(t, lambda name: name, max_size=10000)
+        self.assertGreater(len(children), 5)
+        for name, child in children.items():
+            self.assertLessEqual(len(child.to_json()), 10000)
+            self.assertEqual(parent.resources[name].TemplateURL, name)
+        with self.assertRaises(ValueError):
+            split_template(t, URL, max_size=100)
+
+    def test_references(self):
+        t = Template()
+        t.add_resource(Bucket("Bucket"))
+        t.add_resource(
+            Queue(
+                "Queue",
+                QueueName=Sub("${AWS::StackName}-${Bucket}-${Bucket.Arn}-${!Bucket}"),
+                Tags=Tags(Bucket=Ref("Bucket")),
+            )
+        )
+        t.add_output(Output("BucketArn", Value=GetAtt("Bucket", "Arn")))
+        t.add_output(Output("Name", Value=Sub("${Queue}/${AWS::Region}")))
+        parent, children = split_template(t, URL, max_resources=1)
+        self.assertEqual(list(children["Nested1"].resources), ["Bucket"])
+        queue = children["Nested2"].to_dict()["Resources"]["Queue"]["Properties"]
+        self.assertEqual(
+            queue["QueueName"],
+            {"Fn::Sub": "${ParentStackName}-${Bucket}-${BucketArn}-${!Bucket}"},
+        )
+        self.assertEqual(queue["Tags"], [{"Key": "Bucket", "Value": {"Ref": "Bucket"}}])
+        self.assertEqual(
+            parent.to_dict()["Resources"]["Nested2"]["Properties"]["Parameters"],
+            {
+                "Bucket": {"Fn::GetAtt": ["Nested1", "Outputs.Bucket"]},
+                "BucketArn": {"Fn::GetAtt": ["Nested1", "Outputs.BucketArn"]},
+                "ParentStackName": {"Ref": "AWS::StackName"},
+            },
+        )
+        self.assertEqual(
+            parent.to_dict()["Outputs"],
+            {
+                "BucketArn": {
+                    "Value": {"Fn::GetAtt": ["Nested1", "Outputs.BucketArn"]}
+                },
+                "Name": {
+                    "Value": {"Fn::Sub": "${Nested2.Outputs.Queue}/${AWS::Region}"}
+                },
+            },
+        )
+        self.assertEqual(sorted(children["Nested2"].outputs), ["Queue"])
+        # The original template is unchanged
+        self.assertEqual(
+            json.loads(t.to_json())["Outputs"]["BucketArn"],
+            {"Value": {"Fn::GetAtt": ["Bucket", "Arn"]}},
+        )
+
+    def test_conditional_resources(self):
+        t = Template()
+        t.add_parameter(Parameter("Env", Type="String"))
+        t.add_condition("IsProd", Equals(Ref("Env"), "prod"))
+        t.add_resource(Queue("Dlq", Condition="IsProd"))
+        t.add_resource(
+            Queue(
+                "Main",
+                RedrivePolicy=If(
+                    "IsProd",
+                    RedrivePolicy(deadLetterTargetArn=GetAtt("Dlq", "Arn")),
+                    Ref(AWS_NO_VALUE),
+                ),
+            )
+        )
+        parent, children = split_template(t, URL, max_resources=1)
+        self.assertEqual(list(children["Nested1"].resources), ["Dlq"])
+        self.assertEqual(
+            children["Nested1"].to_dict()["Outputs"],
+            {
+                "DlqArn": {
+                    "Condition": "IsProd",
+                    "Value": {"Fn::GetAtt": ["Dlq", "Arn"]},
+                }
+            },
+        )
+        self.assertEqual(
+            parent.to_dict()["Resources"]["Nested2"]["Properties"]["Parameters"],
+            {
+                "DlqArn": {
+                    "Fn::If": [
+                        "IsProd",
+                        {"Fn::GetAtt": ["Nested1", "Outputs.DlqArn"]},
+                        "",
+                    ]
+                },
+                "Env": {"Ref": "Env"},
+            },
+        )
+        self.assertIn("IsProd", parent.conditions)
+
+    def test_list_parameters(self):
+        t = Template()
+        t.add_parameter(Parameter("Subnets", Type="List<AWS::EC2::Subnet::Id>"))
+        t.add_parameter(
+            Parameter("Ami", Type="AWS::SSM::Parameter::Value<AWS::EC2::Image::Id>")
+        )
+        t.add_resource(Queue("Queue", QueueName=Sub("${Ami}"), Tags=Ref("Subnets")))
+        parent, children = split_template(t, URL)
+        self.assertEqual(
+            parent.to_dict()["Resources"]["Nested1"]["Properties"]["Parameters"],
+            {
+                "Ami": {"Ref": "Ami"},
+                "Subnets": {"Fn::Join": [",", {"Ref": "Subnets"}]},
+            },
+        )
+        self.assertEqual(
+            children["Nested1"].to_dict()["Parameters"],
+            {
+                "Ami": {"Type": "String"},
+                "Subnets": {"Type": "List<AWS::EC2::Subnet::Id>"},
+            },
+        )
+
+    def test_source_not_shared(self):
+        t = self.chain_template(600)
+        t.add_mapping("Map", {"k": {"v": "1"}})
+        t.add_condition("IsProd", Equals(Ref("Env"), "prod"))
+        t.set_metadata({"Owner": "a"})
+        before = t.to_json()
+        parent, children = split_template(t, URL)
+        parent.add_parameter(Parameter("Extra", Type="String"))
+        parent.add_condition("Extra", Equals(Ref("Extra"), "x"))
+        parent.add_mapping("Extra", {"k": {"v": "2"}})
+        parent.metadata["Extra"] = "x"
+        children["Nested1"].add_mapping("Child", {"k": {"v": "3"}})
+        self.assertEqual(t.to_json(), before)
+        self.assertNotIn("Child", children["Nested2"].mappings)
+
+    def test_serverless(self):
+        t = Template()
+        t.set_transform(SERVERLESS_TRANSFORM)
+        t.set_globals(Globals(Function=FunctionGlobals(Runtime="python3.9")))
+        t.add_resource(
+            Function(
+                "Function", Handler="index.handler", Runtime="python3.9", CodeUri="."
+            )
+        )
+        for i in range(2):
+            t.add_resource(Queue("Queue%d" % i))
+        parent, children = split_template(t, URL, max_resources=1)
+        self.assertEqual(len(children), 3)
+        self.assertEqual(parent.to_dict()["Transform"], SERVERLESS_TRANSFORM)
+        for child in children.values():
+            d = child.to_dict()
+            self.assertEqual(d["Transform"], SERVERLESS_TRANSFORM)
+            if "Function" in d["Resources"]:
+                self.assertEqual(d["Globals"], {"Function": {"Runtime": "python3.9"}})
+            else:
+                self.assertNotIn("Globals", d)
+        self.assertIsNot(parent.globals, t.globals)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import importlib
+import types
+import unittest
+
+from troposphere import BaseAWSObject, ClassMeta, registry
+
+
+def defined_classes():
+    """Yields the classes with props of all troposphere modules."""
+    for module_name in registry.MODULES:
+        module = importlib.import_module(module_name)
+        for name, cls in sorted(vars(module).items()):
+            if (
+                isinstance(cls, type)
+                and issubclass(cls, BaseAWSObject)
+                and cls.__module__ == module_name
+                and isinstance(getattr(cls, "props", None), dict)
+            ):
+                yield cls
+
+
+def valid_type(expected_type):
+    """Whether expected_type is a type, validator, or list or tuple of them."""
+    if isinstance(expected_type, (type, types.FunctionType)):
+        return True
+    if isinstance(expected_type, (list, tuple)):
+        return len(expected_type) > 0 and all(map(valid_type, expected_type))
+    return False
+
+
+class TestProps(unittest.TestCase):
+    """Checks the props of every class and the ClassMeta derived from them."""
+
+    def test_props(self):
+        for cls in defined_classes():
+            for name, prop in cls.props.items():
+                with self.subTest(cls=cls, prop=name):
+                    self.assertIsInstance(prop, tuple)
+                    self.assertEqual(len(prop), 2)
+                    expected_type, required = prop
+                    self.assertTrue(valid_type(expected_type), expected_type)
+                    self.assertIsInstance(required, bool)
+
+    def test_class_meta(self):
+        for cls in defined_classes():
+            with self.subTest(cls=cls):
+                meta = ClassMeta(cls)
+                self.assertEqual(meta.propnames, frozenset(cls.props))
+                self.assertEqual(
+                    meta.required,
+                    tuple(name for name, prop in cls.props.items() if prop[1]),
+                )
+                self.assertEqual(
+                    meta.resource_type, getattr(cls, "resource_type", None)
+                )
+                for name in cls.props:
+                    self.assertIsNotNone(meta.setter(name))
+                self.assertIsNone(meta.setter("NotAProperty"))
+
+    def test_resource_types(self):
+        for resource_type, path in registry.RESOURCE_TYPES.items():
+            module_name, class_name = path.split(":")
+            cls = getattr(importlib.import_module(module_name), class_name)
+            self.assertEqual(cls.resource_type, resource_type)
+
+
+if __name__ == "__main__":
+    unittest.main()
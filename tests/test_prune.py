@@ -0,0 +1,124 @@
+import sys
+import unittest
+
+from troposphere import (
+    Condition,
+    Equals,
+    FindInMap,
+    If,
+    Not,
+    Output,
+    Parameter,
+    Ref,
+    Sub,
+    Template,
+)
+from troposphere.s3 import Bucket
+from troposphere.sqs import Queue
+
+
+class TestPrune(unittest.TestCase):
+    def template(self):
+        t = Template()
+        for name in ("Env", "Name", "Size", "Unused", "RuleParam", "Region"):
+            t.add_parameter(Parameter(name, Type="String"))
+        t.add_mapping("Sizes", {"prod": {"Size": "10"}})
+        t.add_mapping("Amis", {"prod": {"Ami": "ami-1"}})
+        t.add_mapping("Unused", {"prod": {"Ami": "ami-1"}})
+        t.add_condition("IsProd", Equals(Ref("Env"), "prod"))
+        t.add_condition("IsDev", Not(Condition("IsProd")))
+        t.add_condition(
+            "IsBig", Equals(FindInMap("Amis", Ref("Region"), "Ami"), "ami-1")
+        )
+        t.add_condition("Never", Equals("a", "b"))
+        t.add_condition("Unused", Equals(Ref("Unused"), "x"))
+        t.add_rule("Rule", {"Assertions": [{"Assert": Ref("RuleParam")}]})
+        t.add_resource(
+            Bucket(
+                "Bucket",
+                Condition="IsDev",
+                BucketName=Sub("${Name}-${AWS::Region}-${!Unused}"),
+            )
+        )
+        t.add_resource(
+            Queue(
+                "Queue",
+                DependsOn=["Bucket", "Old"],
+                DelaySeconds=If(
+                    "IsBig", FindInMap("Sizes", "prod", "Size"), Ref("Size")
+                ),
+            )
+        )
+        t.add_resource(Queue("Old", Condition="Never"))
+        t.add_output(Output("Old", Condition="Never", Value=Ref("Old")))
+        t.add_output(Output("Bucket", Value=Ref("Bucket")))
+        return t
+
+    def test_prune(self):
+        t = self.template()
+        removed = t.prune()
+        self.assertEqual(
+            removed,
+            {
+                "Resources": [],
+                "Outputs": [],
+                "Parameters": ["Unused"],
+                "Mappings": ["Unused"],
+                "Conditions": ["Unused"],
+            },
+        )
+        self.assertEqual(
+            list(t.parameters), ["Env", "Name", "Size", "RuleParam", "Region"]
+        )
+        self.assertEqual(list(t.conditions), ["IsProd", "IsDev", "IsBig", "Never"])
+        self.assertEqual(t.prune(), {k: [] for k in removed})
+
+    def test_remove_resources(self):
+        t = self.template()
+        removed = t.prune(remove_resources=True)
+        self.assertEqual(removed["Resources"], ["Old"])
+        self.assertEqual(removed["Outputs"], ["Old"])
+        self.assertEqual(removed["Conditions"], ["Never", "Unused"])
+        self.assertEqual(t.resources["Queue"].DependsOn, ["Bucket"])
+        self.assertEqual(list(t.dependency_graph().dependencies("Queue")), ["Bucket"])
+
+    def test_parameters(self):
+        t = self.template()
+        removed = t.prune(remove_resources=True, parameters={"Env": "prod"})
+        self.assertEqual(removed["Resources"], ["Bucket", "Old"])
+        self.assertEqual(removed["Outputs"], ["Old"])
+        # IsProd was only used by IsDev
+        self.assertEqual(removed["Parameters"], ["Env", "Name", "Unused"])
+        self.assertEqual(removed["Conditions"], ["IsProd", "IsDev", "Never", "Unused"])
+        self.assertNotIn("DependsOn", t.to_dict()["Resources"]["Queue"])
+
+    def test_dynamic_mapping(self):
+        t = Template()
+        t.add_parameter(Parameter("Map", Type="String"))
+        t.add_mapping("A", {"k": {"v": "1"}})
+        t.add_mapping("B", {"k": {"v": "1"}})
+        t.add_resource(Queue("Queue", QueueName=FindInMap(Ref("Map"), "k", "v")))
+        self.assertEqual(t.prune()["Mappings"], [])
+        self.assertEqual(list(t.mappings), ["A", "B"])
+
+    def test_deep_conditions(self):
+        # Chains of conditions deeper than the recursion limit
+        n = sys.getrecursionlimit() * 2
+        t = Template()
+        t.add_parameter(Parameter("Env", Type="String"))
+        for chain in ("Used", "Unused"):
+            t.add_condition("%s0" % chain, Equals(Ref("Env"), "prod"))
+            for i in range(1, n):
+                t.add_condition(
+                    "%s%d" % (chain, i), Not(Condition("%s%d" % (chain, i - 1)))
+                )
+        t.add_resource(Queue("Queue", Condition="Used%d" % (n - 1)))
+        removed = t.prune()
+        self.assertEqual(
+            sorted(removed["Conditions"]), sorted("Unused%d" % i for i in range(n))
+        )
+        self.assertEqual(len(t.conditions), n)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import io
+import json
+import unittest
+
+from troposphere import MAX_TEMPLATE_BODY_SIZE, Join, Output, Parameter, Ref, Template
+from troposphere.s3 import Bucket
+from troposphere.size import Size
+from troposphere.sqs import Queue
+
+
+def template(n=3):
+    t = Template(Description="Size report é")
+    t.add_parameter(Parameter("Env", Type="String"))
+    for i in range(n):
+        t.add_resource(Queue("Queue%d" % i, QueueName=Join("-", [Ref("Env"), "q" * i])))
+    t.add_resource(Bucket("Bucket"))
+    t.add_output(Output("Name", Value=Ref("Queue0")))
+    return t
+
+
+class TestMinify(unittest.TestCase):
+    def test_to_json(self):
+        t = template()
+        minified = t.to_json(minify=True)
+        self.assertNotIn(" ", minified.replace("Size report ", ""))
+        self.assertIn("é", minified)
+        self.assertEqual(json.loads(minified), json.loads(t.to_json()))
+        self.assertEqual(
+            minified,
+            json.dumps(
+                t.to_dict(), separators=(",", ":"), sort_keys=True, ensure_ascii=False
+            ),
+        )
+
+        fp = io.StringIO()
+        t.write_json(fp, minify=True)
+        self.assertEqual(fp.getvalue(), minified)
+
+    def test_to_yaml(self):
+        t = template()
+        t.add_output(Output("Long", Value=" ".join(["x"] * 100)))
+        yaml = t.to_yaml(long_form=True, minify=True)
+        self.assertIn("!Join", yaml)
+        self.assertIn("Value: " + "x " * 99 + "x\n", yaml)
+        self.assertLess(len(yaml), len(t.to_yaml(long_form=True)))
+
+
+class TestSizeReport(unittest.TestCase):
+    def test_totals(self):
+        t = template()
+        report = t.size_report()
+        self.assertEqual(report.pretty, len(t.to_json()))
+        self.assertEqual(report.minified, len(t.to_json(minify=True).encode("utf-8")))
+        self.assertTrue(report.fits_inline)
+
+    def test_entries(self):
+        t = template()
+        report = t.size_report()
+        self.assertEqual(
+            list(report.sections),
+            ["Description", "Outputs", "Parameters", "Resources"],
+        )
+        self.assertEqual(
+            report.sections["Description"],
+            Size(
+                len('"Description":"Size report é"') + 1,
+                len('"Description": "Size report \\u00e9"'),
+            ),
+        )
+        self.assertEqual(
+            report.resources["Bucket"],
+            Size(
+                len('"Bucket":{"Type":"AWS::S3::Bucket"}'),
+                len('"Bucket": {\n            "Type": "AWS::S3::Bucket"\n        }'),
+            ),
+        )
+        self.assertEqual(
+            [title for title, size in report.largest(2)], ["Queue2", "Queue1"]
+        )
+        self.assertEqual(len(report.largest()), 4)
+
+    def test_over_limit(self):
+        t = template()
+        t.add_output(Output("Large", Value="x" * MAX_TEMPLATE_BODY_SIZE))
+        report = t.size_report()
+        self.assertFalse(report.fits_inline)
+        self.assertEqual(report.minified, len(t.to_json(minify=True).encode("utf-8")))
+
+    def test_empty(self):
+        report = Template().size_report()
+        self.assertEqual(report.pretty, len(Template().to_json()))
+        self.assertEqual(report.resources, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,13 @@
+import copy
+import gc
+import io
+import json
+import pickle
 import unittest
+import weakref
+from unittest import mock
 
+import troposphere
 from troposphere import (
     MAX_MAPPINGS,
     MAX_OUTPUTS,
@@ -7,10 +15,13 @@ from troposphere import (
     MAX_RESOURCES,
     Output,
     Parameter,
+    Tags,
     Template,
 )
+from troposphere.ec2 import NetworkInterface, SecurityGroup, SecurityGroupRule
 from troposphere.s3 import Bucket
 from troposphere.serverless import Globals
+from troposphere.sqs import Queue, RedrivePolicy
 
 
 class TestInitArguments(unittest.TestCase):
@@ -125,6 +136,77 @@ class TestEquality(unittest.TestCase):
 
         self.assertEqual(len(set([t1, t2])), 1)
 
+    def test_fingerprint(self):
+        def template(**properties):
+            t = Template(Description="foo")
+            t.add_parameter(Parameter("Env", Type="String"))
+            t.add_resource(Bucket("Bucket", **properties))
+            t.add_resource(
+                Queue("Queue", RedrivePolicy=RedrivePolicy(maxReceiveCount=1))
+            )
+            return t
+
+        t1 = template(Tags=Tags(b="2", a="1"))
+        t2 = template(Tags=Tags(a="1", b="2"))
+        fingerprint = t1.fingerprint()
+        self.assertEqual(len(fingerprint), 64)
+        self.assertEqual(fingerprint, t2.fingerprint())
+        self.assertEqual(t1.resource_fingerprints(), t2.resource_fingerprints())
+        self.assertEqual(len({t1, t2}), 1)
+
+        t3 = template(Tags=Tags(a="1", b="3"))
+        self.assertNotEqual(t1, t3)
+        fingerprints = t1.resource_fingerprints()
+        other = t3.resource_fingerprints()
+        self.assertNotEqual(fingerprints["Bucket"], other["Bucket"])
+        self.assertEqual(fingerprints["Queue"], other["Queue"])
+
+        t2.add_output(Output("Out", Value="foo"))
+        self.assertNotEqual(t1, t2)
+
+    def test_cached_fingerprint(self):
+        t1 = Template()
+        t1.set_resource_cache()
+        queue = t1.add_resource(
+            Queue("Queue", RedrivePolicy=RedrivePolicy(maxReceiveCount=1))
+        )
+        t2 = Template()
+        t2.add_resource(Queue("Queue", RedrivePolicy=RedrivePolicy(maxReceiveCount=5)))
+        before = t1.fingerprint()
+        self.assertNotEqual(t1, t2)
+        self.assertEqual(t1.fingerprint(), before)
+        queue.RedrivePolicy.maxReceiveCount = 5
+        self.assertNotEqual(t1.fingerprint(), before)
+        self.assertEqual(t1, t2)
+        self.assertEqual(t1.resource_fingerprints(), t2.resource_fingerprints())
+
+    def test_fingerprint_cost(self):
+        def template(cache):
+            t = Template()
+            t.set_resource_cache(cache)
+            for i in range(50):
+                t.add_resource(Queue("Queue%d" % i))
+            return t
+
+        def encodes(t1, t2):
+            # Number of objects encoded to compare the templates again
+            with mock.patch(
+                "troposphere._encode_to_dict", wraps=troposphere._encode_to_dict
+            ) as encode:
+                self.assertEqual(t1, t2)
+            return encode.call_count
+
+        uncached = template(False), template(False)
+        cached = template(True), template(True)
+        self.assertEqual(encodes(*uncached), encodes(*uncached))
+        self.assertGreater(encodes(*uncached), 100)
+        encodes(*cached)
+        # Only the sections other than the resources are encoded again
+        self.assertEqual(encodes(*cached), 2)
+        cached[0].resources["Queue0"].QueueName = "changed"
+        cached[1].resources["Queue0"].QueueName = "changed"
+        self.assertEqual(encodes(*cached), 4)
+
 
 class TestAwsInterface(unittest.TestCase):
     def test_parameter_label(self):
@@ -213,5 +295,176 @@ class TestRules(unittest.TestCase):
         self.assertEqual(rendered["Rules"]["ValidateEqual"], rule)
 
 
+class TestResourceCache(unittest.TestCase):
+    def template(self):
+        t = Template()
+        t.set_resource_cache()
+        self.tags = Tags(Name="foo")
+        self.rule = SecurityGroupRule(IpProtocol="tcp", FromPort=80, ToPort=80)
+        self.sg = t.add_resource(
+            SecurityGroup(
+                "SecurityGroup",
+                GroupDescription="sg",
+                SecurityGroupIngress=[self.rule],
+                Tags=self.tags,
+            )
+        )
+        self.other = t.add_resource(
+            SecurityGroup("Other", GroupDescription="other", SecurityGroupIngress=[])
+        )
+        self.queue = t.add_resource(
+            Queue("Queue", RedrivePolicy=RedrivePolicy(maxReceiveCount=1))
+        )
+        return t
+
+    def assertRendered(self, t):
+        # Same output as a template without the cache
+        uncached = Template()
+        uncached.resources = t.resources
+        self.assertEqual(t.to_json(), uncached.to_json())
+        self.assertEqual(t.to_yaml(), uncached.to_yaml())
+
+    def test_unchanged_resources_are_reused(self):
+        t = self.template()
+        first = t._encode()["Resources"]
+        self.sg.GroupDescription = "changed"
+        second = t._encode()["Resources"]
+        self.assertIsNot(first["SecurityGroup"], second["SecurityGroup"])
+        self.assertIs(first["Other"], second["Other"])
+        self.assertIs(first["Queue"], second["Queue"])
+        self.assertEqual(
+            second["SecurityGroup"]["Properties"]["GroupDescription"], "changed"
+        )
+        self.assertRendered(t)
+
+    def test_nested_property_changed(self):
+        t = self.template()
+        t.to_dict()
+        self.rule.FromPort = 443
+        self.queue.RedrivePolicy.maxReceiveCount = 5
+        resources = t.to_dict()["Resources"]
+        self.assertEqual(
+            resources["SecurityGroup"]["Properties"]["SecurityGroupIngress"][0][
+                "FromPort"
+            ],
+            443,
+        )
+        self.assertEqual(
+            resources["Queue"]["Properties"]["RedrivePolicy"]["maxReceiveCount"], 5
+        )
+        self.assertRendered(t)
+
+    def test_shared_property_changed(self):
+        t = self.template()
+        self.other.SecurityGroupIngress = [self.rule]
+        t.to_json()
+        # Attached after the first render, then changed
+        policy = RedrivePolicy(maxReceiveCount=1)
+        self.queue.RedrivePolicy = policy
+        t.to_json()
+        policy.deadLetterTargetArn = "arn"
+        self.rule.ToPort = 8080
+        resources = t.to_dict()["Resources"]
+        for title in ("SecurityGroup", "Other"):
+            rule = resources[title]["Properties"]["SecurityGroupIngress"][0]
+            self.assertEqual(rule["ToPort"], 8080)
+        self.assertEqual(
+            resources["Queue"]["Properties"]["RedrivePolicy"]["deadLetterTargetArn"],
+            "arn",
+        )
+        self.assertRendered(t)
+
+    def test_detached_property(self):
+        t = self.template()
+        t.to_dict()
+        rule = self.rule
+        self.sg.SecurityGroupIngress = []
+        t.to_dict()
+        # Changing an object which is no longer attached is harmless
+        rule.FromPort = 22
+        self.assertEqual(
+            t.to_dict()["Resources"]["SecurityGroup"]["Properties"][
+                "SecurityGroupIngress"
+            ],
+            [],
+        )
+
+    def test_in_place_changes(self):
+        t = self.template()
+        t.to_dict()
+        self.other.SecurityGroupIngress.append(self.rule)
+        t.clear_resource_cache()
+        self.assertRendered(t)
+
+    def test_validation(self):
+        t = self.template()
+        t.add_resource(NetworkInterface("Interface"))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                t.to_dict()
+        t.to_dict(validation=False)
+        with self.assertRaises(ValueError):
+            t.to_json()
+        t.resources["Interface"].SubnetId = "subnet"
+        self.assertRendered(t)
+
+    def test_owners_not_kept_alive(self):
+        t = self.template()
+        t.to_dict()
+        ref = weakref.ref(self.sg)
+        self.assertEqual([r() for r in self.rule._owners.values()], [self.sg])
+        del t.resources["SecurityGroup"], self.sg
+        gc.collect()
+        self.assertIsNone(ref())
+        # Dead references are dropped on the next change
+        self.rule.ToPort = 81
+        self.assertEqual(self.rule._owners, {})
+
+    def test_copy_without_tracking(self):
+        t = self.template()
+        t.to_dict()
+        for sg in (pickle.loads(pickle.dumps(self.sg)), copy.deepcopy(self.sg)):
+            self.assertIsNone(sg._encoded)
+            self.assertIsNone(sg.SecurityGroupIngress[0]._owners)
+            self.assertEqual(sg.to_dict(), self.sg.to_dict())
+        self.assertIsNotNone(self.sg._encoded)
+
+    def test_disable(self):
+        t = self.template()
+        first = t.to_dict()["Resources"]
+        t.set_resource_cache(False)
+        self.assertIsNot(t.to_dict()["Resources"]["Other"], first["Other"])
+        self.assertIsNone(self.other._encoded)
+
+
+class TestSubclass(unittest.TestCase):
+    def test_to_dict_override(self):
+        class Described(Template):
+            def to_dict(self):
+                t = super().to_dict()
+                t["Description"] = "From to_dict"
+                return t
+
+        t = Described()
+        t.add_resource(Bucket("Bucket"))
+        self.assertEqual(json.loads(t.to_json())["Description"], "From to_dict")
+        fp = io.StringIO()
+        t.write_json(fp)
+        self.assertEqual(json.loads(fp.getvalue())["Description"], "From to_dict")
+        self.assertIn("Description: From to_dict", t.to_yaml())
+
+    def test_to_json_override(self):
+        class Described(Template):
+            def to_json(self, **kwargs):
+                t = json.loads(super().to_json(**kwargs))
+                t["Description"] = "From to_json"
+                return json.dumps(t)
+
+        t = Described()
+        t.add_resource(Bucket("Bucket"))
+        self.assertIn("Description: From to_json", t.to_yaml())
+        self.assertNotIn("Description", Template().to_yaml())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,22 @@
+import io
 import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
-from troposphere import AWSObject, Template
+import cfn_flip
+
+from troposphere import AWSObject, AWSProperty, Template, registry
 from troposphere.template_generator import (
+    ImportFailure,
     ResourceTypeNotDefined,
     ResourceTypeNotFound,
     TemplateGenerator,
+    _build_registry,
 )
 
 
@@ -91,6 +102,57 @@ class TestTemplateGenerator(unittest.TestCase):
         self.assertTrue(isinstance(foo, MyMacroResource))
         self.assertEqual("bar", foo.Foo)
 
+    def test_custom_members_by_type(self):
+        template = Template()
+        template.add_resource(MyCustomResource("foo", Foo="bar", ServiceToken="baz"))
+        template.add_resource(MyMacroResource("macro", Foo="bar"))
+        generated = TemplateGenerator(
+            json.loads(template.to_json()),
+            CustomMembers=[MyCustomProperty, MyMacroResource, MyCustomResource],
+        )
+        self.assertIsInstance(generated.resources["foo"], MyCustomResource)
+        self.assertIsInstance(generated.resources["macro"], MyMacroResource)
+
+    def test_custom_member_property(self):
+        template = {
+            "Resources": {
+                "foo": {
+                    "Type": "Some::Nested::Resource",
+                    "Properties": {"Nested": {"Enabled": "true"}},
+                }
+            }
+        }
+        generated = TemplateGenerator(
+            template, CustomMembers=[MyNestedResource, MyCustomProperty]
+        )
+        nested = generated.resources["foo"].Nested
+        self.assertIsInstance(nested, MyCustomProperty)
+        self.assertIs(nested.Enabled, True)
+
+        # The plan of MyNestedResource is shared but Nested is left a dict
+        # when MyCustomProperty is not a custom member
+        with self.assertRaises(TypeError):
+            TemplateGenerator(template, CustomMembers=[MyNestedResource])
+
+    def test_boolean_properties(self):
+        generated = TemplateGenerator(
+            {
+                "Resources": {
+                    "Queue%d"
+                    % i: {
+                        "Type": "AWS::SQS::Queue",
+                        "Properties": {"FifoQueue": value},
+                    }
+                    for i, value in enumerate(["true", "False", {"Ref": "Fifo"}])
+                }
+            }
+        )
+        self.assertIs(generated.resources["Queue0"].FifoQueue, True)
+        self.assertIs(generated.resources["Queue1"].FifoQueue, False)
+        self.assertEqual(
+            generated.resources["Queue2"].FifoQueue.to_dict(), {"Ref": "Fifo"}
+        )
+
     def test_no_nested_name(self):
         """
         Prevent regression for  ensuring no nested Name (Issue #977)
@@ -117,6 +179,307 @@ class TestTemplateGenerator(unittest.TestCase):
         name = d["Outputs"]["TestOutput"]["Export"]["Name"]
         self.assertIn("Fn::Sub", name)
 
+    def test_choice_of_types(self):
+        from troposphere.serverless import ApplicationLocation
+
+        location = {"ApplicationId": "arn", "SemanticVersion": "1.0.0"}
+        t = TemplateGenerator(
+            {
+                "Transform": "AWS::Serverless-2016-10-31",
+                "Resources": {
+                    "App": {
+                        "Type": "AWS::Serverless::Application",
+                        "Properties": {"Location": location},
+                    },
+                    "Url": {
+                        "Type": "AWS::Serverless::Application",
+                        "Properties": {"Location": "https://example.com/app.yaml"},
+                    },
+                },
+            }
+        )
+        # (ApplicationLocation, str) builds the object from a dict
+        self.assertIsInstance(t.resources["App"].Location, ApplicationLocation)
+        self.assertEqual(
+            t.resources["App"].to_dict()["Properties"]["Location"], location
+        )
+        self.assertEqual(t.resources["Url"].Location, "https://example.com/app.yaml")
+
+    def test_shadowed_class(self):
+        from troposphere import imagebuilder
+
+        # Components of ContainerRecipe are of the first ComponentConfiguration
+        # class, redefined later in the module. Also bind the name to another
+        # class, as a later import of the same name would.
+        (expected,) = imagebuilder.ContainerRecipe.props["Components"][0]
+
+        class ComponentConfiguration(AWSProperty):
+            props = {}
+
+        template = {
+            "Resources": {
+                "Recipe": {
+                    "Type": "AWS::ImageBuilder::ContainerRecipe",
+                    "Properties": {
+                        "Components": [{"ComponentArn": "arn"}],
+                        "ContainerType": "DOCKER",
+                        "Name": "recipe",
+                        "ParentImage": "image",
+                        "TargetRepository": {"RepositoryName": "repo"},
+                        "Version": "1.0.0",
+                    },
+                }
+            }
+        }
+        with mock.patch.object(
+            imagebuilder, "ComponentConfiguration", ComponentConfiguration
+        ), mock.patch.object(TemplateGenerator, "_members", set()), mock.patch.object(
+            TemplateGenerator, "_loaded_modules", set()
+        ):
+            t = TemplateGenerator(template)
+        (component,) = t.resources["Recipe"].Components
+        self.assertIs(type(component), expected)
+        self.assertEqual(t.to_dict(), template)
+
+    def test_registry_up_to_date(self):
+        modules, resources, functions = _build_registry()
+        msg = "run: python scripts/gen.py --index > troposphere/registry.py"
+        self.assertEqual(registry.MODULES, tuple(modules), msg)
+        self.assertEqual(registry.RESOURCE_TYPES, resources, msg)
+        self.assertEqual(registry.FUNCTIONS, functions, msg)
+
+    def test_lazy_module_loading(self):
+        # Needs a fresh interpreter to see which modules get imported
+        code = """if True:
+            import sys
+            from troposphere.template_generator import TemplateGenerator
+            t = TemplateGenerator({
+                "Resources": {
+                    "Bucket": {
+                        "Type": "AWS::S3::Bucket",
+                        "Properties": {"BucketName": {"Fn::Sub": "${AWS::StackName}"}},
+                    },
+                },
+            })
+            assert "Bucket" in t.resources
+            print(" ".join(sorted(sys.modules)))
+        """
+        modules = subprocess.check_output(
+            [sys.executable, "-c", code], universal_newlines=True
+        ).split()
+        self.assertIn("troposphere.s3", modules)
+        self.assertNotIn("troposphere.ec2", modules)
+        self.assertNotIn("troposphere.wafv2", modules)
+
+
+class TestIterResources(unittest.TestCase):
+    def assertResources(self, source, expected, **kwargs):
+        resources = {
+            title: resource.to_dict()
+            for title, resource in TemplateGenerator.iter_resources(source, **kwargs)
+        }
+        self.assertEqual(resources, expected)
+
+    def test_examples(self):
+        directory = "tests/examples_output"
+        for filename in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, filename)) as f:
+                text = f.read()
+            if not text or filename.startswith("OpenStack_"):
+                continue
+            expected = TemplateGenerator(json.loads(text)).to_dict()
+            expected = expected.get("Resources", {})
+            with self.subTest(filename=filename):
+                self.assertResources(io.StringIO(text), expected)
+                # Refilling the buffer within values and whitespace
+                self.assertResources(io.StringIO(text), expected, chunk_size=7)
+                self.assertResources(io.BytesIO(text.encode("utf-8")), expected)
+                yaml = cfn_flip.to_yaml(text)
+                self.assertResources(io.StringIO(yaml), expected)
+
+    def test_sections(self):
+        template = {
+            "Description": "Resources are not first é",
+            "Mappings": {"Resources": {"Resources": "x"}},
+            "Resources": {
+                "Bucket": {"Type": "AWS::S3::Bucket"},
+                "Queue": {
+                    "Type": "AWS::SQS::Queue",
+                    "Properties": {
+                        "DelaySeconds": 12345,
+                        "QueueName": {"Fn::GetAtt": ["Bucket", "Arn"]},
+                    },
+                },
+                "Custom": {
+                    "Type": "Custom::Resource",
+                    "Properties": {"ServiceToken": "arn", "Foo": "bar"},
+                },
+            },
+            "Outputs": {"Resources": {"Value": {"Ref": "Bucket"}}},
+        }
+        expected = TemplateGenerator(template).to_dict()["Resources"]
+        text = json.dumps(template, indent=2)
+        self.assertResources(io.StringIO(text), expected, chunk_size=1)
+        self.assertResources(
+            io.StringIO(json.dumps(template, separators=(",", ":"))),
+            expected,
+            chunk_size=3,
+        )
+        yaml = cfn_flip.to_yaml(text)
+        self.assertIn("!GetAtt 'Bucket.Arn'", yaml)
+        self.assertResources(io.StringIO(yaml), expected)
+
+        resources = dict(
+            TemplateGenerator.iter_resources(
+                io.StringIO(text), CustomMembers=[MyCustomResource]
+            )
+        )
+        self.assertIsInstance(resources["Custom"], MyCustomResource)
+
+    def test_paths(self):
+        template = {"Resources": {"Bucket": {"Type": "AWS::S3::Bucket"}}}
+        expected = {"Bucket": {"Type": "AWS::S3::Bucket"}}
+        with tempfile.TemporaryDirectory() as directory:
+            for name, text in (
+                ("template.json", json.dumps(template)),
+                ("template.yaml", cfn_flip.to_yaml(json.dumps(template))),
+                ("template.template", "\n\n" + json.dumps(template)),
+            ):
+                path = os.path.join(directory, name)
+                with open(path, "w") as f:
+                    f.write(text)
+                with self.subTest(name=name):
+                    self.assertResources(path, expected)
+
+    def test_empty(self):
+        for text in ("", "{}", "{ }", '{"Description": "d"}', "Description: d"):
+            with self.subTest(text=text):
+                self.assertResources(io.StringIO(text), {})
+
+    def test_incremental(self):
+        # Resources are yielded before the rest of the template is read
+        text = '{"Resources": {"Bucket": {"Type": "AWS::S3::Bucket"}, "Bad": {'
+        resources = TemplateGenerator.iter_resources(io.StringIO(text), "json")
+        title, bucket = next(resources)
+        self.assertEqual(title, "Bucket")
+        with self.assertRaises(ValueError):
+            next(resources)
+
+        text = "Resources:\n  Bucket:\n    Type: AWS::S3::Bucket\n  Bad: [\n"
+        resources = TemplateGenerator.iter_resources(io.StringIO(text), "yaml")
+        self.assertEqual(next(resources)[0], "Bucket")
+        with self.assertRaises(yaml_error()):
+            next(resources)
+
+    def test_errors(self):
+        for text in (
+            "[]",
+            '{"Resources" {}}',
+            '{"Resources": {"Bucket": {"Type": "AWS::S3::Bucket"}} x',
+            '{"Resources": {1: {}}}',
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    list(TemplateGenerator.iter_resources(io.StringIO(text), "json"))
+        with self.assertRaises(ValueError):
+            list(TemplateGenerator.iter_resources(io.StringIO("[]"), "yaml"))
+        with self.assertRaises(ValueError):
+            list(TemplateGenerator.iter_resources(io.StringIO("{}"), "xml"))
+
+        text = '{"Resources": {"Foo": {"Type": "Some::Unknown::Type"}}}'
+        with self.assertRaises(ResourceTypeNotFound):
+            list(TemplateGenerator.iter_resources(io.StringIO(text)))
+
+
+class TestFromFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_results(self):
+        template = {
+            "Resources": {
+                "Bucket": {"Type": "AWS::S3::Bucket"},
+                "Custom": {
+                    "Type": "Custom::Thing",
+                    "Properties": {"ServiceToken": "x"},
+                },
+            }
+        }
+        text = json.dumps(template)
+        paths = [
+            self.write("good.json", text),
+            self.write("good.yaml", cfn_flip.to_yaml(text)),
+            self.write(
+                "unknown.json", '{"Resources": {"Foo": {"Type": "Some::Type"}}}'
+            ),
+            self.write("untyped.json", '{"Resources": {"Foo": {}}}'),
+            self.write("invalid.json", '{"Resources": '),
+            self.write("list.yaml", "- Resources\n"),
+            os.path.join(self.directory.name, "missing.json"),
+        ]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = TemplateGenerator.from_files(paths, workers=workers)
+                self.assertEqual([r.path for r in results], paths)
+                for result in results[:2]:
+                    self.assertIsNone(result.error)
+                    self.assertIsInstance(result.template, TemplateGenerator)
+                    self.assertEqual(result.template.to_dict(), template)
+
+                failures = [r.error for r in results[2:]]
+                self.assertTrue(all(r.template is None for r in results[2:]))
+                self.assertEqual(
+                    failures[0],
+                    ImportFailure(
+                        "ResourceTypeNotFound",
+                        "ResourceType not found for Some::Type - Foo",
+                        "Foo",
+                        "Some::Type",
+                    ),
+                )
+                self.assertEqual(failures[1][::2], ("ResourceTypeNotDefined", "Foo"))
+                self.assertEqual(
+                    [f.type for f in failures[2:]],
+                    ["JSONDecodeError", "ValueError", "FileNotFoundError"],
+                )
+
+    def test_custom_members(self):
+        template = Template()
+        template.add_resource(MyCustomResource("foo", Foo="bar", ServiceToken="baz"))
+        path = self.write("custom.json", template.to_json())
+        (result,) = TemplateGenerator.from_files(
+            [path], workers=2, CustomMembers=[MyCustomResource]
+        )
+        self.assertIsInstance(result.template.resources["foo"], MyCustomResource)
+        self.assertEqual(TemplateGenerator.from_files([]), [])
+
+    def test_pickle_custom_type(self):
+        generated = TemplateGenerator(
+            {
+                "Resources": {
+                    "Foo": {"Type": "Custom::Foo", "Properties": {"ServiceToken": "x"}}
+                }
+            }
+        )
+        unpickled = pickle.loads(pickle.dumps(generated))
+        self.assertIs(
+            type(unpickled.resources["Foo"]), type(generated.resources["Foo"])
+        )
+        self.assertEqual(unpickled.to_dict(), generated.to_dict())
+
+
+def yaml_error():
+    import yaml
+
+    return yaml.YAMLError
+
 
 class MyCustomResource(AWSObject):
     resource_type = "Custom::Resource"
@@ -127,6 +490,20 @@ class MyCustomResource(AWSObject):
     }
 
 
+class MyCustomProperty(AWSProperty):
+    props = {
+        "Enabled": (bool, False),
+    }
+
+
+class MyNestedResource(AWSObject):
+    resource_type = "Some::Nested::Resource"
+
+    props = {
+        "Nested": (MyCustomProperty, False),
+    }
+
+
 class MyMacroResource(AWSObject):
     resource_type = "Some::Special::Resource"
 
@@ -0,0 +1,109 @@
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from troposphere import If, Output, Parameter, Ref, Tags, Template
+from troposphere.autoscaling import AutoScalingGroup, LaunchTemplateSpecification
+from troposphere.ec2 import NetworkInterface, SecurityGroup, SecurityGroupRule
+from troposphere.s3 import Bucket
+from troposphere.validation import ValidationError, validate_object
+
+
+def broken_template():
+    t = Template()
+    t.add_parameter(Parameter("Size", Type="Number", Default="big"))
+    t.add_resource(
+        AutoScalingGroup(
+            "WebAsg",
+            MinSize="1",
+            MaxSize="2",
+            VPCZoneIdentifier=["subnet"],
+            LaunchTemplate=LaunchTemplateSpecification(LaunchTemplateId="lt"),
+        )
+    )
+    t.add_resource(Bucket("Bucket"))
+    t.add_resource(
+        SecurityGroup(
+            "SecurityGroup",
+            GroupDescription="sg",
+            SecurityGroupIngress=[
+                SecurityGroupRule(IpProtocol="tcp", CidrIp="10.0.0.0/8"),
+                If("Cond", SecurityGroupRule(), Ref("AWS::NoValue")),
+            ],
+            Tags=Tags(Name="sg"),
+        )
+    )
+    t.add_resource(NetworkInterface("Interface"))
+    t.add_output(Output("Out"))
+    return t
+
+
+EXPECTED_PATHS = [
+    "Parameters.Size",
+    "Outputs.Out.Value",
+    "Resources.WebAsg.Properties.LaunchTemplate.Version",
+    "Resources.SecurityGroup.Properties.SecurityGroupIngress[1].Fn::If[1].IpProtocol",
+    "Resources.Interface.Properties.SubnetId",
+]
+
+
+class TestValidateAll(unittest.TestCase):
+    def assertErrors(self, t, **kwargs):
+        with self.assertRaises(ValidationError) as cm:
+            t.validate_all(**kwargs)
+        self.assertEqual([p for p, _ in cm.exception.errors], EXPECTED_PATHS)
+        for _, error in cm.exception.errors:
+            self.assertIsInstance(error, ValueError)
+        return cm.exception
+
+    def test_collects_all_errors(self):
+        e = self.assertErrors(broken_template())
+        self.assertIsInstance(e, ValueError)
+        self.assertIn("5 validation error(s)", str(e))
+        self.assertIn(
+            "Resources.Interface.Properties.SubnetId: Resource SubnetId required",
+            str(e),
+        )
+
+    def test_same_errors_as_encoding(self):
+        t = Template()
+        t.add_resource(NetworkInterface("Interface"))
+        with self.assertRaises(ValueError) as encoding:
+            t.to_dict()
+        with self.assertRaises(ValidationError) as cm:
+            t.validate_all()
+        self.assertEqual(str(cm.exception.errors[0][1]), str(encoding.exception))
+
+    def test_valid(self):
+        t = Template()
+        t.add_resource(Bucket("Bucket", Tags=Tags(Name="foo")))
+        t.add_resource(NetworkInterface("Interface", SubnetId="subnet").no_validation())
+        self.assertIsNone(t.validate_all())
+
+    def test_validate_object(self):
+        self.assertEqual(
+            [p for p, _ in validate_object(NetworkInterface("Interface"), "Eni")],
+            ["Eni.Properties.SubnetId"],
+        )
+        self.assertEqual(validate_object({"Value": Ref("Foo")}, "Value"), [])
+
+    def test_render_without_validation(self):
+        t = broken_template()
+        with self.assertRaises(ValueError):
+            t.to_json()
+        self.assertIn('"WebAsg"', t.to_json(validation=False))
+        self.assertIn("WebAsg:", t.to_yaml(validation=False))
+
+    def test_thread_pool(self):
+        with ThreadPoolExecutor(4) as executor:
+            self.assertErrors(broken_template(), executor=executor)
+
+    def test_process_pool(self):
+        t = broken_template()
+        pickle.dumps(t)
+        with ProcessPoolExecutor(2) as executor:
+            self.assertErrors(t, executor=executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,26 @@
+import io
+import json
 import unittest
+from unittest import mock
 
-from troposphere import Output, Ref, Sub, Template, s3
+import cfn_flip
+
+from troposphere import (
+    GetAtt,
+    If,
+    Join,
+    Output,
+    Ref,
+    Select,
+    Sub,
+    Template,
+    s3,
+    yaml_writer,
+)
 from troposphere.cloudformation import WaitCondition
+from troposphere.stepfunctions import StateMachine
+
+from .test_json_writer import example_templates
 
 s3_bucket_yaml = """\
 Description: S3 Bucket Example
@@ -78,3 +97,95 @@ class TestYAML(unittest.TestCase):
         self.assertEqual(cond_long, t.to_yaml(False, True))
         self.assertEqual(cond_clean, t.to_yaml(clean_up=True))
         self.assertEqual(cond_clean, t.to_yaml(True))
+
+    def assertFlipped(self, t, sort_keys=True):
+        """Checks to_yaml() against a JSON round trip through cfn_flip."""
+        for clean_up in (False, True):
+            for long_form in (False, True):
+                self.assertEqual(
+                    t.to_yaml(
+                        clean_up=clean_up, long_form=long_form, sort_keys=sort_keys
+                    ),
+                    cfn_flip.to_yaml(
+                        t.to_json(sort_keys=sort_keys),
+                        clean_up=clean_up,
+                        long_form=long_form,
+                    ),
+                )
+
+    def test_yaml_scalars(self):
+        t = Template()
+        t.add_output(
+            [
+                Output("Empty", Value=""),
+                Output("Number", Value="0123"),
+                Output("Account", Value=Ref("123456789012")),
+                Output("Boolean", Value="true"),
+                Output("Unicode", Value="caf\u00e9"),
+                Output("Quote", Value="it's here"),
+                Output("Long", Value=" ".join(["word"] * 60)),
+                Output("Wrapped", Value=" ".join(["word"] * 45)),
+                Output("Newline", Value="line\nnext"),
+                Output("Lines", Value=Sub("\n".join(["${AWS::Region}"] * 12))),
+                Output("Trailing", Value="keep\n\n"),
+                Output("K" * 130, Value="long key"),
+            ]
+        )
+        self.assertFlipped(t)
+
+    def test_yaml_functions(self):
+        t = Template()
+        t.add_condition("IsProd", {"Fn::Equals": [Ref("Env"), "prod"]})
+        t.add_output(
+            [
+                Output("Attribute", Value=GetAtt("Bucket", "Arn")),
+                Output("Condition", Value=If("IsProd", Ref("A"), Ref("AWS::NoValue"))),
+                Output("Join", Value=Join("", ["arn:", Ref("AWS::Partition"), ":s3"])),
+                Output("Nested", Value=Select(0, [Join(",", ["a", "b"]), []])),
+                Output("Refused", Value=Join(",", GetAtt("Bucket", "List"))),
+            ]
+        )
+        t.set_metadata({"Macro": {"Fn::Transform": {"Name": "Macro"}}})
+        self.assertFlipped(t)
+        self.assertFlipped(t, sort_keys=False)
+
+    def test_yaml_literal_definition(self):
+        t = Template()
+        state_machine = t.add_resource(
+            StateMachine("StateMachine", RoleArn="arn", DefinitionString="{}")
+        )
+        state_machine.properties["DefinitionString"] = {
+            "StartAt": "Hello",
+            "States": {"Hello": {"Type": "Pass", "End": True}},
+        }
+        self.assertIn("DefinitionString: |-", t.to_yaml())
+        self.assertFlipped(t)
+
+    def test_write_yaml(self):
+        t = Template()
+        t.add_resource(s3.Bucket("Bucket", AccessControl=s3.PublicRead))
+        fp = io.StringIO()
+        t.write_yaml(fp, clean_up=True)
+        self.assertEqual(fp.getvalue(), t.to_yaml(clean_up=True))
+
+    def test_fallback(self):
+        t = Template()
+        t.add_resource(s3.Bucket("Bucket", BucketName=Join("-", ["a", Ref("B")])))
+        expected = cfn_flip.to_yaml(t.to_json(), clean_up=True)
+        # internals of PyYAML or cfn_flip missing in the installed releases
+        attributes = yaml_writer._DUMPER_ATTRIBUTES + ("missing",)
+        with mock.patch.object(yaml_writer, "_DUMPER_ATTRIBUTES", attributes):
+            self.assertEqual(t.to_yaml(clean_up=True), expected)
+        with mock.patch.object(yaml_writer, "_import_error", ImportError()):
+            self.assertEqual(t.to_yaml(clean_up=True), expected)
+
+    def test_yaml_not_serializable(self):
+        t = Template(Description=object())
+        with self.assertRaises(TypeError):
+            t.to_yaml()
+
+    def test_yaml_examples(self):
+        for name, t, expected in example_templates():
+            with self.subTest(example=name):
+                self.assertEqual(json.loads(expected), t.to_dict())
+                self.assertFlipped(t)
@@ -3,15 +3,21 @@
 #
 # See LICENSE file for full license.
 import collections.abc
+import hashlib
+import importlib
+import io
 import json
 import re
 import sys
 import types
-
-import cfn_flip
+import weakref
+from typing import TYPE_CHECKING
 
 from . import validators
 
+if TYPE_CHECKING:
+    from .serverless import Globals
+
 __version__ = "3.1.1"
 
 # constants for DeletionPolicy and UpdateReplacePolicy
@@ -35,6 +41,12 @@ MAX_OUTPUTS = 200
 MAX_PARAMETERS = 200
 MAX_RESOURCES = 500
 PARAMETER_TITLE_MAX = 255
+# Template body size in bytes when passed inline or from S3 (TemplateURL)
+MAX_TEMPLATE_BODY_SIZE = 51200
+MAX_TEMPLATE_URL_SIZE = 1024 * 1024
+
+# JSON separators of the minified output
+MINIFIED_SEPARATORS = (",", ":")
 
 
 valid_names = re.compile(r"^[a-zA-Z0-9]+$")
@@ -50,27 +62,202 @@ def is_aws_object_subclass(cls):
     return is_aws_object
 
 
-def encode_to_dict(obj):
-    if hasattr(obj, "to_dict"):
-        # Calling encode_to_dict to ensure object is
-        # nomalized to a base dictionary all the way down.
-        return encode_to_dict(obj.to_dict())
-    elif isinstance(obj, (list, tuple)):
-        new_lst = []
-        for o in obj:
-            new_lst.append(encode_to_dict(o))
-        return new_lst
-    elif isinstance(obj, dict):
-        props = {}
-        for name, prop in obj.items():
-            props[name] = encode_to_dict(prop)
-
-        return props
-    # This is useful when dealing with external libs using
-    # this format. Specifically awacs.
-    elif hasattr(obj, "JSONrepr"):
-        return encode_to_dict(obj.JSONrepr())
-    return obj
+# Types which are already in their encoded form
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+# How to encode instances of a given type, see _encode_plan()
+_ENCODE_LEAF = 0
+_ENCODE_CONTAINER = 1
+_ENCODE_INLINE = 2
+_ENCODE_TO_DICT = 3
+_ENCODE_JSONREPR = 4
+
+# to_dict implementations which only encode the data returned by the
+# object's _to_dict_data(). Filled in once the classes exist.
+_inline_encoders = set()
+_encode_plans = {}
+
+
+def _encode_plan(cls):
+    """Returns how encode_to_dict should handle instances of cls."""
+    plan = _encode_plans.get(cls)
+    if plan is None:
+        to_dict = getattr(cls, "to_dict", None)
+        if to_dict in _inline_encoders:
+            plan = _ENCODE_INLINE
+        elif to_dict is not None:
+            plan = _ENCODE_TO_DICT
+        elif issubclass(cls, (list, tuple, dict)):
+            plan = _ENCODE_CONTAINER
+        # This is useful when dealing with external libs using
+        # this format. Specifically awacs.
+        elif hasattr(cls, "JSONrepr"):
+            plan = _ENCODE_JSONREPR
+        else:
+            plan = _ENCODE_LEAF
+        _encode_plans[cls] = plan
+    return plan
+
+
+def _encode_value(value, memo, validation=True, share=True):
+    """Resolves a value down to a leaf or a container which must be walked.
+
+    Returns a tuple of (done, value, owners, fresh) where owners are the
+    objects which were unwrapped to get to value and whose encoded form is
+    the encoded form of value. fresh is True if value is a container just
+    built by _to_dict_data(), which may be returned as is. Any other
+    container may be state of the caller's objects and is copied.
+
+    With share=False the encoded form of an object or container already
+    encoded elsewhere in this call is copied rather than returned as is.
+    """
+    owners = None
+    fresh = False
+    while True:
+        cls = type(value)
+        if cls in _SCALAR_TYPES:
+            return True, value, owners, fresh
+        hit = memo.get(id(value))
+        if hit is not None:
+            if share:
+                return True, hit[1], owners, fresh
+            return True, _copy_encoded(hit[1]), owners, fresh
+
+        kind = _encode_plan(cls)
+        if kind == _ENCODE_CONTAINER:
+            return False, value, owners, fresh
+        elif kind == _ENCODE_LEAF:
+            # Fall back to checking the instance itself for anything we
+            # don't know how to handle from its type.
+            if hasattr(value, "to_dict"):
+                kind = _ENCODE_TO_DICT
+            elif hasattr(value, "JSONrepr"):
+                kind = _ENCODE_JSONREPR
+            else:
+                return True, value, owners, fresh
+
+        if owners is None:
+            owners = [value]
+        else:
+            owners.append(value)
+        # _to_dict_data() returns a fresh container, whereas to_dict() and
+        # JSONrepr() of other libraries may return their internal state.
+        fresh = kind == _ENCODE_INLINE
+        if kind == _ENCODE_INLINE:
+            value = value._to_dict_data(validation)
+        elif kind == _ENCODE_TO_DICT:
+            value = value.to_dict()
+        else:
+            value = value.JSONrepr()
+
+
+def encode_to_dict(obj, validation=True):
+    """Normalizes obj to base dictionaries, lists and scalars all the way down.
+
+    This walks the object graph iteratively, visiting each node once.
+    The result never shares containers with obj, nor between several
+    places of the result: objects or containers shared between several
+    places (e.g. the same Tags or policy attached to many resources) are
+    only encoded once per call, and a copy of their encoded form is used
+    for the other places.
+
+    With validation=False troposphere objects are encoded without being
+    validated, e.g. once Template.validate_all() has already been run.
+    """
+    return _encode_to_dict(obj, validation, False)
+
+
+def _encode_shared(obj, validation=True):
+    """
+    Same as encode_to_dict() but the encoded form of objects or containers
+    found in several places is shared between those places of the result,
+    for callers which only read it (e.g. to serialize it).
+    """
+    return _encode_to_dict(obj, validation, True)
+
+
+def _encode_to_dict(obj, validation, share):
+    # Maps id() of already encoded objects to (object, encoded). Holding on
+    # to the object ensures its id is not reused by a temporary object.
+    memo = {}
+    done, value, owners, fresh = _encode_value(obj, memo, validation, share)
+    if done:
+        return value
+
+    # Each frame is [source, keys, index, output, owners]. The output of a
+    # fresh container is only created once a child's encoded form differs
+    # from the source, other containers are always copied.
+    stack = [_encode_frame(value, owners, fresh)]
+    scalar_types = _SCALAR_TYPES
+    while True:
+        frame = stack[-1]
+        source, keys, index, out, frame_owners = frame
+        if index < len(keys):
+            key = keys[index]
+            child = source[key]
+            index += 1
+            frame[2] = index
+            if type(child) in scalar_types:
+                if out is None:
+                    continue
+                value = child
+            else:
+                done, value, owners, fresh = _encode_value(
+                    child, memo, validation, share
+                )
+                if not done:
+                    stack.append(_encode_frame(value, owners, fresh))
+                    continue
+                if owners:
+                    for owner in owners:
+                        memo[id(owner)] = (owner, value)
+        else:
+            stack.pop()
+            value = source if out is None else out
+            memo[id(source)] = (source, value)
+            for owner in frame_owners:
+                memo[id(owner)] = (owner, value)
+            if not stack:
+                return value
+            frame = stack[-1]
+            source, keys, index, out, frame_owners = frame
+            key = keys[index - 1]
+            child = source[key]
+
+        # Store the child's encoded form in the frame's output
+        if out is None:
+            if value is child:
+                continue
+            if type(source) is dict:
+                out = {k: source[k] for k in keys[: index - 1]}
+            else:
+                out = list(source[: index - 1])
+            frame[3] = out
+        if type(out) is dict:
+            out[key] = value
+        else:
+            out.append(value)
+
+
+def _copy_encoded(value):
+    """Returns a copy of the containers of an encoded value."""
+    if type(value) is dict:
+        return {k: _copy_encoded(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_copy_encoded(v) for v in value]
+    return value
+
+
+def _encode_frame(value, owners, fresh):
+    # Only the containers built by _to_dict_data() for this call may be
+    # reused, any other one is copied so the result never aliases them.
+    if isinstance(value, dict):
+        keys = list(value)
+        out = None if type(value) is dict and fresh else {}
+    else:
+        keys = range(len(value))
+        out = None if type(value) is list and fresh else []
+    return [value, keys, 0, out, owners or ()]
 
 
 def depends_on_helper(obj):
@@ -87,52 +274,246 @@ def depends_on_helper(obj):
     return obj
 
 
+# Resource attributes which live next to "Properties" in the resource
+# definition rather than inside of it.
+ATTRIBUTES = frozenset(
+    [
+        "Condition",
+        "CreationPolicy",
+        "DeletionPolicy",
+        "DependsOn",
+        "Metadata",
+        "UpdatePolicy",
+        "UpdateReplacePolicy",
+    ]
+)
+
+
+def compile_setter(name, expected_type):
+    """Returns a setter specialized for the expected type of a property.
+
+    The returned callable takes the object and the value and stores the
+    validated value in the object's properties. Deciding how to validate is
+    done once here instead of on every assignment.
+    """
+
+    # If it's a function, call it...
+    if isinstance(expected_type, types.FunctionType):
+
+        def set_validator(obj, value):
+            # If the value is a AWSHelperFn we can't do much validation
+            # we'll have to leave that to Amazon.
+            if not isinstance(value, AWSHelperFn):
+                try:
+                    value = expected_type(value)
+                except Exception:
+                    sys.stderr.write(
+                        "%s: %s.%s function validator '%s' threw "
+                        "exception:\n"
+                        % (obj.__class__, obj.title, name, expected_type.__name__)
+                    )
+                    raise
+            obj.properties[name] = value
+
+        return set_validator
+
+    # If it's a list of types, check against those types...
+    elif isinstance(expected_type, list):
+        # Special case a list of a single validation function
+        if len(expected_type) == 1 and isinstance(expected_type[0], types.FunctionType):
+            validator = expected_type[0]
+
+            def set_validator_list(obj, value):
+                if isinstance(value, AWSHelperFn):
+                    obj.properties[name] = value
+                    return
+                # If we're expecting a list, then make sure it is a list
+                if not isinstance(value, list):
+                    obj._raise_type(name, value, expected_type)
+                obj.properties[name] = list(map(validator, value))
+
+            return set_validator_list
+
+        item_types = tuple(expected_type) + (AWSHelperFn,)
+
+        def set_type_list(obj, value):
+            if isinstance(value, AWSHelperFn):
+                obj.properties[name] = value
+                return
+            # If we're expecting a list, then make sure it is a list
+            if not isinstance(value, list):
+                obj._raise_type(name, value, expected_type)
+            # Iterate over the list and make sure it matches our
+            # type checks (as above accept AWSHelperFn because
+            # we can't do the validation ourselves)
+            for v in value:
+                if not isinstance(v, item_types):
+                    obj._raise_type(name, v, expected_type)
+            obj.properties[name] = value
+
+        return set_type_list
+
+    # Otherwise compare the type of value against expected_type which
+    # should be either a single type or a tuple of types.
+    def set_type(obj, value):
+        if not isinstance(value, AWSHelperFn) and not isinstance(value, expected_type):
+            obj._raise_type(name, value, expected_type)
+        obj.properties[name] = value
+
+    return set_type
+
+
+class ClassMeta:
+    """Per-class property metadata derived from a class's ``props`` table.
+
+    This is computed once per class on first instantiation and shared by all
+    of its instances rather than being rebuilt in every ``__init__``. It is
+    rebuilt if ``props`` is replaced or grows after the class was created
+    (e.g. recursive properties patched in after the class definition).
+    """
+
+    __slots__ = (
+        "cls",
+        "props",
+        "nprops",
+        "propnames",
+        "defaults",
+        "required",
+        "dictname",
+        "resource_type",
+        "is_custom",
+        "setters",
+    )
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.props = cls.props
+        self.nprops = len(cls.props)
+        self.propnames = frozenset(cls.props)
+        # Properties defined as class attributes are used as default values
+        self.defaults = tuple(
+            (k, getattr(cls, k)) for k in cls.props if getattr(cls, k, None) is not None
+        )
+        self.required = tuple(k for k, (_, required) in cls.props.items() if required)
+        self.dictname = getattr(cls, "dictname", None)
+        self.resource_type = getattr(cls, "resource_type", None)
+        type_name = getattr(cls, "resource_type", cls.__name__)
+        self.is_custom = (
+            type_name == "AWS::CloudFormation::CustomResource"
+            or type_name.startswith("Custom::")
+        )
+        # Most classes only ever have a few of their properties set, so
+        # setters are compiled the first time a property is assigned
+        self.setters = {}
+
+    def setter(self, name):
+        """Returns the setter of property name, None if it is not one."""
+        try:
+            return self.setters[name]
+        except KeyError:
+            if name not in self.props:
+                return None
+            setter = compile_setter(name, self.props[name][0])
+            self.setters[name] = setter
+            return setter
+
+
+# Instance state of BaseAWSObject, everything else lives in the properties
+SLOTS = frozenset(
+    ["title", "template", "do_validation", "properties", "resource", "_initialized"]
+)
+
+# Change tracking state of BaseAWSObject which is not pickled or copied
+_TRACKING = frozenset(["_owners", "_encoded", "_version"])
+
+
 class BaseAWSObject:
+    __slots__ = (
+        "title",
+        "template",
+        "do_validation",
+        "properties",
+        "resource",
+        "_initialized",
+        "__dict__",
+        "__weakref__",
+    )
+
+    attributes = ATTRIBUTES
+    _meta = None
+    # Weak references to the resources whose cached encoded form (see
+    # Template.set_resource_cache) or dependency graph includes this
+    # object, keyed by id(), and the cached encoded form of this object as
+    # a resource. Set with object.__setattr__, see _add_owner().
+    _owners = None
+    _encoded = None
+    # Number of changes made to tracked objects so far, and the value it
+    # had when this resource, or an object nested in it, last changed.
+    _changes = 0
+    _version = 0
+
     def __init__(self, title, template=None, validation=True, **kwargs):
-        self.title = title
-        self.template = template
-        self.do_validation = validation
-        # Cache the keys for validity checks
-        self.propnames = set(self.props.keys())
-        self.attributes = [
-            "Condition",
-            "CreationPolicy",
-            "DeletionPolicy",
-            "DependsOn",
-            "Metadata",
-            "UpdatePolicy",
-            "UpdateReplacePolicy",
-        ]
+        meta = self._class_meta()
+        # Unless a subclass intercepts assignments, the slots and properties
+        # are set directly instead of going through __setattr__ each time.
+        setattr_ = type(self).__setattr__
+        fast = setattr_ is BaseAWSObject.__setattr__
+        if fast:
+            setattr_ = object.__setattr__
+        setattr_(self, "title", title)
+        setattr_(self, "template", template)
+        setattr_(self, "do_validation", validation)
 
         # try to validate the title if its there
         if self.title:
             self.validate_title()
 
         # Create the list of properties set on this object by the user
-        self.properties = {}
-        dictname = getattr(self, "dictname", None)
-        if dictname:
-            self.resource = {
-                dictname: self.properties,
+        properties = {}
+        setattr_(self, "properties", properties)
+        if meta.dictname:
+            resource = {
+                meta.dictname: properties,
             }
         else:
-            self.resource = self.properties
-        if hasattr(self, "resource_type") and self.resource_type is not None:
-            self.resource["Type"] = self.resource_type
-        self.__initialized = True
+            resource = properties
+        setattr_(self, "resource", resource)
+        if meta.resource_type is not None:
+            resource["Type"] = meta.resource_type
+        setattr_(self, "_initialized", True)
 
         # Check for properties defined in the class
-        for k, (_, required) in self.props.items():
-            v = getattr(type(self), k, None)
-            if v is not None and k not in kwargs:
+        for k, v in meta.defaults:
+            if k not in kwargs:
                 self.__setattr__(k, v)
 
         # Now that it is initialized, populate it with the kwargs
         for k, v in kwargs.items():
-            self.__setattr__(k, v)
+            setter = meta.setter(k) if fast and k not in ATTRIBUTES else None
+            if setter is None:
+                self.__setattr__(k, v)
+            else:
+                setter(self, v)
 
         self.add_to_template()
 
+    @classmethod
+    def _class_meta(cls):
+        meta = cls._meta
+        if (
+            meta is None
+            or meta.cls is not cls
+            or meta.props is not cls.props
+            or meta.nprops != len(cls.props)
+        ):
+            meta = ClassMeta(cls)
+            cls._meta = meta
+        return meta
+
+    @property
+    def propnames(self):
+        return self._class_meta().propnames
+
     def add_to_template(self):
         # Bound it to template if we know it
         if self.template is not None:
@@ -141,13 +522,13 @@ class BaseAWSObject:
     def __getattr__(self, name):
         # If pickle loads this object, then __getattr__ will cause
         # an infinite loop when pickle invokes this object to look for
-        # __setstate__ before attributes is "loaded" into this object.
-        # Therefore, short circuit the rest of this call if attributes
-        # is not loaded yet.
-        if "attributes" not in self.__dict__:
+        # __setstate__ before the slots are "loaded" into this object.
+        # Therefore, short circuit the rest of this call for any slot
+        # which is not set yet.
+        if name in SLOTS:
             raise AttributeError(name)
         try:
-            if name in self.attributes:
+            if name in ATTRIBUTES:
                 return self.resource[name]
             else:
                 return self.properties.__getitem__(name)
@@ -159,83 +540,60 @@ class BaseAWSObject:
                 return self.__getattribute__("title")
             raise AttributeError(name)
 
+    def __getstate__(self):
+        # The owners are weak references, and the cached encoded form is
+        # only valid as long as they are tracked
+        state = {k: v for k, v in self.__dict__.items() if k not in _TRACKING}
+        slots = {}
+        for name in SLOTS:
+            try:
+                slots[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return state or None, slots
+
     def __setattr__(self, name, value):
-        if (
-            name in self.__dict__.keys()
-            or "_BaseAWSObject__initialized" not in self.__dict__
-        ):
-            return dict.__setattr__(self, name, value)
-        elif name in self.attributes:
+        if name in SLOTS or not getattr(self, "_initialized", False):
+            return object.__setattr__(self, name, value)
+        if self._owners:
+            # Mark the resources containing this object as dirty
+            BaseAWSObject._changes += 1
+            for key, ref in list(self._owners.items()):
+                owner = ref()
+                if owner is None:
+                    del self._owners[key]
+                    continue
+                object.__setattr__(owner, "_encoded", None)
+                object.__setattr__(owner, "_version", BaseAWSObject._changes)
+        if name in ATTRIBUTES:
             if name == "DependsOn":
                 self.resource[name] = depends_on_helper(value)
             else:
                 self.resource[name] = value
             return None
-        elif name in self.propnames:
-            # Check the type of the object and compare against what we were
-            # expecting.
-            expected_type = self.props[name][0]
-
-            # If the value is a AWSHelperFn we can't do much validation
-            # we'll have to leave that to Amazon.  Maybe there's another way
-            # to deal with this that we'll come up with eventually
-            if isinstance(value, AWSHelperFn):
-                return self.properties.__setitem__(name, value)
-
-            # If it's a function, call it...
-            elif isinstance(expected_type, types.FunctionType):
-                try:
-                    value = expected_type(value)
-                except Exception:
-                    sys.stderr.write(
-                        "%s: %s.%s function validator '%s' threw "
-                        "exception:\n"
-                        % (self.__class__, self.title, name, expected_type.__name__)
-                    )
-                    raise
-                return self.properties.__setitem__(name, value)
-
-            # If it's a list of types, check against those types...
-            elif isinstance(expected_type, list):
-                # If we're expecting a list, then make sure it is a list
-                if not isinstance(value, list):
-                    self._raise_type(name, value, expected_type)
-
-                # Special case a list of a single validation function
-                if len(expected_type) == 1 and isinstance(
-                    expected_type[0], types.FunctionType
-                ):
-                    new_value = list(map(expected_type[0], value))
-                    return self.properties.__setitem__(name, new_value)
-
-                # Iterate over the list and make sure it matches our
-                # type checks (as above accept AWSHelperFn because
-                # we can't do the validation ourselves)
-                for v in value:
-                    if not isinstance(v, tuple(expected_type)) and not isinstance(
-                        v, AWSHelperFn
-                    ):
-                        self._raise_type(name, v, expected_type)
-                # Validated so assign it
-                return self.properties.__setitem__(name, value)
-
-            # Final validity check, compare the type of value against
-            # expected_type which should now be either a single type or
-            # a tuple of types.
-            elif isinstance(value, expected_type):
-                return self.properties.__setitem__(name, value)
-            else:
-                self._raise_type(name, value, expected_type)
-
-        type_name = getattr(self, "resource_type", self.__class__.__name__)
-
-        if type_name == "AWS::CloudFormation::CustomResource" or type_name.startswith(
-            "Custom::"
-        ):
+        # The metadata was checked to be current when this object was
+        # created, only recheck it if the property isn't known.
+        cls = type(self)
+        meta = cls._meta
+        setter = None
+        if meta is not None and meta.cls is cls:
+            setter = meta.setters.get(name)
+        if setter is None:
+            meta = self._class_meta()
+            setter = meta.setter(name)
+        if setter is not None:
+            return setter(self, value)
+
+        if name in self.__dict__:
+            # Extra attributes set up by subclasses before initialization
+            return object.__setattr__(self, name, value)
+
+        elif meta.is_custom:
             # Add custom resource arguments to the dict without any further
             # validation. The properties of a CustomResource is not known.
             return self.properties.__setitem__(name, value)
 
+        type_name = getattr(self, "resource_type", self.__class__.__name__)
         raise AttributeError(
             "%s object does not support attribute %s" % (type_name, name)
         )
@@ -258,12 +616,20 @@ class BaseAWSObject:
         return self
 
     def to_dict(self):
-        if self.do_validation:
+        return encode_to_dict(self._to_dict_data())
+
+    def _to_dict_data(self, validation=True):
+        """Validates and returns a copy of the data to be encoded by to_dict."""
+        if validation and self.do_validation:
             self._validate_props()
             self.validate()
 
         if self.properties:
-            return encode_to_dict(self.resource)
+            if self.resource is self.properties:
+                return dict(self.properties)
+            d = dict(self.resource)
+            d[self._class_meta().dictname] = dict(self.properties)
+            return d
         elif hasattr(self, "resource_type"):
             d = {}
             for k, v in self.resource.items():
@@ -319,15 +685,23 @@ class BaseAWSObject:
     def from_dict(cls, title, d):
         return cls._from_dict(title, **d)
 
-    def _validate_props(self):
-        for k, (_, required) in self.props.items():
-            if required and k not in self.properties:
+    def _required_errors(self):
+        """Returns (name, ValueError) for each required property not set."""
+        errors = []
+        for k in self._class_meta().required:
+            if k not in self.properties:
                 rtype = getattr(self, "resource_type", "<unknown type>")
                 title = getattr(self, "title")
                 msg = "Resource %s required in type %s" % (k, rtype)
                 if title:
                     msg += " (title: %s)" % title
-                raise ValueError(msg)
+                errors.append((k, ValueError(msg)))
+        return errors
+
+    def _validate_props(self):
+        errors = self._required_errors()
+        if errors:
+            raise errors[0][1]
 
 
 class AWSObject(BaseAWSObject):
@@ -405,7 +779,16 @@ class AWSHelperFn:
             return data
 
     def to_dict(self):
-        return encode_to_dict(self.data)
+        return encode_to_dict(self._to_dict_data())
+
+    def _to_dict_data(self, validation=True):
+        """Returns a copy of the data to be encoded by to_dict."""
+        data = self.data
+        if type(data) is dict:
+            return dict(data)
+        elif type(data) is list:
+            return list(data)
+        return data
 
 
 class GenericHelperFn(AWSHelperFn):
@@ -415,7 +798,7 @@ class GenericHelperFn(AWSHelperFn):
         self.data = self.getdata(data)
 
     def to_dict(self):
-        return encode_to_dict(self.data)
+        return encode_to_dict(self._to_dict_data())
 
 
 class Base64(AWSHelperFn):
@@ -587,27 +970,85 @@ class Tags(AWSHelperFn):
         return newtags
 
     def to_dict(self):
-        return [encode_to_dict(tag) for tag in self.tags]
+        return encode_to_dict(self._to_dict_data())
+
+    def _to_dict_data(self, validation=True):
+        return list(self.tags)
 
     @classmethod
     def from_dict(cls, title=None, **kwargs):
         return cls(**kwargs)
 
 
-class Template:
-    from troposphere.serverless import Globals
+_inline_encoders.update(
+    [BaseAWSObject.to_dict, AWSHelperFn.to_dict, GenericHelperFn.to_dict, Tags.to_dict]
+)
 
-    props = {
-        "AWSTemplateFormatVersion": (str, False),
-        "Transform": (str, False),
-        "Description": (str, False),
-        "Parameters": (dict, False),
-        "Mappings": (dict, False),
-        "Resources": (dict, False),
-        "Globals": (Globals, False),
-        "Outputs": (dict, False),
-        "Rules": (dict, False),
-    }
+
+def _nested_objects(obj):
+    """Yields obj and the troposphere objects nested inside of it."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseAWSObject):
+            yield value
+            stack.extend(value.resource.values())
+        elif isinstance(value, Tags):
+            stack.extend(value.tags)
+        elif isinstance(value, AWSHelperFn):
+            stack.append(value.data)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+def _add_owner(obj, resource):
+    """Records that obj is nested in resource.
+
+    Setting an attribute on obj then marks resource as changed. Only weak
+    references to the resources are kept, so the objects they contain
+    don't keep them alive.
+    """
+    if obj._owners is None:
+        object.__setattr__(obj, "_owners", {})
+    obj._owners[id(resource)] = weakref.ref(resource)
+
+
+def _digest(value):
+    """Returns the SHA-256 hex digest of an encoded value's canonical JSON."""
+    text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class _TemplateProps:
+    """
+    Template.props, built on first use so that troposphere.serverless is
+    only imported when Globals are needed.
+    """
+
+    props = None
+
+    def __get__(self, obj, objtype=None):
+        if self.props is None:
+            from troposphere.serverless import Globals
+
+            self.props = {
+                "AWSTemplateFormatVersion": (str, False),
+                "Transform": (str, False),
+                "Description": (str, False),
+                "Parameters": (dict, False),
+                "Mappings": (dict, False),
+                "Resources": (dict, False),
+                "Globals": (Globals, False),
+                "Outputs": (dict, False),
+                "Rules": (dict, False),
+            }
+        return self.props
+
+
+class Template:
+    props = _TemplateProps()
 
     def __init__(self, Description=None, Metadata=None):  # noqa: N803
         self.description = Description
@@ -621,6 +1062,8 @@ class Template:
         self.globals = None
         self.version = None
         self.transform = None
+        self._graph = None
+        self._resource_cache = False
 
     def set_description(self, description):
         self.description = description
@@ -674,7 +1117,30 @@ class Template:
     def add_resource(self, resource):
         if len(self.resources) >= MAX_RESOURCES:
             raise ValueError("Maximum number of resources %d reached" % MAX_RESOURCES)
-        return self._update(self.resources, resource)
+        self._update(self.resources, resource)
+        if self._graph is not None:
+            for r in resource if isinstance(resource, list) else [resource]:
+                self._graph.add(r.title, r)
+        return resource
+
+    def dependency_graph(self, rebuild=False):
+        """
+        Returns the DependencyGraph of the resources in the template.
+
+        The graph is kept up to date as resources are added, replaced or
+        changed, and only those resources are scanned again on later calls.
+        Changes made in place to plain dicts and lists (e.g. appending to
+        a list property) or to helper functions are not seen, use
+        rebuild=True to scan all the resources again after those.
+        """
+        from troposphere.graph import DependencyGraph
+
+        if self._graph is None or rebuild:
+            self._graph = DependencyGraph(self.resources, self.parameters)
+        else:
+            self._graph.parameters = self.parameters
+            self._graph.update(self.resources)
+        return self._graph
 
     def add_rule(self, name, rule):
         """
@@ -706,7 +1172,7 @@ class Template:
             )
         self.transform = transform
 
-    def set_globals(self, globals: Globals):
+    def set_globals(self, globals: "Globals"):
         from troposphere.serverless import SERVERLESS_TRANSFORM
 
         if self.transform != SERVERLESS_TRANSFORM:
@@ -715,7 +1181,71 @@ class Template:
             )
         self.globals = globals
 
-    def to_dict(self):
+    def set_resource_cache(self, enabled=True):
+        """
+        Caches the validated, encoded form of each resource so rendering
+        the template again only encodes the resources changed since.
+
+        Setting an attribute on a resource, or on an object nested in it,
+        marks the resource as changed. Changes made in place to plain
+        dicts and lists (e.g. appending to a list property) or to helper
+        functions are not seen, call clear_resource_cache() after those.
+        """
+        self._resource_cache = enabled
+        if not enabled:
+            self.clear_resource_cache()
+
+    def clear_resource_cache(self):
+        for resource in self.resources.values():
+            if isinstance(resource, BaseAWSObject):
+                object.__setattr__(resource, "_encoded", None)
+
+    def _encode_resources(self, validation):
+        """Returns the resources with the cached encoded form of each."""
+        resources = {}
+        for title, resource in self.resources.items():
+            if not isinstance(resource, BaseAWSObject):
+                resources[title] = resource
+                continue
+            cached = resource._encoded
+            if cached is None or (validation and not cached[0]):
+                encoded = _encode_shared(resource, validation)
+                # [validated, encoded form, fingerprint once computed]
+                cached = [validation, encoded, None]
+                object.__setattr__(resource, "_encoded", cached)
+                for obj in _nested_objects(resource):
+                    _add_owner(obj, resource)
+            resources[title] = cached[1]
+        return resources
+
+    def to_dict(self, validation=True):
+        return self._encode(validation, share=False)
+
+    def _encode(self, validation=True, share=True):
+        """
+        Returns the encoded template. With share=True the encoded form of
+        objects found in several places, and with the resource cache on
+        the cached encoded resources, are shared: it must not be modified.
+        """
+        data = self._to_dict_data(validation)
+        encode = _encode_shared if share else encode_to_dict
+        if not self._resource_cache:
+            return encode(data, validation)
+        # The cached resources are already encoded, skip walking them again
+        resources = data.pop("Resources")
+        t = encode(data, validation)
+        if share:
+            t["Resources"] = resources
+        else:
+            # Copy the cached resources so changes to the result don't
+            # reach the cache
+            t["Resources"] = {
+                title: _copy_encoded(resource) for title, resource in resources.items()
+            }
+        return t
+
+    def _to_dict_data(self, validation=True):
+        """Returns the template sections to be encoded."""
         t = {}
         if self.description:
             t["Description"] = self.description
@@ -737,9 +1267,12 @@ class Template:
             t["Rules"] = self.rules
         if self.globals:
             t["Globals"] = self.globals
-        t["Resources"] = self.resources
+        if self._resource_cache:
+            t["Resources"] = self._encode_resources(validation)
+        else:
+            t["Resources"] = self.resources
 
-        return encode_to_dict(t)
+        return t
 
     def set_parameter_label(self, parameter, label):
         """
@@ -787,19 +1320,261 @@ class Template:
 
         return group_name
 
-    def to_json(self, indent=4, sort_keys=True, separators=(",", ": ")):
-        return json.dumps(
-            self.to_dict(), indent=indent, sort_keys=sort_keys, separators=separators
+    def to_json(
+        self,
+        indent=4,
+        sort_keys=True,
+        separators=(",", ": "),
+        validation=True,
+        minify=False,
+    ):
+        """
+        Returns the template as JSON.
+
+        With minify=True the smallest body is produced: no whitespace and
+        non-ASCII characters written as UTF-8 rather than escaped, so the
+        size to compare to MAX_TEMPLATE_BODY_SIZE is that of the UTF-8
+        encoded text. indent and separators are then ignored.
+
+        The JSON is produced by the backend set with
+        troposphere.json_backend.set_backend(), by default orjson if it is
+        installed, with the same output as json.dumps().
+        """
+        from troposphere import json_backend
+
+        if minify:
+            indent, separators = None, MINIFIED_SEPARATORS
+        return json_backend.dumps(
+            self._render_data(validation, encoded=True),
+            indent=indent,
+            sort_keys=sort_keys,
+            separators=separators,
+            ensure_ascii=not minify,
         )
 
-    def to_yaml(self, clean_up=False, long_form=False, sort_keys=True):
-        return cfn_flip.to_yaml(
-            self.to_json(sort_keys=sort_keys), clean_up=clean_up, long_form=long_form
+    def write_json(
+        self,
+        fp,
+        indent=4,
+        sort_keys=True,
+        separators=(",", ": "),
+        validation=True,
+        minify=False,
+    ):
+        """
+        Writes the same JSON as to_json() to the file-like object fp.
+
+        Resources are encoded and written one at a time rather than building
+        the whole encoded template and JSON string in memory first. If a
+        resource fails validation, the preceding output has already been
+        written to fp.
+        """
+        from troposphere import json_writer
+
+        if minify:
+            indent, separators = None, MINIFIED_SEPARATORS
+        json_writer.dump(
+            self._render_data(validation),
+            fp,
+            indent=indent,
+            sort_keys=sort_keys,
+            separators=separators,
+            ensure_ascii=not minify,
+            validation=validation,
         )
 
+    def write_yaml(
+        self,
+        fp,
+        clean_up=False,
+        long_form=False,
+        sort_keys=True,
+        validation=True,
+        minify=False,
+    ):
+        """
+        Writes the same YAML as to_yaml() to the file-like object fp.
+        """
+        from troposphere import yaml_writer
+
+        if self._overrides("to_json") and not self._overrides("to_dict"):
+            # The YAML was once converted from the output of to_json()
+            kwargs = {} if validation else {"validation": False}
+            data = json.loads(self.to_json(sort_keys=sort_keys, **kwargs))
+        else:
+            data = self._render_data(validation)
+        yaml_writer.dump(
+            data,
+            fp,
+            clean_up=clean_up,
+            long_form=long_form,
+            sort_keys=sort_keys,
+            validation=validation,
+            minify=minify,
+        )
+
+    def to_yaml(
+        self,
+        clean_up=False,
+        long_form=False,
+        sort_keys=True,
+        validation=True,
+        minify=False,
+    ):
+        """
+        Returns the template as YAML.
+
+        With minify=True the short form of the functions is always used
+        and long strings are not folded over several lines.
+        """
+        fp = io.StringIO()
+        self.write_yaml(
+            fp,
+            clean_up=clean_up,
+            long_form=long_form,
+            sort_keys=sort_keys,
+            validation=validation,
+            minify=minify,
+        )
+        return fp.getvalue()
+
+    def _overrides(self, name):
+        """Returns True if a subclass overrides the method name."""
+        return getattr(type(self), name) is not getattr(Template, name)
+
+    def _render_data(self, validation=True, encoded=False):
+        """
+        Returns the data written by the JSON and YAML renderers: the output
+        of to_dict() if a subclass overrides it, else the template sections,
+        already encoded if encoded=True.
+        """
+        if self._overrides("to_dict"):
+            # Overrides may predate the validation argument
+            if validation:
+                return self.to_dict()
+            return self.to_dict(validation=False)
+        if encoded:
+            return self._encode(validation)
+        return self._to_dict_data(validation)
+
+    def size_report(self, validation=True):
+        """
+        Returns a SizeReport with the byte count of the pretty (to_json())
+        and minified (to_json(minify=True)) body, of each section and of
+        each resource, to compare against MAX_TEMPLATE_BODY_SIZE.
+        """
+        from troposphere.size import size_report
+
+        return size_report(self, validation)
+
+    def validate_all(self, executor=None):
+        """
+        Validates every parameter, output and resource and raises a
+        ValidationError listing all of the errors found, each with its path
+        in the template such as Resources.Asg.Properties.LaunchTemplate.Version.
+
+        Resources are validated independently so they can be spread over
+        the workers of a concurrent.futures executor (thread or process
+        pool). Once validated, the template can be rendered any number of
+        times with validation=False.
+        """
+        from troposphere.validation import ValidationError, validate_template
+
+        errors = validate_template(self, executor)
+        if errors:
+            raise ValidationError(errors)
+
+    def fold_constants(self, parameters=None, use_defaults=False):
+        """
+        Rewrites the intrinsic functions of the resources and outputs which
+        can be resolved at build time to their values, in place.
+
+        :param parameters: a dict of parameter and pseudo parameter values,
+                           e.g. {"Env": "prod", "AWS::Region": "us-east-1"}
+        :param use_defaults: also use the Default of each parameter
+
+        Fn::If with a known condition is replaced by the chosen branch,
+        Condition attributes which are known to be true are dropped and
+        conditions no longer referenced are removed. Returns the names of
+        the removed conditions.
+        """
+        from troposphere.intrinsics import fold_template
+
+        removed = fold_template(self, parameters, use_defaults)
+        self.clear_resource_cache()
+        return removed
+
+    def prune(self, remove_resources=False, parameters=None):
+        """
+        Removes the parameters, mappings and conditions which are not used
+        by any Ref, Fn::FindInMap, Condition, Fn::If or Fn::Sub of the
+        resources, outputs and rules. Runs in linear time in the size of
+        the template.
+
+        :param remove_resources: also remove the resources and outputs
+                                 whose Condition is statically false
+        :param parameters: a dict of parameter and pseudo parameter values
+                           used to evaluate the conditions
+
+        Returns a dict mapping each of Resources, Outputs, Parameters,
+        Mappings and Conditions to the list of the names removed.
+        """
+        from troposphere.prune import prune_template
+
+        removed = prune_template(self, remove_resources, parameters)
+        if removed["Resources"]:
+            self._graph = None
+            self.clear_resource_cache()
+        return removed
+
+    def resource_fingerprints(self):
+        """
+        Returns the fingerprint of each resource: the SHA-256 hex digest
+        of its encoded form, which is the same for equal resources.
+
+        Without set_resource_cache() every resource is encoded and hashed
+        on each call, which costs about as much as rendering the template.
+        With it the fingerprints are cached along with the encoded
+        resources and only recomputed for changed resources.
+        """
+        if not self._resource_cache:
+            return {
+                title: _digest(_encode_shared(resource))
+                for title, resource in self.resources.items()
+            }
+        encoded = self._encode_resources(True)
+        fingerprints = {}
+        for title, resource in self.resources.items():
+            cached = resource._encoded if isinstance(resource, BaseAWSObject) else None
+            if cached is None:
+                fingerprints[title] = _digest(encoded[title])
+                continue
+            if cached[2] is None:
+                cached[2] = _digest(cached[1])
+            fingerprints[title] = cached[2]
+        return fingerprints
+
+    def fingerprint(self):
+        """
+        Returns the SHA-256 hex digest of the template, built from the
+        resource fingerprints and the encoded form of the other sections.
+        Templates with the same fingerprint have the same to_json() output.
+
+        This encodes the whole template unless set_resource_cache() is on,
+        so turn the cache on for templates fingerprinted or compared more
+        than once.
+        """
+        data = self._to_dict_data()
+        data["Resources"] = self.resource_fingerprints()
+        return _digest(_encode_shared(data))
+
     def __eq__(self, other):
+        """
+        Compares the fingerprint() of the templates, which is only cheap for
+        templates with set_resource_cache() on.
+        """
         if isinstance(other, Template):
-            return self.to_json() == other.to_json()
+            return self.fingerprint() == other.fingerprint()
         else:
             return False
 
@@ -807,7 +1582,7 @@ class Template:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.to_json())
+        return hash(self.fingerprint())
 
 
 class Export(AWSHelperFn):
@@ -909,3 +1684,32 @@ class Parameter(AWSDeclaration):
                     raise ValueError(
                         "%s can only be used with parameters of " "the Number type." % p
                     )
+
+
+def __getattr__(name):
+    """Imports troposphere submodules on first access, see PEP 562."""
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "%s.%s" % (__name__, name):
+                raise
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    import pkgutil
+
+    return sorted(set(globals()) | {m.name for m in pkgutil.iter_modules(__path__)})
+
+
+def _import_submodules():
+    import pkgutil
+
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module("." + module.name, __name__)
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7, import all the submodules instead
+    _import_submodules()
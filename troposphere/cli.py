@@ -0,0 +1,39 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+The troposphere command.
+
+    troposphere deploy [options] NAME[@REGION]=SOURCE ...
+"""
+
+import argparse
+import sys
+
+
+def main(argv=None):
+    from troposphere import __version__, deploy
+
+    parser = argparse.ArgumentParser(prog="troposphere")
+    parser.add_argument("--version", action="version", version=__version__)
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+    deploy.add_arguments(
+        commands.add_parser(
+            "deploy",
+            help="deploy stacks with change sets",
+            description=deploy.__doc__.split("\n\n")[0].strip(),
+        )
+    )
+    args = parser.parse_args(argv)
+    # import module:attribute sources from the current directory
+    sys.path.insert(0, "")
+    try:
+        return deploy.run(args)
+    except (ImportError, OSError, TypeError, ValueError) as ex:
+        parser.exit(2, "troposphere: error: %s\n" % (ex,))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
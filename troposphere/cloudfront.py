@@ -441,7 +441,7 @@ class FrameOptions(AWSProperty):
 class ReferrerPolicy(AWSProperty):
     props = {
         "Override": (boolean, True),
-        "ReferrerPolicy": (cloudfront_referrer_policy),
+        "ReferrerPolicy": (cloudfront_referrer_policy, True),
     }
 
 
@@ -0,0 +1,643 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Deploy templates to CloudFormation with change sets.
+
+Stacks are deployed concurrently from a thread pool. The CloudFormation
+and S3 clients are created once per region and shared by the threads.
+Each stack is fingerprinted from its template, parameters and tags, and
+the fingerprint is recorded in the FINGERPRINT_TAG stack tag when it is
+deployed. A stack whose recorded fingerprint matches, and whose deployed
+template, parameters and tags still match, is skipped without creating a
+change set. Template bodies over MAX_TEMPLATE_BODY_SIZE are uploaded to
+an S3 bucket and passed by URL, smaller ones inline.
+
+boto3 is required unless a client_factory is given, which is how the
+tests run against stub clients. For local stub endpoints (moto server,
+LocalStack, ...) give endpoint_url and s3_endpoint_url.
+
+Usage:
+    deployer = Deployer(bucket="my-templates")
+    for result in deployer.deploy([Stack("web", template), ...]):
+        print(result.stack.name, result.status)
+
+or from the command line:
+    troposphere deploy web=stacks/web.py:template db@eu-west-1=db.yaml
+"""
+
+import collections
+import concurrent.futures
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+from urllib.parse import quote
+
+from troposphere import (
+    MAX_TEMPLATE_BODY_SIZE,
+    MAX_TEMPLATE_URL_SIZE,
+    MINIFIED_SEPARATORS,
+    Template,
+    _digest,
+)
+
+DEFAULT_REGION = "us-east-1"
+
+# Stack tag recording the fingerprint a stack was deployed with
+FINGERPRINT_TAG = "troposphere:fingerprint"
+
+# Statuses of DeployResult
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NO_CHANGES = "no changes"
+PENDING = "pending"
+FAILED = "failed"
+
+# Change set failure reasons meaning there was nothing to change
+_NO_CHANGES_REASONS = ("didn't contain changes", "No updates are to be performed")
+
+DeployResult = collections.namedtuple(
+    "DeployResult", "stack status fingerprint change_set reason"
+)
+DeployResult.__doc__ = """
+The outcome of deploying a Stack: status is one of CREATED, UPDATED,
+UNCHANGED (same fingerprint, no change set made), NO_CHANGES (the change
+set was empty), PENDING (change set not executed) or FAILED with the
+reason.
+"""
+
+
+def _load_body(body):
+    """Returns the template data of a JSON or YAML template body."""
+    from cfn_flip import load
+
+    return load(body)[0]
+
+
+def _parameter_value(value):
+    if isinstance(value, list):
+        return ",".join(str(v) for v in value)
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def _is_no_echo(parameter):
+    return str(parameter.get("NoEcho", "false")).lower() == "true"
+
+
+def _fingerprint(data, parameters, tags, masked=False):
+    no_echo = ()
+    if masked:
+        # DescribeStacks masks the values of NoEcho parameters, only their
+        # names can be compared
+        no_echo = {
+            name
+            for name, parameter in data.get("Parameters", {}).items()
+            if _is_no_echo(parameter)
+        }
+    return _digest(
+        {
+            "Template": data,
+            "Parameters": {
+                k: None if k in no_echo else _parameter_value(v)
+                for k, v in parameters.items()
+            },
+            "Tags": tags,
+        }
+    )
+
+
+class Stack:
+    """
+    A stack to deploy: a Template object or a JSON or YAML template body,
+    the region and the parameter values, capabilities and tags to use.
+    """
+
+    def __init__(
+        self,
+        name,
+        template,
+        region=None,
+        parameters=None,
+        capabilities=None,
+        tags=None,
+    ):
+        self.name = name
+        self.template = template
+        self.region = region or DEFAULT_REGION
+        self.parameters = dict(parameters or {})
+        self.capabilities = list(capabilities or [])
+        self.tags = dict(tags or {})
+        self._body = None
+        self._data = None
+
+    def __repr__(self):
+        return "Stack(%r, region=%r)" % (self.name, self.region)
+
+    def body(self):
+        """Returns the template body, minified if built from a Template."""
+        if self._body is None:
+            if isinstance(self.template, Template):
+                self._data = self.template.to_dict()
+                from troposphere import json_backend
+
+                self._body = json_backend.dumps(
+                    self._data,
+                    sort_keys=True,
+                    separators=MINIFIED_SEPARATORS,
+                    ensure_ascii=False,
+                )
+            else:
+                self._body = self.template
+        return self._body
+
+    def data(self):
+        """Returns the template as a dict."""
+        if self._data is None:
+            self._data = _load_body(self.body())
+        return self._data
+
+    def parameter_values(self):
+        """
+        Returns the parameter values the stack would be deployed with: the
+        given parameters over the defaults of the template, as strings.
+        """
+        values = {}
+        for name, parameter in self.data().get("Parameters", {}).items():
+            if "Default" in parameter:
+                values[name] = _parameter_value(parameter["Default"])
+        for name, value in self.parameters.items():
+            values[name] = _parameter_value(value)
+        return values
+
+    def fingerprint(self):
+        """
+        Returns the SHA-256 hex digest of the template, parameter values
+        and tags, recorded in the FINGERPRINT_TAG of the deployed stack.
+
+        The values of NoEcho parameters are included, so a value which
+        can be guessed could be found from the tag by trying values.
+        """
+        return _fingerprint(self.data(), self.parameter_values(), self.tags)
+
+    def _masked_fingerprint(self):
+        """
+        Returns the fingerprint deployed_fingerprint() computes once the
+        stack is deployed, with only the names of NoEcho parameters.
+        """
+        return _fingerprint(
+            self.data(), self.parameter_values(), self.tags, masked=True
+        )
+
+
+def deployed_fingerprint(description, body):
+    """
+    Returns the fingerprint of a deployed stack from its DescribeStacks
+    description and its GetTemplate TemplateBody (a str, or a dict when
+    boto3 has already decoded the JSON).
+
+    DescribeStacks masks the values of NoEcho parameters, so only their
+    names are used, and FINGERPRINT_TAG is left out of the tags. This is
+    the same as Stack.fingerprint() for stacks without NoEcho parameters.
+    """
+    data = _load_body(body) if isinstance(body, str) else body
+    parameters = {
+        p["ParameterKey"]: p.get("ParameterValue", "")
+        for p in description.get("Parameters", [])
+    }
+    tags = {
+        t["Key"]: t["Value"]
+        for t in description.get("Tags", [])
+        if t["Key"] != FINGERPRINT_TAG
+    }
+    return _fingerprint(data, parameters, tags, masked=True)
+
+
+def _error_message(ex):
+    """Returns the message of a botocore ClientError, or str(ex)."""
+    response = getattr(ex, "response", None)
+    if isinstance(response, dict) and "Error" in response:
+        return response["Error"].get("Message", str(ex))
+    return str(ex)
+
+
+def _is_missing_stack(ex):
+    return "does not exist" in _error_message(ex)
+
+
+class Deployer:
+    """
+    Deploys stacks with up to jobs of them at a time.
+
+    Each deployment describes the stack, compares fingerprints, creates a
+    change set, waits for it and, with execute=True, executes it and waits
+    for the stack to finish updating. Pass force=True to create a change
+    set even when the fingerprints match, e.g. after changing the stack
+    outside of troposphere.
+
+    Bodies over MAX_TEMPLATE_BODY_SIZE are uploaded to bucket under
+    prefix; the deployment fails if there is no bucket to upload to.
+
+    client_factory(service, region) returns the client of a service; by
+    default boto3 clients with endpoint_url and s3_endpoint_url, sized to
+    keep a connection for each thread.
+    """
+
+    def __init__(
+        self,
+        bucket=None,
+        prefix="",
+        s3_region=None,
+        jobs=8,
+        execute=True,
+        force=False,
+        poll_interval=5.0,
+        endpoint_url=None,
+        s3_endpoint_url=None,
+        client_factory=None,
+        log_func=None,
+    ):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.s3_region = s3_region
+        self.jobs = jobs
+        self.execute = execute
+        self.force = force
+        self.poll_interval = poll_interval
+        self.endpoint_url = endpoint_url
+        self.s3_endpoint_url = s3_endpoint_url
+        self.client_factory = client_factory or self._boto3_client
+        self.log_func = log_func
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._session = None
+
+    def _boto3_client(self, service, region):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise ImportError(
+                "boto3 is required to deploy: pip install troposphere[deploy]"
+            )
+        if self._session is None:
+            self._session = boto3.session.Session()
+        endpoint_url = self.s3_endpoint_url if service == "s3" else self.endpoint_url
+        return self._session.client(
+            service,
+            region_name=region,
+            endpoint_url=endpoint_url,
+            config=Config(max_pool_connections=max(self.jobs, 10)),
+        )
+
+    def client(self, service, region):
+        """Returns the client of a service in a region, made on first use."""
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            # boto3 sessions are not thread safe, the clients they make are
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.client_factory(service, region)
+                    self._clients[key] = client
+        return client
+
+    def _log(self, stack, msg):
+        if self.log_func is not None:
+            self.log_func("%s: %s" % (stack.name, msg))
+
+    def deploy(self, stacks):
+        """Deploys the stacks, returning a DeployResult for each in order."""
+        stacks = list(stacks)
+        if len(stacks) <= 1 or self.jobs <= 1:
+            return [self.deploy_stack(stack) for stack in stacks]
+        with concurrent.futures.ThreadPoolExecutor(self.jobs) as executor:
+            return list(executor.map(self.deploy_stack, stacks))
+
+    def deploy_stack(self, stack):
+        """Deploys a stack, returning a DeployResult."""
+        fingerprint = None
+        change_set = None
+        try:
+            fingerprint = stack.fingerprint()
+            cfn = self.client("cloudformation", stack.region)
+            description = self._describe(cfn, stack)
+            status = description and description["StackStatus"]
+            if status == "REVIEW_IN_PROGRESS":
+                # created by a change set never executed
+                description = None
+            elif status is not None and (
+                status.endswith("_IN_PROGRESS") or status == "ROLLBACK_COMPLETE"
+            ):
+                return DeployResult(
+                    stack, FAILED, fingerprint, None, "stack is %s" % status
+                )
+
+            if description is not None and not self.force:
+                tags = {t["Key"]: t["Value"] for t in description.get("Tags", [])}
+                # The recorded fingerprint covers the values of NoEcho
+                # parameters, the deployed one changes made outside of
+                # troposphere to the rest
+                if (
+                    tags.get(FINGERPRINT_TAG) == fingerprint
+                    and self._deployed_fingerprint(cfn, stack, description)
+                    == stack._masked_fingerprint()
+                ):
+                    self._log(stack, "unchanged")
+                    return DeployResult(stack, UNCHANGED, fingerprint, None, None)
+
+            change_set = "troposphere-%s-%d" % (fingerprint[:12], time.time())
+            change_set_type = "UPDATE" if description else "CREATE"
+            args = {
+                "StackName": stack.name,
+                "ChangeSetName": change_set,
+                "ChangeSetType": change_set_type,
+                "Parameters": [
+                    {"ParameterKey": k, "ParameterValue": _parameter_value(v)}
+                    for k, v in stack.parameters.items()
+                ],
+                "Capabilities": stack.capabilities,
+                "Tags": [
+                    {"Key": k, "Value": v}
+                    for k, v in dict(
+                        stack.tags, **{FINGERPRINT_TAG: fingerprint}
+                    ).items()
+                ],
+            }
+            args.update(self._template_args(stack, fingerprint))
+            cfn.create_change_set(**args)
+            self._log(stack, "created change set %s" % change_set)
+
+            result = self._wait_change_set(cfn, stack, change_set)
+            if result is not None:
+                status, reason = result
+                if status == NO_CHANGES:
+                    cfn.delete_change_set(
+                        StackName=stack.name, ChangeSetName=change_set
+                    )
+                    change_set = None
+                return DeployResult(stack, status, fingerprint, change_set, reason)
+
+            if not self.execute:
+                return DeployResult(stack, PENDING, fingerprint, change_set, None)
+
+            cfn.execute_change_set(StackName=stack.name, ChangeSetName=change_set)
+            self._log(stack, "executing change set")
+            status, reason = self._wait_stack(cfn, stack)
+            if status.endswith("_COMPLETE") and "ROLLBACK" not in status:
+                status = CREATED if change_set_type == "CREATE" else UPDATED
+                self._log(stack, status)
+                return DeployResult(stack, status, fingerprint, change_set, None)
+            return DeployResult(
+                stack, FAILED, fingerprint, change_set, reason or status
+            )
+        except ImportError:
+            raise
+        except Exception as ex:
+            self._log(stack, "failed: %s" % _error_message(ex))
+            return DeployResult(
+                stack, FAILED, fingerprint, change_set, _error_message(ex)
+            )
+
+    def _describe(self, cfn, stack):
+        """Returns the description of the stack or None if it is missing."""
+        try:
+            stacks = cfn.describe_stacks(StackName=stack.name)["Stacks"]
+        except Exception as ex:
+            if _is_missing_stack(ex):
+                return None
+            raise
+        return stacks[0] if stacks else None
+
+    def _deployed_fingerprint(self, cfn, stack, description):
+        body = cfn.get_template(StackName=stack.name, TemplateStage="Original")[
+            "TemplateBody"
+        ]
+        return deployed_fingerprint(description, body)
+
+    def _template_args(self, stack, fingerprint):
+        """
+        Returns TemplateBody, or TemplateURL once uploaded to S3 if the
+        body is over MAX_TEMPLATE_BODY_SIZE.
+        """
+        body = stack.body()
+        size = len(body.encode("utf-8"))
+        if size <= MAX_TEMPLATE_BODY_SIZE:
+            return {"TemplateBody": body}
+        if size > MAX_TEMPLATE_URL_SIZE:
+            raise ValueError(
+                "Template body is %d bytes, over the %d bytes limit; "
+                "split it into nested stacks" % (size, MAX_TEMPLATE_URL_SIZE)
+            )
+        if not self.bucket:
+            raise ValueError(
+                "Template body is %d bytes, over the %d bytes inline limit; "
+                "a bucket is needed to upload it" % (size, MAX_TEMPLATE_BODY_SIZE)
+            )
+        s3 = self.client("s3", self.s3_region or stack.region)
+        key = "%s%s-%s.json" % (self.prefix, stack.name, fingerprint[:16])
+        s3.put_object(Bucket=self.bucket, Key=key, Body=body.encode("utf-8"))
+        self._log(stack, "uploaded %d bytes to s3://%s/%s" % (size, self.bucket, key))
+        url = "%s/%s/%s" % (s3.meta.endpoint_url.rstrip("/"), self.bucket, quote(key))
+        return {"TemplateURL": url}
+
+    def _wait_change_set(self, cfn, stack, change_set):
+        """
+        Waits for the change set to be created; returns None if it is
+        ready to execute, otherwise (status, reason).
+        """
+        while True:
+            description = cfn.describe_change_set(
+                StackName=stack.name, ChangeSetName=change_set
+            )
+            status = description["Status"]
+            if status == "CREATE_COMPLETE":
+                return None
+            if status == "FAILED":
+                reason = description.get("StatusReason", "")
+                if any(r in reason for r in _NO_CHANGES_REASONS):
+                    self._log(stack, "no changes")
+                    return NO_CHANGES, None
+                return FAILED, reason
+            time.sleep(self.poll_interval)
+
+    def _wait_stack(self, cfn, stack):
+        """Waits for the stack to settle; returns (status, reason)."""
+        while True:
+            description = cfn.describe_stacks(StackName=stack.name)["Stacks"][0]
+            status = description["StackStatus"]
+            if not status.endswith("_IN_PROGRESS"):
+                return status, description.get("StackStatusReason")
+            time.sleep(self.poll_interval)
+
+
+def load_template(source):
+    """
+    Returns a template from a file (.json, .yaml, .yml or .template) as
+    its body, or from "module:attribute" or "path/to/file.py:attribute" as
+    the Template object, or the Template returned by calling the attribute.
+    """
+    if os.path.splitext(source)[1] in (".json", ".yaml", ".yml", ".template"):
+        with open(source, encoding="utf-8") as f:
+            return f.read()
+    module_name, _, name = source.partition(":")
+    if not name:
+        raise ValueError("%s: expected a template file or module:attribute" % (source,))
+    if module_name.endswith(".py"):
+        module_name, path = os.path.basename(module_name)[:-3], module_name
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+    value = getattr(module, name)
+    if callable(value) and not isinstance(value, Template):
+        value = value()
+    if not isinstance(value, Template):
+        raise TypeError("%s is not a Template" % (source,))
+    return value
+
+
+def parse_stack(spec, region=None, **kwargs):
+    """Returns the Stack of a "NAME[@REGION]=SOURCE" command line argument."""
+    name, sep, source = spec.partition("=")
+    if not sep or not name or not source:
+        raise ValueError("%s: expected NAME[@REGION]=SOURCE" % (spec,))
+    name, _, stack_region = name.partition("@")
+    return Stack(name, load_template(source), stack_region or region, **kwargs)
+
+
+def _key_values(values):
+    result = {}
+    for value in values or []:
+        key, sep, value = value.partition("=")
+        if not sep:
+            raise ValueError("%s: expected KEY=VALUE" % (key,))
+        result[key] = value
+    return result
+
+
+def add_arguments(parser):
+    """Adds the deploy command line arguments to an argparse parser."""
+    parser.add_argument(
+        "stacks",
+        nargs="+",
+        metavar="NAME[@REGION]=SOURCE",
+        help="stack to deploy from a template file or a module:attribute "
+        "Template (or function returning one)",
+    )
+    parser.add_argument(
+        "-r",
+        "--region",
+        default=os.environ.get("AWS_DEFAULT_REGION", DEFAULT_REGION),
+        help="default region (default %(default)s)",
+    )
+    parser.add_argument(
+        "-p",
+        "--parameter",
+        dest="parameters",
+        action="append",
+        metavar="KEY=VALUE",
+        help="stack parameter, for all stacks",
+    )
+    parser.add_argument(
+        "-t",
+        "--tag",
+        dest="tags",
+        action="append",
+        metavar="KEY=VALUE",
+        help="stack tag, for all stacks",
+    )
+    parser.add_argument(
+        "-C",
+        "--capability",
+        dest="capabilities",
+        action="append",
+        help="capability to allow in the stacks",
+    )
+    parser.add_argument(
+        "-b", "--bucket", help="S3 bucket for templates over the inline limit"
+    )
+    parser.add_argument("--prefix", default="", help="S3 key prefix")
+    parser.add_argument(
+        "-s", "--s3-region", help="region of the bucket (default: stack region)"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=8,
+        help="stacks deployed at a time (default %(default)s)",
+    )
+    parser.add_argument(
+        "--no-execute",
+        dest="execute",
+        action="store_false",
+        help="create the change sets without executing them",
+    )
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="create change sets for stacks with unchanged fingerprints, "
+        "e.g. after changing them outside of troposphere",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=5.0,
+        help="seconds between status checks (default %(default)s)",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only print the results"
+    )
+    parser.add_argument("--endpoint-url", help="CloudFormation endpoint URL")
+    parser.add_argument("--s3-endpoint-url", help="S3 endpoint URL")
+
+
+def run(args, client_factory=None, out=None):
+    """
+    Deploys the stacks of parsed command line arguments, printing a line
+    per stack; returns the exit status, 1 if any deployment failed.
+    """
+    out = out or sys.stdout
+    kwargs = dict(
+        parameters=_key_values(args.parameters),
+        capabilities=args.capabilities,
+        tags=_key_values(args.tags),
+    )
+    stacks = [parse_stack(spec, args.region, **kwargs) for spec in args.stacks]
+    deployer = Deployer(
+        bucket=args.bucket,
+        prefix=args.prefix,
+        s3_region=args.s3_region,
+        jobs=args.jobs,
+        execute=args.execute,
+        force=args.force,
+        poll_interval=args.poll_interval,
+        endpoint_url=args.endpoint_url,
+        s3_endpoint_url=args.s3_endpoint_url,
+        client_factory=client_factory,
+        log_func=None if args.quiet else lambda msg: print(msg, file=sys.stderr),
+    )
+    failed = False
+    for result in deployer.deploy(stacks):
+        stack = result.stack
+        print(
+            "%-40s %-12s %s"
+            % (
+                "%s@%s" % (stack.name, stack.region),
+                result.status,
+                result.reason or "",
+            ),
+            file=out,
+        )
+        failed = failed or result.status == FAILED
+    return 1 if failed else 0
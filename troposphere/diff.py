@@ -0,0 +1,210 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Structural diff of two templates.
+
+diff_templates() compares the Resources, Parameters, Outputs, Mappings and
+Conditions of two templates, given either as Template objects (including
+TemplateGenerator) or as template dicts such as loaded from JSON or YAML.
+Resources of two Template objects are first compared by their fingerprint
+so unchanged resources are skipped without encoding or walking them.
+
+Usage:
+    diff = diff_templates(old, new)
+    for title, changes in diff.resources.modified.items():
+        for change in changes:
+            print(title, change.path, change.old, change.new)
+"""
+
+import collections
+
+from . import Template, encode_to_dict
+
+SECTIONS = ("Resources", "Parameters", "Outputs", "Mappings", "Conditions")
+
+
+class _Absent:
+    def __repr__(self):
+        return "ABSENT"
+
+
+# The old or new value of a Change where the key or list item does not exist
+ABSENT = _Absent()
+
+Change = collections.namedtuple("Change", ["path", "old", "new"])
+Change.__doc__ = """A changed value, path is e.g. Properties.Tags[0].Value"""
+
+
+class SectionDiff:
+    """The names added, removed and modified in a section of a template.
+
+    modified maps each modified name to its list of Change.
+    """
+
+    def __init__(self, added=None, removed=None, modified=None):
+        self.added = [] if added is None else added
+        self.removed = [] if removed is None else removed
+        self.modified = {} if modified is None else modified
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    def __eq__(self, other):
+        if isinstance(other, SectionDiff):
+            return (self.added, self.removed, self.modified) == (
+                other.added,
+                other.removed,
+                other.modified,
+            )
+        return NotImplemented
+
+    def __repr__(self):
+        return "SectionDiff(added=%r, removed=%r, modified=%r)" % (
+            self.added,
+            self.removed,
+            self.modified,
+        )
+
+
+class TemplateDiff:
+    """The differences between two templates, with a SectionDiff per section.
+
+    A TemplateDiff is false when the templates are the same.
+    """
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    @property
+    def resources(self):
+        return self.sections["Resources"]
+
+    @property
+    def parameters(self):
+        return self.sections["Parameters"]
+
+    @property
+    def outputs(self):
+        return self.sections["Outputs"]
+
+    @property
+    def mappings(self):
+        return self.sections["Mappings"]
+
+    @property
+    def conditions(self):
+        return self.sections["Conditions"]
+
+    def __bool__(self):
+        return any(self.sections.values())
+
+    def __repr__(self):
+        return "TemplateDiff(%r)" % (self.sections,)
+
+
+def diff_values(old, new, path=""):
+    """Returns the list of Change between two encoded values."""
+    changes = []
+    stack = [(path, old, new)]
+    while stack:
+        path, old, new = stack.pop()
+        if old == new:
+            continue
+        prefix = path + "." if path else ""
+        if isinstance(old, dict) and isinstance(new, dict):
+            children = []
+            for k, v in old.items():
+                children.append((prefix + str(k), v, new.get(k, ABSENT)))
+            for k, v in new.items():
+                if k not in old:
+                    children.append((prefix + str(k), ABSENT, v))
+        elif isinstance(old, list) and isinstance(new, list):
+            children = []
+            for i in range(max(len(old), len(new))):
+                children.append(
+                    (
+                        "%s[%d]" % (path, i),
+                        old[i] if i < len(old) else ABSENT,
+                        new[i] if i < len(new) else ABSENT,
+                    )
+                )
+        else:
+            changes.append(Change(path, old, new))
+            continue
+        # Children are pushed in reverse so changes are in document order
+        stack.extend(reversed(children))
+    return changes
+
+
+def _sections(template, fingerprints):
+    """Returns {section: (items, fingerprints or None)} for a template."""
+    if isinstance(template, Template):
+        resources = template.resources
+        if template._resource_cache:
+            # Use the cached encoded resources
+            resources = template._encode_resources(True)
+        return {
+            "Resources": (
+                resources,
+                template.resource_fingerprints() if fingerprints else None,
+            ),
+            "Parameters": (template.parameters, None),
+            "Outputs": (template.outputs, None),
+            "Mappings": (template.mappings, None),
+            "Conditions": (template.conditions, None),
+        }
+    return {section: (template.get(section) or {}, None) for section in SECTIONS}
+
+
+def _diff_section(old, new):
+    old_items, old_fingerprints = old
+    new_items, new_fingerprints = new
+    diff = SectionDiff()
+    for name in old_items:
+        if name not in new_items:
+            diff.removed.append(name)
+    for name, new_value in new_items.items():
+        if name not in old_items:
+            diff.added.append(name)
+            continue
+        if old_fingerprints is not None and new_fingerprints is not None:
+            if old_fingerprints[name] == new_fingerprints[name]:
+                continue
+        changes = diff_values(
+            encode_to_dict(old_items[name]), encode_to_dict(new_value)
+        )
+        if changes:
+            diff.modified[name] = changes
+    return diff
+
+
+def diff_templates(old, new):
+    """Returns the TemplateDiff from the old to the new template.
+
+    old and new are Template objects or template dicts.
+    """
+    # Fingerprints are only cheaper than comparing the resources once they
+    # are memoized by the resource cache
+    fingerprints = all(
+        isinstance(t, Template) and t._resource_cache for t in (old, new)
+    )
+    old_sections = _sections(old, fingerprints)
+    new_sections = _sections(new, fingerprints)
+    return TemplateDiff(
+        {
+            section: _diff_section(old_sections[section], new_sections[section])
+            for section in SECTIONS
+        }
+    )
+
+
+__all__ = [
+    "ABSENT",
+    "Change",
+    "SectionDiff",
+    "TemplateDiff",
+    "diff_templates",
+    "diff_values",
+]
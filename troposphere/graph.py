@@ -0,0 +1,297 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Dependency graph of the resources in a template.
+
+The graph is an adjacency index of the explicit DependsOn attribute plus the
+implicit Ref, Fn::GetAtt and Fn::Sub references of each resource. It is
+built without validating or encoding the resources, and each resource is
+only scanned again once it changes so building the graph is linear in the
+template size.
+
+Usage:
+    graph = template.dependency_graph()
+    for title in graph.topological_order():
+        ...
+"""
+
+import re
+
+from . import AWSHelperFn, BaseAWSObject, Tags, _add_owner, encode_to_dict
+
+DEPENDS_ON = "DependsOn"
+REF = "Ref"
+GETATT = "GetAtt"
+SUB = "Sub"
+
+# Sub variables, excluding the ${!Literal} escape
+_SUB_VARIABLE = re.compile(r"\$\{([^!}][^}]*)\}")
+
+
+class CycleError(ValueError):
+    """Raised when the resources of a template depend on each other."""
+
+    def __init__(self, path):
+        self.path = path
+        super().__init__("Circular dependency: %s" % " -> ".join(path))
+
+
+def _title(value):
+    if isinstance(value, BaseAWSObject):
+        return value.title
+    return value
+
+
+def _sub_references(value, add):
+    """Adds the references made by the value of a Fn::Sub."""
+    if isinstance(value, list) and len(value) == 2:
+        text, variables = value
+        if not isinstance(variables, dict):
+            variables = {}
+    else:
+        text, variables = value, {}
+    if isinstance(text, str):
+        for name in _SUB_VARIABLE.findall(text):
+            name = name.strip()
+            if name not in variables:
+                add(name.split(".", 1)[0], SUB)
+    return variables.values()
+
+
+def _references(resource):
+    """Returns {target: set of kinds} for the references made by a resource.
+
+    Pseudo parameters (AWS::Region etc.) are not included. The resource is
+    recorded as the owner of the objects nested in it, so that changes to
+    them mark it as changed.
+    """
+    refs = {}
+    _add_owner(resource, resource)
+
+    def add(target, kind):
+        target = _title(target)
+        if isinstance(target, str) and not target.startswith("AWS::"):
+            refs.setdefault(target, set()).add(kind)
+
+    depends_on = resource.resource.get(DEPENDS_ON)
+    if depends_on is not None:
+        if not isinstance(depends_on, list):
+            depends_on = [depends_on]
+        for target in depends_on:
+            add(target, DEPENDS_ON)
+
+    # Values are pushed in reverse so they are reached in document order
+    stack = [v for k, v in resource.resource.items() if k != DEPENDS_ON]
+    stack.reverse()
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            continue
+        elif isinstance(value, dict):
+            if len(value) == 1:
+                key, arg = next(iter(value.items()))
+                if key == "Ref":
+                    add(arg, REF)
+                    continue
+                elif key == "Fn::GetAtt":
+                    if isinstance(arg, str):
+                        add(arg.split(".", 1)[0], GETATT)
+                    elif isinstance(arg, list) and arg:
+                        add(arg[0], GETATT)
+                        stack.extend(reversed(arg[1:]))
+                    continue
+                elif key == "Fn::Sub":
+                    stack.extend(reversed(_sub_references(arg, add)))
+                    continue
+            stack.extend(reversed(value.values()))
+        elif isinstance(value, (list, tuple)):
+            stack.extend(reversed(value))
+        elif isinstance(value, BaseAWSObject):
+            _add_owner(value, resource)
+            stack.extend(reversed(value.resource.values()))
+        elif isinstance(value, Tags):
+            stack.extend(reversed(value.tags))
+        elif isinstance(value, AWSHelperFn):
+            stack.append(value.data)
+        else:
+            # Objects with their own to_dict (or awacs JSONrepr)
+            encoded = encode_to_dict(value)
+            if encoded is not value:
+                stack.append(encoded)
+    return refs
+
+
+class DependencyGraph:
+    """Adjacency index of the references between the resources of a template.
+
+    resources maps titles to resource objects and parameters is used to tell
+    whether a Ref is dangling. Resources added with add(), and resources
+    changed by setting an attribute on them or on an object nested in them,
+    are scanned the next time the graph is queried.
+    """
+
+    def __init__(self, resources=None, parameters=None):
+        self.parameters = {} if parameters is None else parameters
+        self._resources = {}
+        self._pending = {}
+        # BaseAWSObject._changes when the graph was last checked for changed
+        # resources, and the _version of each resource when it was scanned
+        self._changes = BaseAWSObject._changes
+        self._versions = {}
+        self._refs = {}
+        self._referrers = {}
+        if resources:
+            self.update(resources)
+
+    def __contains__(self, title):
+        return title in self._resources
+
+    def __iter__(self):
+        return iter(list(self._resources))
+
+    def __len__(self):
+        return len(self._resources)
+
+    def add(self, title, resource):
+        """Adds a resource, replacing any resource with the same title."""
+        self._unindex(title)
+        self._resources[title] = resource
+        self._pending[title] = resource
+
+    def remove(self, title):
+        """Removes a resource and the references it makes."""
+        self._unindex(title)
+        del self._resources[title]
+
+    def update(self, resources):
+        """Brings the graph in line with the resources mapping.
+
+        Resources are compared by identity so only added, replaced and
+        removed resources are (re)scanned.
+        """
+        indexed = self._resources
+        for title, resource in resources.items():
+            if indexed.get(title) is not resource:
+                self.add(title, resource)
+        if len(indexed) != len(resources):
+            for title in [t for t in indexed if t not in resources]:
+                self.remove(title)
+
+    def _unindex(self, title):
+        self._pending.pop(title, None)
+        self._versions.pop(title, None)
+        for target in self._refs.pop(title, ()):
+            referrers = self._referrers[target]
+            del referrers[title]
+            if not referrers:
+                del self._referrers[target]
+
+    def _flush(self):
+        if self._changes != BaseAWSObject._changes:
+            # Some tracked object changed, rescan the resources it is in
+            self._changes = BaseAWSObject._changes
+            versions = self._versions
+            changed = [
+                (title, resource)
+                for title, resource in self._resources.items()
+                if title in versions and versions[title] != resource._version
+            ]
+            for title, resource in changed:
+                self.add(title, resource)
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for title, resource in pending.items():
+            self._versions[title] = resource._version
+            refs = _references(resource)
+            self._refs[title] = refs
+            for target in refs:
+                # dicts are used as insertion ordered sets
+                self._referrers.setdefault(target, {})[title] = None
+
+    def references(self, title):
+        """Returns {target: sorted kinds} for the references made by title.
+
+        Kinds are DependsOn, Ref, GetAtt and Sub. Targets may be resources,
+        parameters or names which do not exist in the template.
+        """
+        self._flush()
+        return {target: sorted(kinds) for target, kinds in self._refs[title].items()}
+
+    def dependencies(self, title):
+        """Returns the resources which title depends on."""
+        self._flush()
+        return [t for t in self._refs[title] if t in self._resources]
+
+    def dependents(self, title):
+        """Returns the resources which reference title (who references X)."""
+        self._flush()
+        return list(self._referrers.get(title, ()))
+
+    def dangling(self):
+        """Returns (title, target) pairs for references to unknown names.
+
+        A Ref or Sub may name a resource or a parameter, a DependsOn or
+        GetAtt must name a resource.
+        """
+        self._flush()
+        dangling = []
+        for title in self._resources:
+            for target, kinds in self._refs[title].items():
+                if target in self._resources:
+                    continue
+                if target in self.parameters and kinds <= {REF, SUB}:
+                    continue
+                dangling.append((title, target))
+        return dangling
+
+    def _sort(self):
+        """Returns (order, cycle) from a depth first walk of the graph."""
+        self._flush()
+        resources = self._resources
+        refs = self._refs
+        order = []
+        state = {}  # False while on the walk stack, True once done
+        for root in resources:
+            if root in state:
+                continue
+            state[root] = False
+            stack = [(root, iter(refs[root]))]
+            while stack:
+                node, targets = stack[-1]
+                for target in targets:
+                    if target not in resources:
+                        continue
+                    done = state.get(target)
+                    if done is None:
+                        state[target] = False
+                        stack.append((target, iter(refs[target])))
+                        break
+                    elif not done:
+                        path = [n for n, _ in stack]
+                        return order, path[path.index(target) :] + [target]
+                else:
+                    stack.pop()
+                    state[node] = True
+                    order.append(node)
+        return order, None
+
+    def find_cycle(self):
+        """Returns a cycle as a path such as [A, B, A] or None."""
+        return self._sort()[1]
+
+    def topological_order(self):
+        """Returns the resource titles with dependencies before dependents.
+
+        The order is deterministic, following the template order wherever
+        the dependencies allow it. Raises CycleError if there is a cycle.
+        """
+        order, cycle = self._sort()
+        if cycle:
+            raise CycleError(cycle)
+        return order
+
+
+__all__ = ["CycleError", "DependencyGraph"]
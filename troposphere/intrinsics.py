@@ -0,0 +1,443 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Local evaluation of intrinsic functions.
+
+The Evaluator resolves Ref, Fn::Join, Fn::Sub, Fn::If, Fn::Select,
+Fn::Split, Fn::FindInMap, Fn::Base64 and the condition functions, given the
+values of parameters and pseudo parameters, the template's Mappings and its
+Conditions. Anything which is only known once deployed (resource
+references, Fn::GetAtt, Fn::GetAZs, Fn::ImportValue, ...) raises an
+UnresolvedError.
+
+fold_template() uses it to rewrite the parts of a template which can be
+resolved to literals, which is what Template.fold_constants() does.
+
+Usage:
+    evaluate(Join("-", [Ref("Env"), "app"]), {"Env": "prod"})  # "prod-app"
+"""
+
+import base64
+import copy
+import re
+
+from . import AWS_NO_VALUE, AWSHelperFn, BaseAWSObject, Tags, encode_to_dict
+
+
+class UnresolvedError(ValueError):
+    """Raised when a value depends on something not known locally."""
+
+
+class _NoValue:
+    def __repr__(self):
+        return "NO_VALUE"
+
+
+# The value of Ref AWS::NoValue, which removes the property it is set to
+NO_VALUE = _NoValue()
+
+_SUB_VARIABLE = re.compile(r"\$\{([^}]*)\}")
+
+
+def _function(value):
+    """Returns (name, args) if value is an intrinsic function call or None."""
+    if isinstance(value, AWSHelperFn):
+        value = getattr(value, "data", None)
+    if type(value) is dict and len(value) == 1:
+        ((key, args),) = value.items()
+        # Condition is also the name of e.g. IAM policy statement keys
+        if key in FUNCTIONS and (key != "Condition" or isinstance(args, str)):
+            return key, args
+    return None
+
+
+class Evaluator:
+    """Resolves intrinsic functions.
+
+    parameters maps parameter and pseudo parameter names to their values,
+    mappings and conditions are the Mappings and Conditions sections.
+    """
+
+    def __init__(self, parameters=None, mappings=None, conditions=None):
+        self.parameters = {} if parameters is None else parameters
+        self.mappings = {} if mappings is None else mappings
+        self.conditions = {} if conditions is None else conditions
+        self._conditions = {}
+
+    def resolve(self, value):
+        """Returns value with all intrinsic functions resolved.
+
+        Raises UnresolvedError if something in value is not known locally.
+        The result may be NO_VALUE.
+        """
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        function = _function(value)
+        if function is not None:
+            name, args = function
+            return FUNCTIONS[name](self, args)
+        if not isinstance(value, (dict, list, tuple)):
+            value = encode_to_dict(value, False)
+            if not isinstance(value, (dict, list, tuple, str, int, float, bool)):
+                raise UnresolvedError("%r cannot be resolved" % (value,))
+            return self.resolve(value)
+        if isinstance(value, dict):
+            resolved = {}
+            for k, v in value.items():
+                v = self.resolve(v)
+                if v is not NO_VALUE:
+                    resolved[k] = v
+            return resolved
+        elif isinstance(value, (list, tuple)):
+            resolved = [self.resolve(v) for v in value]
+            return [v for v in resolved if v is not NO_VALUE]
+        return value
+
+    def condition(self, name):
+        """Returns the value of the named condition."""
+        result = self._conditions.get(name)
+        if result is None:
+            if name not in self.conditions:
+                raise UnresolvedError("Unknown condition %s" % name)
+            # Guards against conditions referring to themselves
+            self._conditions[name] = UnresolvedError("Circular condition %s" % name)
+            try:
+                result = self._bool(self.conditions[name])
+            except UnresolvedError as e:
+                result = e
+            self._conditions[name] = result
+        if isinstance(result, UnresolvedError):
+            raise result
+        return result
+
+    def _bool(self, value):
+        result = self.resolve(value)
+        if not isinstance(result, bool):
+            raise UnresolvedError("Condition value %r is not a boolean" % (result,))
+        return result
+
+    def _str(self, value):
+        result = self.resolve(value)
+        if isinstance(result, bool) or not isinstance(result, (str, int, float)):
+            raise UnresolvedError("%r is not a string" % (result,))
+        return str(result)
+
+    def _list(self, value):
+        result = self.resolve(value)
+        if not isinstance(result, list):
+            raise UnresolvedError("%r is not a list" % (result,))
+        return result
+
+    def _args(self, args, count, name):
+        if not isinstance(args, (list, tuple)) or len(args) not in count:
+            raise UnresolvedError("Invalid arguments to %s: %r" % (name, args))
+        return args
+
+    def ref(self, name):
+        name = self._str(name)
+        if name == AWS_NO_VALUE:
+            return NO_VALUE
+        if name not in self.parameters:
+            raise UnresolvedError("Ref %s is not known locally" % name)
+        return self.parameters[name]
+
+    def base64(self, args):
+        return base64.b64encode(self._str(args).encode("utf-8")).decode("ascii")
+
+    def find_in_map(self, args):
+        args = self._args(args, (3,), "Fn::FindInMap")
+        keys = [self._str(arg) for arg in args]
+        try:
+            value = self.mappings[keys[0]][keys[1]][keys[2]]
+        except (KeyError, TypeError):
+            raise UnresolvedError("Fn::FindInMap %s not found" % ".".join(keys))
+        return copy.deepcopy(self.resolve(value))
+
+    def if_(self, args):
+        args = self._args(args, (3,), "Fn::If")
+        return self.resolve(args[1] if self.condition(args[0]) else args[2])
+
+    def join(self, args):
+        delimiter, values = self._args(args, (2,), "Fn::Join")
+        return self._str(delimiter).join(self._str(v) for v in self._list(values))
+
+    def select(self, args):
+        index, values = self._args(args, (2,), "Fn::Select")
+        index = self._str(index)
+        values = self._list(values)
+        try:
+            return values[int(index)]
+        except (IndexError, ValueError):
+            raise UnresolvedError("Fn::Select index %s is invalid" % index)
+
+    def split(self, args):
+        delimiter, text = self._args(args, (2,), "Fn::Split")
+        return self._str(text).split(self._str(delimiter))
+
+    def sub(self, args):
+        if isinstance(args, (list, tuple)):
+            text, variables = self._args(args, (2,), "Fn::Sub")
+        else:
+            text, variables = args, {}
+        text = self._str(text)
+
+        def replace(match):
+            name = match.group(1)
+            if name.startswith("!"):
+                return "${%s}" % name[1:]
+            name = name.strip()
+            if name in variables:
+                return self._str(variables[name])
+            if "." in name:
+                raise UnresolvedError("Fn::Sub ${%s} is not known locally" % name)
+            return self._str(self.ref(name))
+
+        return _SUB_VARIABLE.sub(replace, text)
+
+    def equals(self, args):
+        a, b = self._args(args, (2,), "Fn::Equals")
+        return self.resolve(a) == self.resolve(b)
+
+    def and_(self, args):
+        # Every condition is resolved so an unknown one is never skipped
+        return all(
+            [self._bool(arg) for arg in self._args(args, range(2, 11), "Fn::And")]
+        )
+
+    def or_(self, args):
+        return any(
+            [self._bool(arg) for arg in self._args(args, range(2, 11), "Fn::Or")]
+        )
+
+    def not_(self, args):
+        return not self._bool(self._args(args, (1,), "Fn::Not")[0])
+
+
+def _unresolved(name):
+    def function(evaluator, args):
+        raise UnresolvedError("%s is not known locally" % name)
+
+    return function
+
+
+FUNCTIONS = {
+    "Ref": Evaluator.ref,
+    "Condition": Evaluator.condition,
+    "Fn::Base64": Evaluator.base64,
+    "Fn::FindInMap": Evaluator.find_in_map,
+    "Fn::If": Evaluator.if_,
+    "Fn::Join": Evaluator.join,
+    "Fn::Select": Evaluator.select,
+    "Fn::Split": Evaluator.split,
+    "Fn::Sub": Evaluator.sub,
+    "Fn::Equals": Evaluator.equals,
+    "Fn::And": Evaluator.and_,
+    "Fn::Or": Evaluator.or_,
+    "Fn::Not": Evaluator.not_,
+}
+for _name in ("Fn::Cidr", "Fn::GetAtt", "Fn::GetAZs", "Fn::ImportValue"):
+    FUNCTIONS[_name] = _unresolved(_name)
+
+
+def evaluate(value, parameters=None, mappings=None, conditions=None):
+    """Returns value with all intrinsic functions resolved.
+
+    See Evaluator for the arguments. Raises UnresolvedError if value
+    depends on something not known locally.
+    """
+    return Evaluator(parameters, mappings, conditions).resolve(value)
+
+
+def parameter_defaults(parameters):
+    """Returns the Default values of a template's Parameters section."""
+    values = {}
+    for name, parameter in parameters.items():
+        properties = getattr(parameter, "properties", parameter)
+        if "Default" not in properties:
+            continue
+        default = properties["Default"]
+        param_type = properties.get("Type", "")
+        if isinstance(default, str) and (
+            param_type.startswith("List<") or param_type == "CommaDelimitedList"
+        ):
+            default = default.split(",")
+        values[name] = default
+    return values
+
+
+def condition_references(value):
+    """Returns the names of the conditions used in value."""
+    names = set()
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseAWSObject):
+            condition = value.resource.get("Condition")
+            if isinstance(condition, str):
+                names.add(condition)
+            stack.extend(value.resource.values())
+        elif isinstance(value, Tags):
+            stack.extend(value.tags)
+        elif isinstance(value, AWSHelperFn):
+            stack.append(value.data)
+        elif isinstance(value, dict):
+            if len(value) == 1:
+                ((key, args),) = value.items()
+                if key == "Condition" and isinstance(args, str):
+                    names.add(args)
+                elif key == "Fn::If" and isinstance(args, list) and args:
+                    if isinstance(args[0], str):
+                        names.add(args[0])
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return names
+
+
+def fold(value, evaluator):
+    """Returns value with the subtrees which can be resolved replaced.
+
+    Containers and troposphere objects are updated in place. Fn::If with
+    a known condition is replaced by the chosen branch, which keeps any
+    troposphere objects in it. Returns NO_VALUE if the value is removed.
+    """
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    function = _function(value)
+    if function is not None:
+        name, args = function
+        try:
+            return evaluator.resolve(value)
+        except UnresolvedError:
+            pass
+        if name == "Fn::If" and isinstance(args, list) and len(args) == 3:
+            try:
+                branch = args[1] if evaluator.condition(args[0]) else args[2]
+            except UnresolvedError:
+                pass
+            else:
+                return fold(branch, evaluator)
+        if name == "Fn::Sub":
+            args = _fold_sub(args, evaluator)
+        # Fold the arguments which can be resolved
+        data = value.data if isinstance(value, AWSHelperFn) else value
+        data[name] = _fold_arguments(args, evaluator)
+        return value
+
+    if isinstance(value, BaseAWSObject):
+        for k in list(value.resource):
+            if k in ("Condition", "DependsOn", "Type"):
+                continue
+            if value.resource is not value.properties and k in value.properties:
+                continue
+            _fold_item(value.resource, k, evaluator)
+        if value.resource is not value.properties:
+            for k in list(value.properties):
+                _fold_item(value.properties, k, evaluator)
+    elif isinstance(value, Tags):
+        _fold_list(value.tags, evaluator)
+    elif isinstance(value, AWSHelperFn):
+        if isinstance(value.data, (dict, list)):
+            value.data = fold(value.data, evaluator)
+    elif isinstance(value, dict):
+        for k in list(value):
+            _fold_item(value, k, evaluator)
+    elif isinstance(value, list):
+        _fold_list(value, evaluator)
+    return value
+
+
+def _fold_sub(args, evaluator):
+    """Substitutes the variables of Fn::Sub which are known."""
+    if isinstance(args, list) and len(args) == 2:
+        text, variables = args
+    else:
+        text, variables = args, {}
+    if not isinstance(text, str) or not isinstance(variables, dict):
+        return args
+
+    def replace(match):
+        name = match.group(1).strip()
+        if name.startswith("!") or name in variables or "." in name:
+            return match.group(0)
+        try:
+            value = evaluator._str(evaluator.ref(name))
+        except UnresolvedError:
+            return match.group(0)
+        # The value must not be read as a variable
+        return value.replace("${", "${!")
+
+    text = _SUB_VARIABLE.sub(replace, text)
+    return [text, variables] if isinstance(args, list) else text
+
+
+def _fold_arguments(args, evaluator):
+    # An argument resolving to NO_VALUE, e.g. a branch of Fn::If, is kept
+    if isinstance(args, list):
+        folded = [fold(arg, evaluator) for arg in args]
+        return [a if f is NO_VALUE else f for a, f in zip(args, folded)]
+    folded = fold(args, evaluator)
+    return args if folded is NO_VALUE else folded
+
+
+def _fold_item(container, key, evaluator):
+    value = container[key]
+    folded = fold(value, evaluator)
+    if folded is NO_VALUE:
+        del container[key]
+    elif folded is not value:
+        container[key] = folded
+
+
+def _fold_list(values, evaluator):
+    folded = [fold(v, evaluator) for v in values]
+    values[:] = [v for v in folded if v is not NO_VALUE]
+
+
+def fold_template(template, parameters=None, use_defaults=False):
+    """Folds the resources and outputs of template in place.
+
+    See Template.fold_constants(). Returns the names of the conditions
+    removed.
+    """
+    values = parameter_defaults(template.parameters) if use_defaults else {}
+    values.update(parameters or {})
+    evaluator = Evaluator(values, template.mappings, template.conditions)
+
+    for objects in (template.resources, template.outputs):
+        for obj in objects.values():
+            condition = obj.resource.get("Condition")
+            if isinstance(condition, str):
+                try:
+                    if evaluator.condition(condition):
+                        del obj.resource["Condition"]
+                except UnresolvedError:
+                    pass
+            fold(obj, evaluator)
+
+    # Conditions which are no longer referenced
+    used = set()
+    pending = condition_references(
+        [list(template.resources.values()), list(template.outputs.values())]
+    )
+    while pending:
+        name = pending.pop()
+        if name in used or name not in template.conditions:
+            continue
+        used.add(name)
+        pending |= condition_references(template.conditions[name])
+    removed = [name for name in template.conditions if name not in used]
+    for name in removed:
+        del template.conditions[name]
+    return removed
+
+
+__all__ = [
+    "NO_VALUE",
+    "Evaluator",
+    "UnresolvedError",
+    "evaluate",
+    "fold_template",
+]
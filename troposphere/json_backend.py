@@ -0,0 +1,188 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Pluggable JSON serialization for Template.to_json().
+
+A backend is any object with a dumps() method taking the formatting
+arguments of json.dumps(). The output must be the same as json.dumps() so
+the backend can be switched without changing any rendered template.
+
+By default orjson is used when it is installed and the standard library
+json module otherwise. The orjson backend reformats the orjson output to
+match json.dumps(), and hands anything it cannot reproduce (indentation
+given as a string, ", " separators without indentation, non-string keys,
+integers over 64 bits, floats which may be formatted differently, ...)
+over to json.dumps(), as well as any output with a null in it since
+orjson also writes NaN and infinite floats as null.
+
+Usage:
+    json_backend.set_backend("json")     # always use the standard library
+    json_backend.set_backend(MyBackend())
+"""
+
+import json
+import re
+
+# Characters escaped by json.dumps(ensure_ascii=True) but not by orjson
+_NON_ASCII = re.compile("[^\x00-\x7e]")
+
+# orjson only formats a float differently from json.dumps() when either
+# uses an exponent, which orjson does not do for e.g. 0.00001. With the
+# digits mapped to 0 such floats contain one of _FLOAT_MARKERS.
+_DIGITS = bytes.maketrans(b"123456789E", b"000000000e")
+_FLOAT_MARKERS = (b"0e", b"0.0000")
+
+
+def _escape(match):
+    # Same as json.encoder.py_encode_basestring_ascii
+    n = ord(match.group(0))
+    if n < 0x10000:
+        return "\\u%04x" % n
+    n -= 0x10000
+    return "\\u%04x\\u%04x" % (0xD800 | (n >> 10), 0xDC00 | (n & 0x3FF))
+
+
+# Maps everything but spaces and newlines to x. Outside of the strings of
+# orjson output, spaces only follow a newline or a ":" separator, so the
+# strings contain two spaces in a row if the mapped output contains "x  ".
+_LAYOUT = bytes(b if b in b" \n" else ord("x") for b in range(256))
+
+
+def _reindent(text, width):
+    """Replaces the 2 space indentation of orjson output by width."""
+    if b"x  " not in text.translate(_LAYOUT):
+        # All pairs of spaces are indentation
+        return text.replace(b"  ", width)
+    depth = 1
+    while b"\n" + b"  " * depth in text:
+        depth += 1
+    # Lines are marked once reindented so they are not matched again by
+    # the indentation of the levels above. Strings never span lines.
+    for level in range(depth - 1, 0, -1):
+        text = text.replace(b"\n" + b"  " * level, b"\n\0" + width * level)
+    return text.replace(b"\n\0", b"\n")
+
+
+class StdlibBackend:
+    """Serializes with the json module of the standard library."""
+
+    name = "json"
+
+    def dumps(
+        self, obj, indent=None, sort_keys=False, separators=None, ensure_ascii=True
+    ):
+        return json.dumps(
+            obj,
+            indent=indent,
+            sort_keys=sort_keys,
+            separators=separators,
+            ensure_ascii=ensure_ascii,
+        )
+
+
+class OrjsonBackend(StdlibBackend):
+    """Serializes with orjson, raises ImportError if it is not installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # Types which json.dumps() does not serialize are passed to default
+        self._option = (
+            orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+    def dumps(
+        self, obj, indent=None, sort_keys=False, separators=None, ensure_ascii=True
+    ):
+        if indent is None:
+            supported = separators == (",", ":")
+        else:
+            supported = isinstance(indent, int) and separators in (None, (",", ": "))
+        if not supported:
+            return super().dumps(obj, indent, sort_keys, separators, ensure_ascii)
+
+        option = self._option
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        if indent is not None:
+            option |= self._orjson.OPT_INDENT_2
+        try:
+            text = self._orjson.dumps(obj, default=_unsupported, option=option)
+        except TypeError:
+            return super().dumps(obj, indent, sort_keys, separators, ensure_ascii)
+
+        digits = text.translate(_DIGITS)
+        if _FLOAT_MARKERS[0] in digits or _FLOAT_MARKERS[1] in digits:
+            # There may be floats, which may also just be in strings
+            return super().dumps(obj, indent, sort_keys, separators, ensure_ascii)
+        if b"null" in text:
+            # orjson writes NaN and infinite floats as null, json.dumps()
+            # as NaN and Infinity
+            return super().dumps(obj, indent, sort_keys, separators, ensure_ascii)
+        if indent is not None and indent != 2:
+            text = _reindent(text, b" " * indent)
+        text = text.decode("utf-8")
+        if ensure_ascii and _NON_ASCII.search(text):
+            text = _NON_ASCII.sub(_escape, text)
+        return text
+
+
+def _unsupported(obj):
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+BACKENDS = {
+    "json": StdlibBackend,
+    "orjson": OrjsonBackend,
+}
+
+# Backends tried in turn when none has been set
+DEFAULT_BACKENDS = ("orjson", "json")
+
+_backend = None
+
+
+def set_backend(backend=None):
+    """Sets the backend used by Template.to_json().
+
+    backend is the name of one of BACKENDS, an object with a dumps() method,
+    or None to use the first of DEFAULT_BACKENDS which is installed.
+    Raises ImportError if the named backend is not installed.
+    """
+    global _backend
+    if isinstance(backend, str):
+        backend = BACKENDS[backend]()
+    _backend = backend
+
+
+def get_backend():
+    """Returns the backend used by Template.to_json()."""
+    global _backend
+    if _backend is None:
+        for name in DEFAULT_BACKENDS:
+            try:
+                _backend = BACKENDS[name]()
+            except ImportError:
+                continue
+            break
+    return _backend
+
+
+def dumps(obj, indent=None, sort_keys=False, separators=None, ensure_ascii=True):
+    """Serializes obj the same way as json.dumps() with the current backend."""
+    return get_backend().dumps(obj, indent, sort_keys, separators, ensure_ascii)
+
+
+__all__ = [
+    "BACKENDS",
+    "OrjsonBackend",
+    "StdlibBackend",
+    "dumps",
+    "get_backend",
+    "set_backend",
+]
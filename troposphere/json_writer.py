@@ -0,0 +1,194 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Streaming JSON output for troposphere objects.
+
+The output is identical to json.dumps() called with the same arguments on
+the encoded object, but it is written to a file-like object as it is
+produced. troposphere objects are only encoded when they are reached so
+there is never more than one encoded resource held in memory.
+
+Usage:
+    with open("template.json", "w") as f:
+        template.write_json(f)
+"""
+
+from json.encoder import encode_basestring, encode_basestring_ascii
+
+from . import _encode_shared
+
+# Number of chunks buffered before they are written out
+BUFFER_CHUNKS = 4096
+
+
+def _floatstr(o, allow_nan=True):
+    # Same as the floatstr used by json.encoder
+    if o != o:
+        text = "NaN"
+    elif o == float("inf"):
+        text = "Infinity"
+    elif o == -float("inf"):
+        text = "-Infinity"
+    else:
+        return float.__repr__(o)
+
+    if not allow_nan:
+        raise ValueError("Out of range float values are not JSON compliant: " + repr(o))
+    return text
+
+
+def _keystr(key, allow_nan=True):
+    # Same conversion json.encoder applies to dict keys
+    if isinstance(key, str):
+        return key
+    elif isinstance(key, float):
+        return _floatstr(key, allow_nan)
+    elif key is True:
+        return "true"
+    elif key is False:
+        return "false"
+    elif key is None:
+        return "null"
+    elif isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(
+        "keys must be str, int, float, bool or None, not %s" % key.__class__.__name__
+    )
+
+
+class JSONWriter:
+    """Writes JSON to a file-like object using json.dumps() formatting."""
+
+    def __init__(
+        self,
+        indent=None,
+        sort_keys=False,
+        separators=None,
+        ensure_ascii=True,
+        allow_nan=True,
+        validation=True,
+    ):
+        if indent is not None and not isinstance(indent, str):
+            indent = " " * indent
+        if separators is not None:
+            self.item_separator, self.key_separator = separators
+        elif indent is not None:
+            self.item_separator, self.key_separator = ",", ": "
+        else:
+            self.item_separator, self.key_separator = ", ", ": "
+        self.indent = indent
+        self.sort_keys = sort_keys
+        self.allow_nan = allow_nan
+        self.validation = validation
+        self.encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+
+    def _scalar(self, o):
+        """Returns the JSON text for a scalar or None if o is not a scalar."""
+        if isinstance(o, str):
+            return self.encode_str(o)
+        elif o is None:
+            return "null"
+        elif o is True:
+            return "true"
+        elif o is False:
+            return "false"
+        elif isinstance(o, int):
+            return int.__repr__(o)
+        elif isinstance(o, float):
+            return _floatstr(o, self.allow_nan)
+        return None
+
+    def _items(self, o):
+        """Returns the items of a container as (key, value) pairs."""
+        if isinstance(o, dict):
+            items = o.items()
+            if self.sort_keys:
+                items = sorted(items)
+            return [(self.encode_str(_keystr(k, self.allow_nan)), v) for k, v in items]
+        return [(None, v) for v in o]
+
+    def write(self, o, fp):
+        """Writes the JSON text for o to the file-like object fp."""
+        indent = self.indent
+        item_separator = self.item_separator
+        key_separator = self.key_separator
+        scalar = self._scalar
+        chunks = []
+        emit = chunks.append
+
+        # Each frame is [items, index, closing] for an open list or dict
+        stack = []
+        level = 0
+        value = o
+        while True:
+            text = scalar(value)
+            if text is None:
+                if not isinstance(value, (list, tuple, dict)):
+                    # Encode troposphere (and awacs) objects as they are
+                    # reached rather than the whole template up front.
+                    encoded = _encode_shared(value, self.validation)
+                    if encoded is value:
+                        raise TypeError(
+                            "Object of type %s is not JSON serializable"
+                            % value.__class__.__name__
+                        )
+                    value = encoded
+                    continue
+                items = self._items(value)
+                opening, closing = ("{", "}") if isinstance(value, dict) else ("[", "]")
+                if not items:
+                    emit(opening + closing)
+                else:
+                    if indent is not None:
+                        level += 1
+                        emit(opening + "\n" + indent * level)
+                    else:
+                        emit(opening)
+                    stack.append([items, 0, closing])
+            else:
+                emit(text)
+
+            # Move on to the next value, closing finished containers
+            while stack:
+                frame = stack[-1]
+                items, index = frame[0], frame[1]
+                if index < len(items):
+                    key, value = items[index]
+                    frame[1] = index + 1
+                    separator = ""
+                    if index:
+                        separator = item_separator
+                        if indent is not None:
+                            separator += "\n" + indent * level
+                    if key is not None:
+                        emit(separator + key + key_separator)
+                    elif separator:
+                        emit(separator)
+                    break
+                stack.pop()
+                if indent is not None:
+                    level -= 1
+                    emit("\n" + indent * level + frame[2])
+                else:
+                    emit(frame[2])
+                if len(chunks) >= BUFFER_CHUNKS:
+                    fp.write("".join(chunks))
+                    chunks.clear()
+            else:
+                break
+
+        fp.write("".join(chunks))
+
+
+def dump(obj, fp, **kwargs):
+    """Serializes obj to fp, taking the same formatting arguments as json.dump.
+
+    Unlike json.dump, troposphere objects found in obj are encoded as they
+    are reached, and validated unless validation=False is passed.
+    """
+    JSONWriter(**kwargs).write(obj, fp)
+
+
+__all__ = ["JSONWriter", "dump"]
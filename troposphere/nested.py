@@ -0,0 +1,453 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Splitting of oversized templates into nested stacks.
+
+split_template() moves the resources of a template into child templates
+which each fit within the given resource count and size limits, and
+returns a parent template creating the children as
+AWS::CloudFormation::Stack resources.
+
+Resources which reference each other are kept in the same child wherever
+possible. References which do cross children are threaded through: the
+child owning the resource gets an Output, and the parent passes it on to
+the referencing child as a Parameter.
+
+Usage:
+    parent, children = split_template(
+        template, "https://bucket.s3.amazonaws.com/{name}.json"
+    )
+    for name, child in children.items():
+        upload(name + ".json", child.to_json())
+
+An oversized template can be built up by adding resources directly to
+Template.resources, bypassing the MAX_RESOURCES check of add_resource().
+"""
+
+import copy
+import json
+import re
+
+from . import (
+    AWS_STACK_ID,
+    AWS_STACK_NAME,
+    MAX_RESOURCES,
+    MAX_TEMPLATE_URL_SIZE,
+    AWSHelperFn,
+    BaseAWSObject,
+    GetAtt,
+    If,
+    Join,
+    Output,
+    Parameter,
+    Ref,
+    Tags,
+    Template,
+    _encode_shared,
+    encode_to_dict,
+)
+from .cloudformation import Stack
+from .graph import _SUB_VARIABLE, DependencyGraph
+
+# Share of max_size filled with resources, leaving room for the Parameters
+# and Outputs added to thread references between the children.
+FILL_RATIO = 0.8
+
+# Pseudo parameters which have a different value in a nested stack and are
+# passed down from the parent instead.
+STACK_PSEUDO_PARAMETERS = {
+    AWS_STACK_ID: "ParentStackId",
+    AWS_STACK_NAME: "ParentStackName",
+}
+
+
+def _size(resource):
+    """Returns the size of the resource in the default to_json() output."""
+    return len(json.dumps(_encode_shared(resource), indent=4, sort_keys=True))
+
+
+def _rewrite(root, resolve):
+    """Replaces the references made inside of root in place.
+
+    resolve(target, attr) is called for each Ref (attr is None), GetAtt and
+    Fn::Sub variable and returns None to leave it alone or a (node, name)
+    pair. The Ref or GetAtt is replaced by node and the Sub variable by
+    ${name}. Objects other than troposphere objects and plain containers
+    are replaced by their encoded form so they can be rewritten.
+    """
+
+    def sub(match):
+        name = match.group(1)
+        target, _, attr = name.strip().partition(".")
+        if target in local:
+            return match.group(0)
+        replacement = resolve(target, attr or None)
+        if replacement is None:
+            return match.group(0)
+        return "${%s}" % replacement[1]
+
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseAWSObject):
+            value = value.resource
+        elif isinstance(value, Tags):
+            value = value.tags
+        elif isinstance(value, AWSHelperFn):
+            value = value.data
+
+        if isinstance(value, dict):
+            if len(value) == 1:
+                key, arg = next(iter(value.items()))
+                replacement = None
+                if key == "Ref" and isinstance(arg, str):
+                    replacement = resolve(arg, None)
+                elif key == "Fn::GetAtt":
+                    if isinstance(arg, str):
+                        replacement = resolve(*arg.split(".", 1))
+                    elif (
+                        isinstance(arg, list)
+                        and len(arg) == 2
+                        and all(isinstance(a, str) for a in arg)
+                    ):
+                        replacement = resolve(*arg)
+                elif key == "Fn::Sub":
+                    if isinstance(arg, str):
+                        local = ()
+                        value[key] = _SUB_VARIABLE.sub(sub, arg)
+                    elif isinstance(arg, list) and len(arg) == 2:
+                        local = arg[1] if isinstance(arg[1], dict) else ()
+                        if isinstance(arg[0], str):
+                            arg[0] = _SUB_VARIABLE.sub(sub, arg[0])
+                if replacement is not None:
+                    value.clear()
+                    value.update(replacement[0])
+                    continue
+            keys = list(value)
+        elif isinstance(value, list):
+            keys = range(len(value))
+        elif isinstance(value, tuple):
+            stack.extend(value)
+            continue
+        else:
+            continue
+
+        for k in keys:
+            child = value[k]
+            if isinstance(child, (str, int, float, bool)) or child is None:
+                continue
+            if not isinstance(child, (dict, list, tuple, BaseAWSObject, AWSHelperFn)):
+                child = value[k] = encode_to_dict(child)
+            stack.append(child)
+
+
+def _partition(template, graph, max_resources, max_size):
+    """Returns the resource titles of each child, in creation order.
+
+    Connected groups of resources are kept together when they fit in a
+    child. Larger groups are cut in topological order so references
+    between children only ever point to earlier children.
+    """
+    order = graph.topological_order()
+
+    # Connected groups of resources using union-find
+    parents = {}
+
+    def find(title):
+        root = title
+        while parents.get(root, root) != root:
+            root = parents[root]
+        while title != root:
+            parents[title], title = root, parents[title]
+        return root
+
+    for title in order:
+        for dependency in graph.dependencies(title):
+            a, b = find(title), find(dependency)
+            if a != b:
+                parents[a] = b
+    groups = {}
+    for title in order:
+        groups.setdefault(find(title), []).append(title)
+
+    sizes = {title: _size(template.resources[title]) for title in order}
+    max_fill = max_size * FILL_RATIO
+    children = []
+    current = []
+    current_size = 0
+    for group in groups.values():
+        group_size = sum(sizes[title] for title in group)
+        if (
+            current
+            and (
+                len(current) + len(group) > max_resources
+                or current_size + group_size > max_fill
+            )
+            and len(group) <= max_resources
+            and group_size <= max_fill
+        ):
+            children.append(current)
+            current, current_size = [], 0
+        for title in group:
+            if current and (
+                len(current) >= max_resources or current_size + sizes[title] > max_fill
+            ):
+                children.append(current)
+                current, current_size = [], 0
+            current.append(title)
+            current_size += sizes[title]
+    if current:
+        children.append(current)
+    return children
+
+
+def _condition(template, title):
+    """Returns the Condition of the resource title, or None."""
+    return template.resources[title].resource.get("Condition")
+
+
+def _child_parameter(parameter):
+    """Returns the child parameter for a parameter of the parent.
+
+    Returns a (parameter, value) pair, where value is passed to the child
+    stack by the parent.
+    """
+    parameter = copy.deepcopy(parameter, {id(parameter.template): parameter.template})
+    parameter.template = None
+    value = Ref(parameter.title)
+    param_type = parameter.properties.get("Type", "")
+    if param_type.startswith("AWS::SSM::Parameter::Value<"):
+        # The parent resolves the value, only pass the value on
+        if "List<" in param_type or "CommaDelimitedList" in param_type:
+            param_type = "CommaDelimitedList"
+        else:
+            param_type = "String"
+        parameter.properties["Type"] = param_type
+    if param_type.startswith("List<") or param_type == "CommaDelimitedList":
+        # Stack parameters are strings
+        value = Join(",", value)
+    return parameter, value
+
+
+def split_template(
+    template,
+    template_url,
+    max_resources=MAX_RESOURCES,
+    max_size=MAX_TEMPLATE_URL_SIZE,
+    prefix="Nested",
+):
+    """Splits template into a parent and nested stack child templates.
+
+    template_url is either a format string with a {name} field or a
+    callable taking the child name, and gives the TemplateURL of each child.
+    Each child has at most max_resources resources and its to_json() output
+    is at most max_size bytes. The children are named prefix followed by a
+    number.
+
+    Returns (parent, children) where children maps each child name to its
+    Template. The given template is not modified. Raises CycleError if the
+    resources depend on each other, and ValueError if a child cannot be
+    made to fit the limits.
+
+    Conditions, Mappings and the Transform are copied to every child, and
+    the serverless Globals to the children with AWS::Serverless resources.
+    References to resources in another child are passed as String
+    parameters, so attributes returning a list are not supported. For
+    conditional resources the Output and the value passed are conditional
+    too, an empty string is passed where the condition is false.
+    """
+    if callable(template_url):
+        url = template_url
+    else:
+
+        def url(name):
+            return template_url.format(name=name)
+
+    graph = DependencyGraph(template.resources, template.parameters)
+    partition = _partition(template, graph, max_resources, max_size)
+    names = ["%s%d" % (prefix, i + 1) for i in range(len(partition))]
+    owner = {}
+    for i, titles in enumerate(partition):
+        for title in titles:
+            owner[title] = i
+
+    reserved = set(template.resources) | set(template.parameters)
+    for name in names:
+        if name in template.parameters:
+            raise ValueError('Nested stack name "%s" is already a parameter' % name)
+
+    # Names of the Outputs and Parameters carrying each cut reference
+    reference_names = {}
+
+    def reference_name(target, attr):
+        if attr is None:
+            return target
+        key = (target, attr)
+        name = reference_names.get(key)
+        if name is None:
+            base = name = target + re.sub("[^a-zA-Z0-9]", "", attr)
+            n = 1
+            while name in reserved:
+                n += 1
+                name = "%s%d" % (base, n)
+            reserved.add(name)
+            reference_names[key] = name
+        return name
+
+    # Copy everything the children take so the template is left unchanged
+    memo = {id(template): template}
+    resources = copy.deepcopy(template.resources, memo)
+    conditions = copy.deepcopy(template.conditions, memo)
+    for resource in resources.values():
+        resource.template = None
+
+    # Parameters used by the conditions are needed by every child
+    condition_parameters = {}
+
+    def condition_reference(target, attr):
+        if target in template.parameters:
+            condition_parameters[target] = None
+
+    _rewrite(copy.deepcopy(conditions), condition_reference)
+
+    pseudo_parameters = {
+        pseudo: reference_name(name, "")
+        for pseudo, name in STACK_PSEUDO_PARAMETERS.items()
+    }
+
+    exports = [{} for _ in partition]
+    children = {}
+    stacks = []
+    for i, titles in enumerate(partition):
+        child = Template(Description=template.description)
+        child.version = template.version
+        child.conditions = copy.deepcopy(conditions)
+        child.mappings = dict(template.mappings)
+        # Macros such as the SAM transform process the resources of the child
+        child.transform = copy.deepcopy(template.transform)
+        if template.globals is not None and any(
+            getattr(resources[title], "resource_type", "").startswith(
+                "AWS::Serverless::"
+            )
+            for title in titles
+        ):
+            child.globals = copy.deepcopy(template.globals)
+        parameters = dict(condition_parameters)
+        imports = {}
+        depends_on = set()
+
+        def resolve(target, attr):
+            if target in owner:
+                j = owner[target]
+                if j == i:
+                    return None
+                name = reference_name(target, attr)
+                exports[j][name] = (target, attr)
+                imports[name] = j
+            elif target in pseudo_parameters:
+                name = pseudo_parameters[target]
+                imports[name] = target
+            else:
+                if target in template.parameters:
+                    parameters[target] = None
+                return None
+            if target == name:
+                return None
+            return {"Ref": name}, name
+
+        for title in titles:
+            resource = resources[title]
+            targets = resource.resource.get("DependsOn")
+            if targets is not None:
+                if not isinstance(targets, list):
+                    targets = [targets]
+                kept = []
+                for target in targets:
+                    if owner.get(target, i) == i:
+                        kept.append(target)
+                    else:
+                        depends_on.add(names[owner[target]])
+                if not kept:
+                    del resource.resource["DependsOn"]
+                elif len(kept) != len(targets):
+                    resource.resource["DependsOn"] = kept
+            _rewrite(resource, resolve)
+            child.add_resource(resource)
+
+        stack_parameters = {}
+        for title in parameters:
+            parameter, value = _child_parameter(template.parameters[title])
+            child.add_parameter(parameter)
+            stack_parameters[title] = value
+        for name, source in imports.items():
+            child.add_parameter(Parameter(name, Type="String"))
+            if source in pseudo_parameters:
+                stack_parameters[name] = Ref(source)
+                continue
+            value = GetAtt(names[source], "Outputs." + name)
+            condition = _condition(template, exports[source][name][0])
+            if condition is not None:
+                # The Output only exists with the resource, the child only
+                # uses the value where the condition is true
+                value = If(condition, value, "")
+            stack_parameters[name] = value
+        children[names[i]] = child
+        stacks.append((stack_parameters, depends_on))
+
+    # Copies, so changes to the parent don't reach the template
+    parent = Template(
+        Description=template.description, Metadata=dict(template.metadata)
+    )
+    parent.version = template.version
+    parent.transform = copy.deepcopy(template.transform)
+    parent.globals = copy.deepcopy(template.globals)
+    parent.conditions = dict(template.conditions)
+    parent.mappings = dict(template.mappings)
+    parent.parameters = dict(template.parameters)
+    parent.rules = dict(template.rules)
+    for name, (stack_parameters, depends_on) in zip(names, stacks):
+        stack = Stack(name, TemplateURL=url(name))
+        if stack_parameters:
+            stack.Parameters = stack_parameters
+        if depends_on:
+            stack.DependsOn = sorted(depends_on)
+        parent.add_resource(stack)
+
+    def resolve_output(target, attr):
+        if target not in owner:
+            return None
+        name = reference_name(target, attr)
+        exports[owner[target]][name] = (target, attr)
+        stack = names[owner[target]]
+        return (
+            {"Fn::GetAtt": [stack, "Outputs." + name]},
+            "%s.Outputs.%s" % (stack, name),
+        )
+
+    outputs = copy.deepcopy(template.outputs, memo)
+    for output in outputs.values():
+        output.template = None
+        _rewrite(output, resolve_output)
+        parent.add_output(output)
+
+    for i, child in enumerate(children.values()):
+        for name, (target, attr) in exports[i].items():
+            value = Ref(target) if attr is None else GetAtt(target, attr)
+            output = child.add_output(Output(name, Value=value))
+            condition = _condition(template, target)
+            if condition is not None:
+                output.Condition = condition
+
+    for name, child in children.items():
+        size = len(child.to_json())
+        if size > max_size:
+            raise ValueError(
+                "Nested stack %s is %d bytes, more than max_size %d"
+                % (name, size, max_size)
+            )
+    return parent, children
+
+
+__all__ = ["split_template"]
@@ -0,0 +1,199 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Removal of unused declarations from a template.
+
+prune_template() walks the Ref, Fn::FindInMap, Condition, Fn::If and
+Fn::Sub usages of the resources, outputs, rules and globals of a template
+and removes the parameters, mappings and conditions which are not used.
+Each value is visited once and each condition is only walked when it is
+first reached, so pruning is linear in the size of the template.
+
+Resources and outputs whose Condition is statically false can be removed
+as well, which is what Template.prune() does with remove_resources=True.
+
+Usage:
+    removed = template.prune(remove_resources=True)
+    print(removed["Parameters"], removed["Resources"])
+"""
+
+from . import AWSHelperFn, BaseAWSObject, Tags, encode_to_dict
+from .graph import _SUB_VARIABLE, _title
+from .intrinsics import Evaluator, UnresolvedError
+
+SECTIONS = ("Resources", "Outputs", "Parameters", "Mappings", "Conditions")
+
+
+class _Usages:
+    """The names referenced by the values walked with add()."""
+
+    def __init__(self):
+        self.names = set()
+        self.mappings = set()
+        # Set when a FindInMap takes the map name from a function
+        self.any_mapping = False
+        self.conditions = set()
+        # Conditions used since last walked, see prune_template()
+        self.pending = []
+
+    def add_condition(self, name):
+        if name not in self.conditions:
+            self.conditions.add(name)
+            self.pending.append(name)
+
+    def add(self, value):
+        stack = [value]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, (str, int, float, bool)) or value is None:
+                continue
+            elif isinstance(value, dict):
+                if len(value) == 1:
+                    ((key, args),) = value.items()
+                    if self._function(key, args, stack):
+                        continue
+                stack.extend(value.values())
+            elif isinstance(value, (list, tuple)):
+                stack.extend(value)
+            elif isinstance(value, BaseAWSObject):
+                condition = value.resource.get("Condition")
+                if isinstance(condition, str):
+                    self.add_condition(condition)
+                stack.extend(value.resource.values())
+            elif isinstance(value, Tags):
+                stack.extend(value.tags)
+            elif isinstance(value, AWSHelperFn) and hasattr(value, "data"):
+                stack.append(value.data)
+            else:
+                # Objects with their own to_dict (or awacs JSONrepr)
+                encoded = encode_to_dict(value, False)
+                if encoded is not value:
+                    stack.append(encoded)
+
+    def _function(self, key, args, stack):
+        """Records the usage made by an intrinsic function call.
+
+        Returns True if the arguments have been pushed onto the stack.
+        """
+        if key == "Ref":
+            if isinstance(args, BaseAWSObject):
+                args = args.title
+            if isinstance(args, str):
+                self.names.add(args)
+                return True
+        elif key == "Condition":
+            if isinstance(args, str):
+                self.add_condition(args)
+                return True
+        elif key == "Fn::If":
+            if isinstance(args, list) and args and isinstance(args[0], str):
+                self.add_condition(args[0])
+                stack.extend(args[1:])
+                return True
+        elif key == "Fn::FindInMap":
+            if isinstance(args, list) and args:
+                if isinstance(args[0], str):
+                    self.mappings.add(args[0])
+                else:
+                    self.any_mapping = True
+        elif key == "Fn::Sub":
+            if isinstance(args, list) and len(args) == 2:
+                text, variables = args
+                if not isinstance(variables, dict):
+                    variables = {}
+            else:
+                text, variables = args, {}
+            if isinstance(text, str):
+                for name in _SUB_VARIABLE.findall(text):
+                    name = name.strip()
+                    if name not in variables:
+                        self.names.add(name.split(".", 1)[0])
+                stack.extend(variables.values())
+                return True
+        return False
+
+
+def _false_conditions(template, parameters):
+    """Returns the names of the conditions which are statically false."""
+    evaluator = Evaluator(parameters, template.mappings, template.conditions)
+    false = set()
+    for name in template.conditions:
+        try:
+            if not evaluator.condition(name):
+                false.add(name)
+        except UnresolvedError:
+            pass
+    return false
+
+
+def _remove_false(template, parameters, removed):
+    false = _false_conditions(template, parameters)
+    for section, objects in (
+        ("Resources", template.resources),
+        ("Outputs", template.outputs),
+    ):
+        for title, obj in list(objects.items()):
+            if obj.resource.get("Condition") in false:
+                del objects[title]
+                removed[section].append(title)
+
+    # Resources may only depend on resources which are created
+    gone = set(removed["Resources"])
+    if gone:
+        for resource in template.resources.values():
+            depends_on = resource.resource.get("DependsOn")
+            if depends_on is None:
+                continue
+            if not isinstance(depends_on, list):
+                depends_on = [depends_on]
+            kept = [target for target in depends_on if _title(target) not in gone]
+            if not kept:
+                del resource.resource["DependsOn"]
+            elif len(kept) != len(depends_on):
+                resource.resource["DependsOn"] = kept
+
+
+def prune_template(template, remove_resources=False, parameters=None):
+    """Removes the unused declarations of template in place.
+
+    With remove_resources=True the resources and outputs whose Condition is
+    statically false are removed first. parameters gives the values of
+    parameters and pseudo parameters to use when evaluating the conditions.
+
+    Returns a dict mapping each of Resources, Outputs, Parameters, Mappings
+    and Conditions to the list of the names removed from it.
+    """
+    removed = {section: [] for section in SECTIONS}
+    if remove_resources:
+        _remove_false(template, parameters or {}, removed)
+
+    usages = _Usages()
+    usages.add(list(template.resources.values()))
+    usages.add(list(template.outputs.values()))
+    usages.add(template.rules)
+    if template.globals:
+        usages.add(template.globals)
+
+    # Conditions used by the conditions in use, walking each one once
+    while usages.pending:
+        name = usages.pending.pop()
+        if name in template.conditions:
+            usages.add(template.conditions[name])
+
+    for section, declarations, used in (
+        ("Conditions", template.conditions, usages.conditions),
+        ("Parameters", template.parameters, usages.names),
+        ("Mappings", template.mappings, usages.mappings),
+    ):
+        if section == "Mappings" and usages.any_mapping:
+            continue
+        for name in list(declarations):
+            if name not in used:
+                del declarations[name]
+                removed[section].append(name)
+    return removed
+
+
+__all__ = ["prune_template"]
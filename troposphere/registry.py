@@ -0,0 +1,1090 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+#
+# *** Do not modify - this file is autogenerated ***
+"""
+Index of the classes TemplateGenerator can create so that it only has to
+import the modules used by a template.
+
+Regenerate with: python scripts/gen.py --index > troposphere/registry.py
+"""
+
+MODULES = (
+    "troposphere",
+    "troposphere.accessanalyzer",
+    "troposphere.acmpca",
+    "troposphere.amazonmq",
+    "troposphere.amplify",
+    "troposphere.analytics",
+    "troposphere.apigateway",
+    "troposphere.apigatewayv2",
+    "troposphere.appconfig",
+    "troposphere.appflow",
+    "troposphere.appintegrations",
+    "troposphere.applicationautoscaling",
+    "troposphere.applicationinsights",
+    "troposphere.appmesh",
+    "troposphere.apprunner",
+    "troposphere.appstream",
+    "troposphere.appsync",
+    "troposphere.aps",
+    "troposphere.ask",
+    "troposphere.athena",
+    "troposphere.auditmanager",
+    "troposphere.autoscaling",
+    "troposphere.autoscalingplans",
+    "troposphere.awslambda",
+    "troposphere.backup",
+    "troposphere.batch",
+    "troposphere.budgets",
+    "troposphere.cassandra",
+    "troposphere.ce",
+    "troposphere.certificatemanager",
+    "troposphere.chatbot",
+    "troposphere.cli",
+    "troposphere.cloud9",
+    "troposphere.cloudformation",
+    "troposphere.cloudfront",
+    "troposphere.cloudtrail",
+    "troposphere.cloudwatch",
+    "troposphere.codeartifact",
+    "troposphere.codebuild",
+    "troposphere.codecommit",
+    "troposphere.codedeploy",
+    "troposphere.codeguruprofiler",
+    "troposphere.codegurureviewer",
+    "troposphere.codepipeline",
+    "troposphere.codestar",
+    "troposphere.codestarconnections",
+    "troposphere.codestarnotifications",
+    "troposphere.cognito",
+    "troposphere.compat",
+    "troposphere.config",
+    "troposphere.connect",
+    "troposphere.constants",
+    "troposphere.cur",
+    "troposphere.customerprofiles",
+    "troposphere.databrew",
+    "troposphere.datapipeline",
+    "troposphere.datasync",
+    "troposphere.dax",
+    "troposphere.deploy",
+    "troposphere.detective",
+    "troposphere.devopsguru",
+    "troposphere.diff",
+    "troposphere.directoryservice",
+    "troposphere.dlm",
+    "troposphere.dms",
+    "troposphere.docdb",
+    "troposphere.dynamodb",
+    "troposphere.ec2",
+    "troposphere.ecr",
+    "troposphere.ecs",
+    "troposphere.efs",
+    "troposphere.eks",
+    "troposphere.elasticache",
+    "troposphere.elasticbeanstalk",
+    "troposphere.elasticloadbalancing",
+    "troposphere.elasticloadbalancingv2",
+    "troposphere.elasticsearch",
+    "troposphere.emr",
+    "troposphere.emrcontainers",
+    "troposphere.events",
+    "troposphere.eventschemas",
+    "troposphere.evidently",
+    "troposphere.finspace",
+    "troposphere.firehose",
+    "troposphere.fis",
+    "troposphere.fms",
+    "troposphere.frauddetector",
+    "troposphere.fsx",
+    "troposphere.gamelift",
+    "troposphere.globalaccelerator",
+    "troposphere.glue",
+    "troposphere.graph",
+    "troposphere.greengrass",
+    "troposphere.greengrassv2",
+    "troposphere.groundstation",
+    "troposphere.guardduty",
+    "troposphere.healthlake",
+    "troposphere.helpers.userdata",
+    "troposphere.iam",
+    "troposphere.imagebuilder",
+    "troposphere.inspector",
+    "troposphere.intrinsics",
+    "troposphere.iot",
+    "troposphere.iot1click",
+    "troposphere.iotanalytics",
+    "troposphere.iotcoredeviceadvisor",
+    "troposphere.iotevents",
+    "troposphere.iotfleethub",
+    "troposphere.iotsitewise",
+    "troposphere.iotwireless",
+    "troposphere.ivs",
+    "troposphere.json_backend",
+    "troposphere.json_writer",
+    "troposphere.kendra",
+    "troposphere.kinesis",
+    "troposphere.kinesisanalyticsv2",
+    "troposphere.kms",
+    "troposphere.lakeformation",
+    "troposphere.licensemanager",
+    "troposphere.lightsail",
+    "troposphere.location",
+    "troposphere.logs",
+    "troposphere.lookoutequipment",
+    "troposphere.lookoutmetrics",
+    "troposphere.lookoutvision",
+    "troposphere.macie",
+    "troposphere.managedblockchain",
+    "troposphere.mediaconnect",
+    "troposphere.mediaconvert",
+    "troposphere.medialive",
+    "troposphere.mediapackage",
+    "troposphere.mediastore",
+    "troposphere.memorydb",
+    "troposphere.msk",
+    "troposphere.mwaa",
+    "troposphere.neptune",
+    "troposphere.nested",
+    "troposphere.networkfirewall",
+    "troposphere.networkmanager",
+    "troposphere.nimblestudio",
+    "troposphere.opensearchservice",
+    "troposphere.opsworks",
+    "troposphere.panorama",
+    "troposphere.pinpoint",
+    "troposphere.pinpointemail",
+    "troposphere.policies",
+    "troposphere.prune",
+    "troposphere.qldb",
+    "troposphere.quicksight",
+    "troposphere.ram",
+    "troposphere.rds",
+    "troposphere.redshift",
+    "troposphere.registry",
+    "troposphere.rekognition",
+    "troposphere.resourcegroups",
+    "troposphere.robomaker",
+    "troposphere.route53",
+    "troposphere.route53recoverycontrol",
+    "troposphere.route53recoveryreadiness",
+    "troposphere.rum",
+    "troposphere.s3",
+    "troposphere.s3objectlambda",
+    "troposphere.s3outposts",
+    "troposphere.sagemaker",
+    "troposphere.sdb",
+    "troposphere.secretsmanager",
+    "troposphere.securityhub",
+    "troposphere.serverless",
+    "troposphere.servicecatalog",
+    "troposphere.servicecatalogappregistry",
+    "troposphere.servicediscovery",
+    "troposphere.ses",
+    "troposphere.signer",
+    "troposphere.size",
+    "troposphere.sns",
+    "troposphere.sqs",
+    "troposphere.ssm",
+    "troposphere.ssmcontacts",
+    "troposphere.ssmincidents",
+    "troposphere.sso",
+    "troposphere.stepfunctions",
+    "troposphere.synthetics",
+    "troposphere.template_generator",
+    "troposphere.timestream",
+    "troposphere.transfer",
+    "troposphere.utils",
+    "troposphere.validation",
+    "troposphere.validators.fsx",
+    "troposphere.validators.networkfirewall",
+    "troposphere.waf",
+    "troposphere.wafregional",
+    "troposphere.wafv2",
+    "troposphere.wisdom",
+    "troposphere.workspaces",
+    "troposphere.xray",
+    "troposphere.yaml_writer",
+)
+
+RESOURCE_TYPES = {
+    "AWS::ACMPCA::Certificate": "troposphere.acmpca:Certificate",
+    "AWS::ACMPCA::CertificateAuthority": "troposphere.acmpca:CertificateAuthority",
+    "AWS::ACMPCA::CertificateAuthorityActivation": "troposphere.acmpca:CertificateAuthorityActivation",
+    "AWS::ACMPCA::Permission": "troposphere.acmpca:Permission",
+    "AWS::APS::RuleGroupsNamespace": "troposphere.aps:RuleGroupsNamespace",
+    "AWS::APS::Workspace": "troposphere.aps:Workspace",
+    "AWS::AccessAnalyzer::Analyzer": "troposphere.accessanalyzer:Analyzer",
+    "AWS::AmazonMQ::Broker": "troposphere.amazonmq:Broker",
+    "AWS::AmazonMQ::Configuration": "troposphere.amazonmq:Configuration",
+    "AWS::AmazonMQ::ConfigurationAssociation": "troposphere.amazonmq:ConfigurationAssociation",
+    "AWS::Amplify::App": "troposphere.amplify:App",
+    "AWS::Amplify::Branch": "troposphere.amplify:Branch",
+    "AWS::Amplify::Domain": "troposphere.amplify:Domain",
+    "AWS::ApiGateway::Account": "troposphere.apigateway:Account",
+    "AWS::ApiGateway::ApiKey": "troposphere.apigateway:ApiKey",
+    "AWS::ApiGateway::Authorizer": "troposphere.apigateway:Authorizer",
+    "AWS::ApiGateway::BasePathMapping": "troposphere.apigateway:BasePathMapping",
+    "AWS::ApiGateway::ClientCertificate": "troposphere.apigateway:ClientCertificate",
+    "AWS::ApiGateway::Deployment": "troposphere.apigateway:Deployment",
+    "AWS::ApiGateway::DocumentationPart": "troposphere.apigateway:DocumentationPart",
+    "AWS::ApiGateway::DocumentationVersion": "troposphere.apigateway:DocumentationVersion",
+    "AWS::ApiGateway::DomainName": "troposphere.apigateway:DomainName",
+    "AWS::ApiGateway::GatewayResponse": "troposphere.apigateway:GatewayResponse",
+    "AWS::ApiGateway::Method": "troposphere.apigateway:Method",
+    "AWS::ApiGateway::Model": "troposphere.apigateway:Model",
+    "AWS::ApiGateway::RequestValidator": "troposphere.apigateway:RequestValidator",
+    "AWS::ApiGateway::Resource": "troposphere.apigateway:Resource",
+    "AWS::ApiGateway::RestApi": "troposphere.apigateway:RestApi",
+    "AWS::ApiGateway::Stage": "troposphere.apigateway:Stage",
+    "AWS::ApiGateway::UsagePlan": "troposphere.apigateway:UsagePlan",
+    "AWS::ApiGateway::UsagePlanKey": "troposphere.apigateway:UsagePlanKey",
+    "AWS::ApiGateway::VpcLink": "troposphere.apigateway:VpcLink",
+    "AWS::ApiGatewayV2::Api": "troposphere.apigatewayv2:Api",
+    "AWS::ApiGatewayV2::ApiMapping": "troposphere.apigatewayv2:ApiMapping",
+    "AWS::ApiGatewayV2::Authorizer": "troposphere.apigatewayv2:Authorizer",
+    "AWS::ApiGatewayV2::Deployment": "troposphere.apigatewayv2:Deployment",
+    "AWS::ApiGatewayV2::DomainName": "troposphere.apigatewayv2:DomainName",
+    "AWS::ApiGatewayV2::Integration": "troposphere.apigatewayv2:Integration",
+    "AWS::ApiGatewayV2::IntegrationResponse": "troposphere.apigatewayv2:IntegrationResponse",
+    "AWS::ApiGatewayV2::Model": "troposphere.apigatewayv2:Model",
+    "AWS::ApiGatewayV2::Route": "troposphere.apigatewayv2:Route",
+    "AWS::ApiGatewayV2::RouteResponse": "troposphere.apigatewayv2:RouteResponse",
+    "AWS::ApiGatewayV2::Stage": "troposphere.apigatewayv2:Stage",
+    "AWS::ApiGatewayV2::VpcLink": "troposphere.apigatewayv2:VpcLink",
+    "AWS::AppConfig::Application": "troposphere.appconfig:Application",
+    "AWS::AppConfig::ConfigurationProfile": "troposphere.appconfig:ConfigurationProfile",
+    "AWS::AppConfig::Deployment": "troposphere.appconfig:Deployment",
+    "AWS::AppConfig::DeploymentStrategy": "troposphere.appconfig:DeploymentStrategy",
+    "AWS::AppConfig::Environment": "troposphere.appconfig:Environment",
+    "AWS::AppConfig::HostedConfigurationVersion": "troposphere.appconfig:HostedConfigurationVersion",
+    "AWS::AppFlow::ConnectorProfile": "troposphere.appflow:ConnectorProfile",
+    "AWS::AppFlow::Flow": "troposphere.appflow:Flow",
+    "AWS::AppIntegrations::EventIntegration": "troposphere.appintegrations:EventIntegration",
+    "AWS::AppMesh::GatewayRoute": "troposphere.appmesh:GatewayRoute",
+    "AWS::AppMesh::Mesh": "troposphere.appmesh:Mesh",
+    "AWS::AppMesh::Route": "troposphere.appmesh:Route",
+    "AWS::AppMesh::VirtualGateway": "troposphere.appmesh:VirtualGateway",
+    "AWS::AppMesh::VirtualNode": "troposphere.appmesh:VirtualNode",
+    "AWS::AppMesh::VirtualRouter": "troposphere.appmesh:VirtualRouter",
+    "AWS::AppMesh::VirtualService": "troposphere.appmesh:VirtualService",
+    "AWS::AppRunner::Service": "troposphere.apprunner:Service",
+    "AWS::AppStream::AppBlock": "troposphere.appstream:AppBlock",
+    "AWS::AppStream::Application": "troposphere.appstream:Application",
+    "AWS::AppStream::ApplicationFleetAssociation": "troposphere.appstream:ApplicationFleetAssociation",
+    "AWS::AppStream::DirectoryConfig": "troposphere.appstream:DirectoryConfig",
+    "AWS::AppStream::Fleet": "troposphere.appstream:Fleet",
+    "AWS::AppStream::ImageBuilder": "troposphere.appstream:ImageBuilder",
+    "AWS::AppStream::Stack": "troposphere.appstream:Stack",
+    "AWS::AppStream::StackFleetAssociation": "troposphere.appstream:StackFleetAssociation",
+    "AWS::AppStream::StackUserAssociation": "troposphere.appstream:StackUserAssociation",
+    "AWS::AppStream::User": "troposphere.appstream:User",
+    "AWS::AppSync::ApiCache": "troposphere.appsync:ApiCache",
+    "AWS::AppSync::ApiKey": "troposphere.appsync:ApiKey",
+    "AWS::AppSync::DataSource": "troposphere.appsync:DataSource",
+    "AWS::AppSync::FunctionConfiguration": "troposphere.appsync:FunctionConfiguration",
+    "AWS::AppSync::GraphQLApi": "troposphere.appsync:GraphQLApi",
+    "AWS::AppSync::GraphQLSchema": "troposphere.appsync:GraphQLSchema",
+    "AWS::AppSync::Resolver": "troposphere.appsync:Resolver",
+    "AWS::ApplicationAutoScaling::ScalableTarget": "troposphere.applicationautoscaling:ScalableTarget",
+    "AWS::ApplicationAutoScaling::ScalingPolicy": "troposphere.applicationautoscaling:ScalingPolicy",
+    "AWS::ApplicationInsights::Application": "troposphere.applicationinsights:Application",
+    "AWS::Athena::DataCatalog": "troposphere.athena:DataCatalog",
+    "AWS::Athena::NamedQuery": "troposphere.athena:NamedQuery",
+    "AWS::Athena::PreparedStatement": "troposphere.athena:PreparedStatement",
+    "AWS::Athena::WorkGroup": "troposphere.athena:WorkGroup",
+    "AWS::AuditManager::Assessment": "troposphere.auditmanager:Assessment",
+    "AWS::AutoScaling::AutoScalingGroup": "troposphere.autoscaling:AutoScalingGroup",
+    "AWS::AutoScaling::LaunchConfiguration": "troposphere.autoscaling:LaunchConfiguration",
+    "AWS::AutoScaling::LifecycleHook": "troposphere.autoscaling:LifecycleHook",
+    "AWS::AutoScaling::ScalingPolicy": "troposphere.autoscaling:ScalingPolicy",
+    "AWS::AutoScaling::ScheduledAction": "troposphere.autoscaling:ScheduledAction",
+    "AWS::AutoScaling::Trigger": "troposphere.autoscaling:Trigger",
+    "AWS::AutoScaling::WarmPool": "troposphere.autoscaling:WarmPool",
+    "AWS::AutoScalingPlans::ScalingPlan": "troposphere.autoscalingplans:ScalingPlan",
+    "AWS::Backup::BackupPlan": "troposphere.backup:BackupPlan",
+    "AWS::Backup::BackupSelection": "troposphere.backup:BackupSelection",
+    "AWS::Backup::BackupVault": "troposphere.backup:BackupVault",
+    "AWS::Backup::Framework": "troposphere.backup:Framework",
+    "AWS::Backup::ReportPlan": "troposphere.backup:ReportPlan",
+    "AWS::Batch::ComputeEnvironment": "troposphere.batch:ComputeEnvironment",
+    "AWS::Batch::JobDefinition": "troposphere.batch:JobDefinition",
+    "AWS::Batch::JobQueue": "troposphere.batch:JobQueue",
+    "AWS::Batch::SchedulingPolicy": "troposphere.batch:SchedulingPolicy",
+    "AWS::Budgets::Budget": "troposphere.budgets:Budget",
+    "AWS::Budgets::BudgetsAction": "troposphere.budgets:BudgetsAction",
+    "AWS::CE::AnomalyMonitor": "troposphere.ce:AnomalyMonitor",
+    "AWS::CE::AnomalySubscription": "troposphere.ce:AnomalySubscription",
+    "AWS::CE::CostCategory": "troposphere.ce:CostCategory",
+    "AWS::CUR::ReportDefinition": "troposphere.cur:ReportDefinition",
+    "AWS::Cassandra::Keyspace": "troposphere.cassandra:Keyspace",
+    "AWS::Cassandra::Table": "troposphere.cassandra:Table",
+    "AWS::CertificateManager::Account": "troposphere.certificatemanager:Account",
+    "AWS::CertificateManager::Certificate": "troposphere.certificatemanager:Certificate",
+    "AWS::Chatbot::SlackChannelConfiguration": "troposphere.chatbot:SlackChannelConfiguration",
+    "AWS::Cloud9::EnvironmentEC2": "troposphere.cloud9:EnvironmentEC2",
+    "AWS::CloudFormation::CustomResource": "troposphere.cloudformation:CustomResource",
+    "AWS::CloudFormation::Macro": "troposphere.cloudformation:Macro",
+    "AWS::CloudFormation::ModuleDefaultVersion": "troposphere.cloudformation:ModuleDefaultVersion",
+    "AWS::CloudFormation::ModuleVersion": "troposphere.cloudformation:ModuleVersion",
+    "AWS::CloudFormation::PublicTypeVersion": "troposphere.cloudformation:PublicTypeVersion",
+    "AWS::CloudFormation::Publisher": "troposphere.cloudformation:Publisher",
+    "AWS::CloudFormation::ResourceDefaultVersion": "troposphere.cloudformation:ResourceDefaultVersion",
+    "AWS::CloudFormation::ResourceVersion": "troposphere.cloudformation:ResourceVersion",
+    "AWS::CloudFormation::Stack": "troposphere.cloudformation:Stack",
+    "AWS::CloudFormation::StackSet": "troposphere.cloudformation:StackSet",
+    "AWS::CloudFormation::TypeActivation": "troposphere.cloudformation:TypeActivation",
+    "AWS::CloudFormation::WaitCondition": "troposphere.cloudformation:WaitCondition",
+    "AWS::CloudFormation::WaitConditionHandle": "troposphere.cloudformation:WaitConditionHandle",
+    "AWS::CloudFront::CachePolicy": "troposphere.cloudfront:CachePolicy",
+    "AWS::CloudFront::CloudFrontOriginAccessIdentity": "troposphere.cloudfront:CloudFrontOriginAccessIdentity",
+    "AWS::CloudFront::Distribution": "troposphere.cloudfront:Distribution",
+    "AWS::CloudFront::Function": "troposphere.cloudfront:Function",
+    "AWS::CloudFront::KeyGroup": "troposphere.cloudfront:KeyGroup",
+    "AWS::CloudFront::OriginRequestPolicy": "troposphere.cloudfront:OriginRequestPolicy",
+    "AWS::CloudFront::PublicKey": "troposphere.cloudfront:PublicKey",
+    "AWS::CloudFront::RealtimeLogConfig": "troposphere.cloudfront:RealtimeLogConfig",
+    "AWS::CloudFront::ResponseHeadersPolicy": "troposphere.cloudfront:ResponseHeadersPolicy",
+    "AWS::CloudFront::StreamingDistribution": "troposphere.cloudfront:StreamingDistribution",
+    "AWS::CloudTrail::Trail": "troposphere.cloudtrail:Trail",
+    "AWS::CloudWatch::Alarm": "troposphere.cloudwatch:Alarm",
+    "AWS::CloudWatch::AnomalyDetector": "troposphere.cloudwatch:AnomalyDetector",
+    "AWS::CloudWatch::CompositeAlarm": "troposphere.cloudwatch:CompositeAlarm",
+    "AWS::CloudWatch::Dashboard": "troposphere.cloudwatch:Dashboard",
+    "AWS::CloudWatch::InsightRule": "troposphere.cloudwatch:InsightRule",
+    "AWS::CloudWatch::MetricStream": "troposphere.cloudwatch:MetricStream",
+    "AWS::CodeArtifact::Domain": "troposphere.codeartifact:Domain",
+    "AWS::CodeArtifact::Repository": "troposphere.codeartifact:Repository",
+    "AWS::CodeBuild::Project": "troposphere.codebuild:Project",
+    "AWS::CodeBuild::ReportGroup": "troposphere.codebuild:ReportGroup",
+    "AWS::CodeBuild::SourceCredential": "troposphere.codebuild:SourceCredential",
+    "AWS::CodeCommit::Repository": "troposphere.codecommit:Repository",
+    "AWS::CodeDeploy::Application": "troposphere.codedeploy:Application",
+    "AWS::CodeDeploy::DeploymentConfig": "troposphere.codedeploy:DeploymentConfig",
+    "AWS::CodeDeploy::DeploymentGroup": "troposphere.codedeploy:DeploymentGroup",
+    "AWS::CodeGuruProfiler::ProfilingGroup": "troposphere.codeguruprofiler:ProfilingGroup",
+    "AWS::CodeGuruReviewer::RepositoryAssociation": "troposphere.codegurureviewer:RepositoryAssociation",
+    "AWS::CodePipeline::CustomActionType": "troposphere.codepipeline:CustomActionType",
+    "AWS::CodePipeline::Pipeline": "troposphere.codepipeline:Pipeline",
+    "AWS::CodePipeline::Webhook": "troposphere.codepipeline:Webhook",
+    "AWS::CodeStar::GitHubRepository": "troposphere.codestar:GitHubRepository",
+    "AWS::CodeStarConnections::Connection": "troposphere.codestarconnections:Connection",
+    "AWS::CodeStarNotifications::NotificationRule": "troposphere.codestarnotifications:NotificationRule",
+    "AWS::Cognito::IdentityPool": "troposphere.cognito:IdentityPool",
+    "AWS::Cognito::IdentityPoolRoleAttachment": "troposphere.cognito:IdentityPoolRoleAttachment",
+    "AWS::Cognito::UserPool": "troposphere.cognito:UserPool",
+    "AWS::Cognito::UserPoolClient": "troposphere.cognito:UserPoolClient",
+    "AWS::Cognito::UserPoolDomain": "troposphere.cognito:UserPoolDomain",
+    "AWS::Cognito::UserPoolGroup": "troposphere.cognito:UserPoolGroup",
+    "AWS::Cognito::UserPoolIdentityProvider": "troposphere.cognito:UserPoolIdentityProvider",
+    "AWS::Cognito::UserPoolResourceServer": "troposphere.cognito:UserPoolResourceServer",
+    "AWS::Cognito::UserPoolRiskConfigurationAttachment": "troposphere.cognito:UserPoolRiskConfigurationAttachment",
+    "AWS::Cognito::UserPoolUICustomizationAttachment": "troposphere.cognito:UserPoolUICustomizationAttachment",
+    "AWS::Cognito::UserPoolUser": "troposphere.cognito:UserPoolUser",
+    "AWS::Cognito::UserPoolUserToGroupAttachment": "troposphere.cognito:UserPoolUserToGroupAttachment",
+    "AWS::Config::AggregationAuthorization": "troposphere.config:AggregationAuthorization",
+    "AWS::Config::ConfigRule": "troposphere.config:ConfigRule",
+    "AWS::Config::ConfigurationAggregator": "troposphere.config:ConfigurationAggregator",
+    "AWS::Config::ConfigurationRecorder": "troposphere.config:ConfigurationRecorder",
+    "AWS::Config::ConformancePack": "troposphere.config:ConformancePack",
+    "AWS::Config::DeliveryChannel": "troposphere.config:DeliveryChannel",
+    "AWS::Config::OrganizationConfigRule": "troposphere.config:OrganizationConfigRule",
+    "AWS::Config::OrganizationConformancePack": "troposphere.config:OrganizationConformancePack",
+    "AWS::Config::RemediationConfiguration": "troposphere.config:RemediationConfiguration",
+    "AWS::Config::StoredQuery": "troposphere.config:StoredQuery",
+    "AWS::Connect::QuickConnect": "troposphere.connect:QuickConnect",
+    "AWS::CustomerProfiles::Domain": "troposphere.customerprofiles:Domain",
+    "AWS::CustomerProfiles::Integration": "troposphere.customerprofiles:Integration",
+    "AWS::CustomerProfiles::ObjectType": "troposphere.customerprofiles:ObjectType",
+    "AWS::DAX::Cluster": "troposphere.dax:Cluster",
+    "AWS::DAX::ParameterGroup": "troposphere.dax:ParameterGroup",
+    "AWS::DAX::SubnetGroup": "troposphere.dax:SubnetGroup",
+    "AWS::DLM::LifecyclePolicy": "troposphere.dlm:LifecyclePolicy",
+    "AWS::DMS::Certificate": "troposphere.dms:Certificate",
+    "AWS::DMS::Endpoint": "troposphere.dms:Endpoint",
+    "AWS::DMS::EventSubscription": "troposphere.dms:EventSubscription",
+    "AWS::DMS::ReplicationInstance": "troposphere.dms:ReplicationInstance",
+    "AWS::DMS::ReplicationSubnetGroup": "troposphere.dms:ReplicationSubnetGroup",
+    "AWS::DMS::ReplicationTask": "troposphere.dms:ReplicationTask",
+    "AWS::DataBrew::Dataset": "troposphere.databrew:Dataset",
+    "AWS::DataBrew::Job": "troposphere.databrew:Job",
+    "AWS::DataBrew::Project": "troposphere.databrew:Project",
+    "AWS::DataBrew::Recipe": "troposphere.databrew:Recipe",
+    "AWS::DataBrew::Schedule": "troposphere.databrew:Schedule",
+    "AWS::DataPipeline::Pipeline": "troposphere.datapipeline:Pipeline",
+    "AWS::DataSync::Agent": "troposphere.datasync:Agent",
+    "AWS::DataSync::LocationEFS": "troposphere.datasync:LocationEFS",
+    "AWS::DataSync::LocationFSxWindows": "troposphere.datasync:LocationFSxWindows",
+    "AWS::DataSync::LocationHDFS": "troposphere.datasync:LocationHDFS",
+    "AWS::DataSync::LocationNFS": "troposphere.datasync:LocationNFS",
+    "AWS::DataSync::LocationObjectStorage": "troposphere.datasync:LocationObjectStorage",
+    "AWS::DataSync::LocationS3": "troposphere.datasync:LocationS3",
+    "AWS::DataSync::LocationSMB": "troposphere.datasync:LocationSMB",
+    "AWS::DataSync::Task": "troposphere.datasync:Task",
+    "AWS::Detective::Graph": "troposphere.detective:Graph",
+    "AWS::Detective::MemberInvitation": "troposphere.detective:MemberInvitation",
+    "AWS::DevOpsGuru::NotificationChannel": "troposphere.devopsguru:NotificationChannel",
+    "AWS::DevOpsGuru::ResourceCollection": "troposphere.devopsguru:ResourceCollection",
+    "AWS::DirectoryService::MicrosoftAD": "troposphere.directoryservice:MicrosoftAD",
+    "AWS::DirectoryService::SimpleAD": "troposphere.directoryservice:SimpleAD",
+    "AWS::DocDB::DBCluster": "troposphere.docdb:DBCluster",
+    "AWS::DocDB::DBClusterParameterGroup": "troposphere.docdb:DBClusterParameterGroup",
+    "AWS::DocDB::DBInstance": "troposphere.docdb:DBInstance",
+    "AWS::DocDB::DBSubnetGroup": "troposphere.docdb:DBSubnetGroup",
+    "AWS::DynamoDB::GlobalTable": "troposphere.dynamodb:GlobalTable",
+    "AWS::DynamoDB::Table": "troposphere.dynamodb:Table",
+    "AWS::EC2::CapacityReservation": "troposphere.ec2:CapacityReservation",
+    "AWS::EC2::CarrierGateway": "troposphere.ec2:CarrierGateway",
+    "AWS::EC2::ClientVpnAuthorizationRule": "troposphere.ec2:ClientVpnAuthorizationRule",
+    "AWS::EC2::ClientVpnEndpoint": "troposphere.ec2:ClientVpnEndpoint",
+    "AWS::EC2::ClientVpnRoute": "troposphere.ec2:ClientVpnRoute",
+    "AWS::EC2::ClientVpnTargetNetworkAssociation": "troposphere.ec2:ClientVpnTargetNetworkAssociation",
+    "AWS::EC2::CustomerGateway": "troposphere.ec2:CustomerGateway",
+    "AWS::EC2::DHCPOptions": "troposphere.ec2:DHCPOptions",
+    "AWS::EC2::EC2Fleet": "troposphere.ec2:EC2Fleet",
+    "AWS::EC2::EIP": "troposphere.ec2:EIP",
+    "AWS::EC2::EIPAssociation": "troposphere.ec2:EIPAssociation",
+    "AWS::EC2::EgressOnlyInternetGateway": "troposphere.ec2:EgressOnlyInternetGateway",
+    "AWS::EC2::EnclaveCertificateIamRoleAssociation": "troposphere.ec2:EnclaveCertificateIamRoleAssociation",
+    "AWS::EC2::FlowLog": "troposphere.ec2:FlowLog",
+    "AWS::EC2::GatewayRouteTableAssociation": "troposphere.ec2:GatewayRouteTableAssociation",
+    "AWS::EC2::Host": "troposphere.ec2:Host",
+    "AWS::EC2::Instance": "troposphere.ec2:Instance",
+    "AWS::EC2::InternetGateway": "troposphere.ec2:InternetGateway",
+    "AWS::EC2::LaunchTemplate": "troposphere.ec2:LaunchTemplate",
+    "AWS::EC2::LocalGatewayRoute": "troposphere.ec2:LocalGatewayRoute",
+    "AWS::EC2::LocalGatewayRouteTableVPCAssociation": "troposphere.ec2:LocalGatewayRouteTableVPCAssociation",
+    "AWS::EC2::NatGateway": "troposphere.ec2:NatGateway",
+    "AWS::EC2::NetworkAcl": "troposphere.ec2:NetworkAcl",
+    "AWS::EC2::NetworkAclEntry": "troposphere.ec2:NetworkAclEntry",
+    "AWS::EC2::NetworkInsightsAnalysis": "troposphere.ec2:NetworkInsightsAnalysis",
+    "AWS::EC2::NetworkInsightsPath": "troposphere.ec2:NetworkInsightsPath",
+    "AWS::EC2::NetworkInterface": "troposphere.ec2:NetworkInterface",
+    "AWS::EC2::NetworkInterfaceAttachment": "troposphere.ec2:NetworkInterfaceAttachment",
+    "AWS::EC2::NetworkInterfacePermission": "troposphere.ec2:NetworkInterfacePermission",
+    "AWS::EC2::PlacementGroup": "troposphere.ec2:PlacementGroup",
+    "AWS::EC2::PrefixList": "troposphere.ec2:PrefixList",
+    "AWS::EC2::Route": "troposphere.ec2:Route",
+    "AWS::EC2::RouteTable": "troposphere.ec2:RouteTable",
+    "AWS::EC2::SecurityGroup": "troposphere.ec2:SecurityGroup",
+    "AWS::EC2::SecurityGroupEgress": "troposphere.ec2:SecurityGroupEgress",
+    "AWS::EC2::SecurityGroupIngress": "troposphere.ec2:SecurityGroupIngress",
+    "AWS::EC2::SpotFleet": "troposphere.ec2:SpotFleet",
+    "AWS::EC2::Subnet": "troposphere.ec2:Subnet",
+    "AWS::EC2::SubnetCidrBlock": "troposphere.ec2:SubnetCidrBlock",
+    "AWS::EC2::SubnetNetworkAclAssociation": "troposphere.ec2:SubnetNetworkAclAssociation",
+    "AWS::EC2::SubnetRouteTableAssociation": "troposphere.ec2:SubnetRouteTableAssociation",
+    "AWS::EC2::TrafficMirrorFilter": "troposphere.ec2:TrafficMirrorFilter",
+    "AWS::EC2::TrafficMirrorFilterRule": "troposphere.ec2:TrafficMirrorFilterRule",
+    "AWS::EC2::TrafficMirrorSession": "troposphere.ec2:TrafficMirrorSession",
+    "AWS::EC2::TrafficMirrorTarget": "troposphere.ec2:TrafficMirrorTarget",
+    "AWS::EC2::TransitGateway": "troposphere.ec2:TransitGateway",
+    "AWS::EC2::TransitGatewayAttachment": "troposphere.ec2:TransitGatewayAttachment",
+    "AWS::EC2::TransitGatewayConnect": "troposphere.ec2:TransitGatewayConnect",
+    "AWS::EC2::TransitGatewayMulticastDomain": "troposphere.ec2:TransitGatewayMulticastDomain",
+    "AWS::EC2::TransitGatewayMulticastDomainAssociation": "troposphere.ec2:TransitGatewayMulticastDomainAssociation",
+    "AWS::EC2::TransitGatewayMulticastGroupMember": "troposphere.ec2:TransitGatewayMulticastGroupMember",
+    "AWS::EC2::TransitGatewayMulticastGroupSource": "troposphere.ec2:TransitGatewayMulticastGroupSource",
+    "AWS::EC2::TransitGatewayPeeringAttachment": "troposphere.ec2:TransitGatewayPeeringAttachment",
+    "AWS::EC2::TransitGatewayRoute": "troposphere.ec2:TransitGatewayRoute",
+    "AWS::EC2::TransitGatewayRouteTable": "troposphere.ec2:TransitGatewayRouteTable",
+    "AWS::EC2::TransitGatewayRouteTableAssociation": "troposphere.ec2:TransitGatewayRouteTableAssociation",
+    "AWS::EC2::TransitGatewayRouteTablePropagation": "troposphere.ec2:TransitGatewayRouteTablePropagation",
+    "AWS::EC2::VPC": "troposphere.ec2:VPC",
+    "AWS::EC2::VPCCidrBlock": "troposphere.ec2:VPCCidrBlock",
+    "AWS::EC2::VPCDHCPOptionsAssociation": "troposphere.ec2:VPCDHCPOptionsAssociation",
+    "AWS::EC2::VPCEndpoint": "troposphere.ec2:VPCEndpoint",
+    "AWS::EC2::VPCEndpointConnectionNotification": "troposphere.ec2:VPCEndpointConnectionNotification",
+    "AWS::EC2::VPCEndpointService": "troposphere.ec2:VPCEndpointService",
+    "AWS::EC2::VPCEndpointServicePermissions": "troposphere.ec2:VPCEndpointServicePermissions",
+    "AWS::EC2::VPCGatewayAttachment": "troposphere.ec2:VPCGatewayAttachment",
+    "AWS::EC2::VPCPeeringConnection": "troposphere.ec2:VPCPeeringConnection",
+    "AWS::EC2::VPNConnection": "troposphere.ec2:VPNConnection",
+    "AWS::EC2::VPNConnectionRoute": "troposphere.ec2:VPNConnectionRoute",
+    "AWS::EC2::VPNGateway": "troposphere.ec2:VPNGateway",
+    "AWS::EC2::VPNGatewayRoutePropagation": "troposphere.ec2:VPNGatewayRoutePropagation",
+    "AWS::EC2::Volume": "troposphere.ec2:Volume",
+    "AWS::EC2::VolumeAttachment": "troposphere.ec2:VolumeAttachment",
+    "AWS::ECR::PublicRepository": "troposphere.ecr:PublicRepository",
+    "AWS::ECR::RegistryPolicy": "troposphere.ecr:RegistryPolicy",
+    "AWS::ECR::ReplicationConfiguration": "troposphere.ecr:ReplicationConfiguration",
+    "AWS::ECR::Repository": "troposphere.ecr:Repository",
+    "AWS::ECS::CapacityProvider": "troposphere.ecs:CapacityProvider",
+    "AWS::ECS::Cluster": "troposphere.ecs:Cluster",
+    "AWS::ECS::ClusterCapacityProviderAssociations": "troposphere.ecs:ClusterCapacityProviderAssociations",
+    "AWS::ECS::PrimaryTaskSet": "troposphere.ecs:PrimaryTaskSet",
+    "AWS::ECS::Service": "troposphere.ecs:Service",
+    "AWS::ECS::TaskDefinition": "troposphere.ecs:TaskDefinition",
+    "AWS::ECS::TaskSet": "troposphere.ecs:TaskSet",
+    "AWS::EFS::AccessPoint": "troposphere.efs:AccessPoint",
+    "AWS::EFS::FileSystem": "troposphere.efs:FileSystem",
+    "AWS::EFS::MountTarget": "troposphere.efs:MountTarget",
+    "AWS::EKS::Addon": "troposphere.eks:Addon",
+    "AWS::EKS::Cluster": "troposphere.eks:Cluster",
+    "AWS::EKS::FargateProfile": "troposphere.eks:FargateProfile",
+    "AWS::EKS::Nodegroup": "troposphere.eks:Nodegroup",
+    "AWS::EMR::Cluster": "troposphere.emr:Cluster",
+    "AWS::EMR::InstanceFleetConfig": "troposphere.emr:InstanceFleetConfig",
+    "AWS::EMR::InstanceGroupConfig": "troposphere.emr:InstanceGroupConfig",
+    "AWS::EMR::SecurityConfiguration": "troposphere.emr:SecurityConfiguration",
+    "AWS::EMR::Step": "troposphere.emr:Step",
+    "AWS::EMR::Studio": "troposphere.emr:Studio",
+    "AWS::EMR::StudioSessionMapping": "troposphere.emr:StudioSessionMapping",
+    "AWS::EMRContainers::VirtualCluster": "troposphere.emrcontainers:VirtualCluster",
+    "AWS::ElastiCache::CacheCluster": "troposphere.elasticache:CacheCluster",
+    "AWS::ElastiCache::GlobalReplicationGroup": "troposphere.elasticache:GlobalReplicationGroup",
+    "AWS::ElastiCache::ParameterGroup": "troposphere.elasticache:ParameterGroup",
+    "AWS::ElastiCache::ReplicationGroup": "troposphere.elasticache:ReplicationGroup",
+    "AWS::ElastiCache::SecurityGroup": "troposphere.elasticache:SecurityGroup",
+    "AWS::ElastiCache::SecurityGroupIngress": "troposphere.elasticache:SecurityGroupIngress",
+    "AWS::ElastiCache::SubnetGroup": "troposphere.elasticache:SubnetGroup",
+    "AWS::ElasticBeanstalk::Application": "troposphere.elasticbeanstalk:Application",
+    "AWS::ElasticBeanstalk::ApplicationVersion": "troposphere.elasticbeanstalk:ApplicationVersion",
+    "AWS::ElasticBeanstalk::ConfigurationTemplate": "troposphere.elasticbeanstalk:ConfigurationTemplate",
+    "AWS::ElasticBeanstalk::Environment": "troposphere.elasticbeanstalk:Environment",
+    "AWS::ElasticLoadBalancing::LoadBalancer": "troposphere.elasticloadbalancing:LoadBalancer",
+    "AWS::ElasticLoadBalancingV2::Listener": "troposphere.elasticloadbalancingv2:Listener",
+    "AWS::ElasticLoadBalancingV2::ListenerCertificate": "troposphere.elasticloadbalancingv2:ListenerCertificate",
+    "AWS::ElasticLoadBalancingV2::ListenerRule": "troposphere.elasticloadbalancingv2:ListenerRule",
+    "AWS::ElasticLoadBalancingV2::LoadBalancer": "troposphere.elasticloadbalancingv2:LoadBalancer",
+    "AWS::ElasticLoadBalancingV2::TargetGroup": "troposphere.elasticloadbalancingv2:TargetGroup",
+    "AWS::Elasticsearch::Domain": "troposphere.elasticsearch:Domain",
+    "AWS::EventSchemas::Discoverer": "troposphere.eventschemas:Discoverer",
+    "AWS::EventSchemas::Registry": "troposphere.eventschemas:Registry",
+    "AWS::EventSchemas::RegistryPolicy": "troposphere.eventschemas:RegistryPolicy",
+    "AWS::EventSchemas::Schema": "troposphere.eventschemas:Schema",
+    "AWS::Events::ApiDestination": "troposphere.events:ApiDestination",
+    "AWS::Events::Archive": "troposphere.events:Archive",
+    "AWS::Events::Connection": "troposphere.events:Connection",
+    "AWS::Events::EventBus": "troposphere.events:EventBus",
+    "AWS::Events::EventBusPolicy": "troposphere.events:EventBusPolicy",
+    "AWS::Events::Rule": "troposphere.events:Rule",
+    "AWS::Evidently::Experiment": "troposphere.evidently:Experiment",
+    "AWS::Evidently::Feature": "troposphere.evidently:Feature",
+    "AWS::Evidently::Launch": "troposphere.evidently:Launch",
+    "AWS::Evidently::Project": "troposphere.evidently:Project",
+    "AWS::FIS::ExperimentTemplate": "troposphere.fis:ExperimentTemplate",
+    "AWS::FMS::NotificationChannel": "troposphere.fms:NotificationChannel",
+    "AWS::FMS::Policy": "troposphere.fms:Policy",
+    "AWS::FSx::FileSystem": "troposphere.fsx:FileSystem",
+    "AWS::FinSpace::Environment": "troposphere.finspace:Environment",
+    "AWS::FraudDetector::Detector": "troposphere.frauddetector:Detector",
+    "AWS::FraudDetector::Variable": "troposphere.frauddetector:Variable",
+    "AWS::GameLift::Alias": "troposphere.gamelift:Alias",
+    "AWS::GameLift::Build": "troposphere.gamelift:Build",
+    "AWS::GameLift::Fleet": "troposphere.gamelift:Fleet",
+    "AWS::GameLift::GameServerGroup": "troposphere.gamelift:GameServerGroup",
+    "AWS::GameLift::GameSessionQueue": "troposphere.gamelift:GameSessionQueue",
+    "AWS::GameLift::MatchmakingConfiguration": "troposphere.gamelift:MatchmakingConfiguration",
+    "AWS::GameLift::MatchmakingRuleSet": "troposphere.gamelift:MatchmakingRuleSet",
+    "AWS::GameLift::Script": "troposphere.gamelift:Script",
+    "AWS::GlobalAccelerator::Accelerator": "troposphere.globalaccelerator:Accelerator",
+    "AWS::GlobalAccelerator::EndpointGroup": "troposphere.globalaccelerator:EndpointGroup",
+    "AWS::GlobalAccelerator::Listener": "troposphere.globalaccelerator:Listener",
+    "AWS::Glue::Classifier": "troposphere.glue:Classifier",
+    "AWS::Glue::Connection": "troposphere.glue:Connection",
+    "AWS::Glue::Crawler": "troposphere.glue:Crawler",
+    "AWS::Glue::DataCatalogEncryptionSettings": "troposphere.glue:DataCatalogEncryptionSettings",
+    "AWS::Glue::Database": "troposphere.glue:Database",
+    "AWS::Glue::DevEndpoint": "troposphere.glue:DevEndpoint",
+    "AWS::Glue::Job": "troposphere.glue:Job",
+    "AWS::Glue::MLTransform": "troposphere.glue:MLTransform",
+    "AWS::Glue::Partition": "troposphere.glue:Partition",
+    "AWS::Glue::Registry": "troposphere.glue:Registry",
+    "AWS::Glue::Schema": "troposphere.glue:Schema",
+    "AWS::Glue::SchemaVersionMetadata": "troposphere.glue:SchemaVersionMetadata",
+    "AWS::Glue::SecurityConfiguration": "troposphere.glue:SecurityConfiguration",
+    "AWS::Glue::Table": "troposphere.glue:Table",
+    "AWS::Glue::Trigger": "troposphere.glue:Trigger",
+    "AWS::Glue::Workflow": "troposphere.glue:Workflow",
+    "AWS::Greengrass::ConnectorDefinition": "troposphere.greengrass:ConnectorDefinition",
+    "AWS::Greengrass::ConnectorDefinitionVersion": "troposphere.greengrass:ConnectorDefinitionVersion",
+    "AWS::Greengrass::CoreDefinition": "troposphere.greengrass:CoreDefinition",
+    "AWS::Greengrass::CoreDefinitionVersion": "troposphere.greengrass:CoreDefinitionVersion",
+    "AWS::Greengrass::DeviceDefinition": "troposphere.greengrass:DeviceDefinition",
+    "AWS::Greengrass::DeviceDefinitionVersion": "troposphere.greengrass:DeviceDefinitionVersion",
+    "AWS::Greengrass::FunctionDefinition": "troposphere.greengrass:FunctionDefinition",
+    "AWS::Greengrass::FunctionDefinitionVersion": "troposphere.greengrass:FunctionDefinitionVersion",
+    "AWS::Greengrass::Group": "troposphere.greengrass:Group",
+    "AWS::Greengrass::GroupVersion": "troposphere.greengrass:GroupVersion",
+    "AWS::Greengrass::LoggerDefinition": "troposphere.greengrass:LoggerDefinition",
+    "AWS::Greengrass::LoggerDefinitionVersion": "troposphere.greengrass:LoggerDefinitionVersion",
+    "AWS::Greengrass::ResourceDefinition": "troposphere.greengrass:ResourceDefinition",
+    "AWS::Greengrass::ResourceDefinitionVersion": "troposphere.greengrass:ResourceDefinitionVersion",
+    "AWS::Greengrass::SubscriptionDefinition": "troposphere.greengrass:SubscriptionDefinition",
+    "AWS::Greengrass::SubscriptionDefinitionVersion": "troposphere.greengrass:SubscriptionDefinitionVersion",
+    "AWS::GreengrassV2::ComponentVersion": "troposphere.greengrassv2:ComponentVersion",
+    "AWS::GroundStation::Config": "troposphere.groundstation:Config",
+    "AWS::GroundStation::DataflowEndpointGroup": "troposphere.groundstation:DataflowEndpointGroup",
+    "AWS::GroundStation::MissionProfile": "troposphere.groundstation:MissionProfile",
+    "AWS::GuardDuty::Detector": "troposphere.guardduty:Detector",
+    "AWS::GuardDuty::Filter": "troposphere.guardduty:Filter",
+    "AWS::GuardDuty::IPSet": "troposphere.guardduty:IPSet",
+    "AWS::GuardDuty::Master": "troposphere.guardduty:Master",
+    "AWS::GuardDuty::Member": "troposphere.guardduty:Member",
+    "AWS::GuardDuty::ThreatIntelSet": "troposphere.guardduty:ThreatIntelSet",
+    "AWS::HealthLake::FHIRDatastore": "troposphere.healthlake:FHIRDatastore",
+    "AWS::IAM::AccessKey": "troposphere.iam:AccessKey",
+    "AWS::IAM::Group": "troposphere.iam:Group",
+    "AWS::IAM::InstanceProfile": "troposphere.iam:InstanceProfile",
+    "AWS::IAM::ManagedPolicy": "troposphere.iam:ManagedPolicy",
+    "AWS::IAM::OIDCProvider": "troposphere.iam:OIDCProvider",
+    "AWS::IAM::Policy": "troposphere.iam:PolicyType",
+    "AWS::IAM::Role": "troposphere.iam:Role",
+    "AWS::IAM::SAMLProvider": "troposphere.iam:SAMLProvider",
+    "AWS::IAM::ServerCertificate": "troposphere.iam:ServerCertificate",
+    "AWS::IAM::ServiceLinkedRole": "troposphere.iam:ServiceLinkedRole",
+    "AWS::IAM::User": "troposphere.iam:User",
+    "AWS::IAM::UserToGroupAddition": "troposphere.iam:UserToGroupAddition",
+    "AWS::IAM::VirtualMFADevice": "troposphere.iam:VirtualMFADevice",
+    "AWS::IVS::Channel": "troposphere.ivs:Channel",
+    "AWS::IVS::PlaybackKeyPair": "troposphere.ivs:PlaybackKeyPair",
+    "AWS::IVS::RecordingConfiguration": "troposphere.ivs:RecordingConfiguration",
+    "AWS::IVS::StreamKey": "troposphere.ivs:StreamKey",
+    "AWS::ImageBuilder::Component": "troposphere.imagebuilder:Component",
+    "AWS::ImageBuilder::ContainerRecipe": "troposphere.imagebuilder:ContainerRecipe",
+    "AWS::ImageBuilder::DistributionConfiguration": "troposphere.imagebuilder:DistributionConfiguration",
+    "AWS::ImageBuilder::Image": "troposphere.imagebuilder:Image",
+    "AWS::ImageBuilder::ImagePipeline": "troposphere.imagebuilder:ImagePipeline",
+    "AWS::ImageBuilder::ImageRecipe": "troposphere.imagebuilder:ImageRecipe",
+    "AWS::ImageBuilder::InfrastructureConfiguration": "troposphere.imagebuilder:InfrastructureConfiguration",
+    "AWS::Inspector::AssessmentTarget": "troposphere.inspector:AssessmentTarget",
+    "AWS::Inspector::AssessmentTemplate": "troposphere.inspector:AssessmentTemplate",
+    "AWS::Inspector::ResourceGroup": "troposphere.inspector:ResourceGroup",
+    "AWS::IoT1Click::Device": "troposphere.iot1click:Device",
+    "AWS::IoT1Click::Placement": "troposphere.iot1click:Placement",
+    "AWS::IoT1Click::Project": "troposphere.iot1click:Project",
+    "AWS::IoT::AccountAuditConfiguration": "troposphere.iot:AccountAuditConfiguration",
+    "AWS::IoT::Authorizer": "troposphere.iot:Authorizer",
+    "AWS::IoT::Certificate": "troposphere.iot:Certificate",
+    "AWS::IoT::CustomMetric": "troposphere.iot:CustomMetric",
+    "AWS::IoT::Dimension": "troposphere.iot:Dimension",
+    "AWS::IoT::DomainConfiguration": "troposphere.iot:DomainConfiguration",
+    "AWS::IoT::FleetMetric": "troposphere.iot:FleetMetric",
+    "AWS::IoT::JobTemplate": "troposphere.iot:JobTemplate",
+    "AWS::IoT::Logging": "troposphere.iot:Logging",
+    "AWS::IoT::MitigationAction": "troposphere.iot:MitigationAction",
+    "AWS::IoT::Policy": "troposphere.iot:Policy",
+    "AWS::IoT::PolicyPrincipalAttachment": "troposphere.iot:PolicyPrincipalAttachment",
+    "AWS::IoT::ProvisioningTemplate": "troposphere.iot:ProvisioningTemplate",
+    "AWS::IoT::ResourceSpecificLogging": "troposphere.iot:ResourceSpecificLogging",
+    "AWS::IoT::ScheduledAudit": "troposphere.iot:ScheduledAudit",
+    "AWS::IoT::SecurityProfile": "troposphere.iot:SecurityProfile",
+    "AWS::IoT::Thing": "troposphere.iot:Thing",
+    "AWS::IoT::ThingPrincipalAttachment": "troposphere.iot:ThingPrincipalAttachment",
+    "AWS::IoT::TopicRule": "troposphere.iot:TopicRule",
+    "AWS::IoT::TopicRuleDestination": "troposphere.iot:TopicRuleDestination",
+    "AWS::IoTAnalytics::Channel": "troposphere.iotanalytics:Channel",
+    "AWS::IoTAnalytics::Dataset": "troposphere.iotanalytics:Dataset",
+    "AWS::IoTAnalytics::Datastore": "troposphere.iotanalytics:Datastore",
+    "AWS::IoTAnalytics::Pipeline": "troposphere.iotanalytics:Pipeline",
+    "AWS::IoTCoreDeviceAdvisor::SuiteDefinition": "troposphere.iotcoredeviceadvisor:SuiteDefinition",
+    "AWS::IoTEvents::DetectorModel": "troposphere.iotevents:DetectorModel",
+    "AWS::IoTEvents::Input": "troposphere.iotevents:Input",
+    "AWS::IoTFleetHub::Application": "troposphere.iotfleethub:Application",
+    "AWS::IoTSiteWise::AccessPolicy": "troposphere.iotsitewise:AccessPolicy",
+    "AWS::IoTSiteWise::Asset": "troposphere.iotsitewise:Asset",
+    "AWS::IoTSiteWise::AssetModel": "troposphere.iotsitewise:AssetModel",
+    "AWS::IoTSiteWise::Dashboard": "troposphere.iotsitewise:Dashboard",
+    "AWS::IoTSiteWise::Gateway": "troposphere.iotsitewise:Gateway",
+    "AWS::IoTSiteWise::Portal": "troposphere.iotsitewise:Portal",
+    "AWS::IoTWireless::Destination": "troposphere.iotwireless:Destination",
+    "AWS::IoTWireless::DeviceProfile": "troposphere.iotwireless:DeviceProfile",
+    "AWS::IoTWireless::FuotaTask": "troposphere.iotwireless:FuotaTask",
+    "AWS::IoTWireless::MulticastGroup": "troposphere.iotwireless:MulticastGroup",
+    "AWS::IoTWireless::PartnerAccount": "troposphere.iotwireless:PartnerAccount",
+    "AWS::IoTWireless::ServiceProfile": "troposphere.iotwireless:ServiceProfile",
+    "AWS::IoTWireless::TaskDefinition": "troposphere.iotwireless:TaskDefinition",
+    "AWS::IoTWireless::WirelessDevice": "troposphere.iotwireless:WirelessDevice",
+    "AWS::IoTWireless::WirelessGateway": "troposphere.iotwireless:WirelessGateway",
+    "AWS::KMS::Alias": "troposphere.kms:Alias",
+    "AWS::KMS::Key": "troposphere.kms:Key",
+    "AWS::KMS::ReplicaKey": "troposphere.kms:ReplicaKey",
+    "AWS::Kendra::DataSource": "troposphere.kendra:DataSource",
+    "AWS::Kendra::Faq": "troposphere.kendra:Faq",
+    "AWS::Kendra::Index": "troposphere.kendra:Index",
+    "AWS::Kinesis::Stream": "troposphere.kinesis:Stream",
+    "AWS::Kinesis::StreamConsumer": "troposphere.kinesis:StreamConsumer",
+    "AWS::KinesisAnalytics::Application": "troposphere.analytics:Application",
+    "AWS::KinesisAnalytics::ApplicationOutput": "troposphere.analytics:ApplicationOutput",
+    "AWS::KinesisAnalytics::ApplicationReferenceDataSource": "troposphere.analytics:ApplicationReferenceDataSource",
+    "AWS::KinesisAnalyticsV2::Application": "troposphere.kinesisanalyticsv2:Application",
+    "AWS::KinesisAnalyticsV2::ApplicationCloudWatchLoggingOption": "troposphere.kinesisanalyticsv2:ApplicationCloudWatchLoggingOption",
+    "AWS::KinesisAnalyticsV2::ApplicationOutput": "troposphere.kinesisanalyticsv2:ApplicationOutput",
+    "AWS::KinesisAnalyticsV2::ApplicationReferenceDataSource": "troposphere.kinesisanalyticsv2:ApplicationReferenceDataSource",
+    "AWS::KinesisFirehose::DeliveryStream": "troposphere.firehose:DeliveryStream",
+    "AWS::LakeFormation::DataLakeSettings": "troposphere.lakeformation:DataLakeSettings",
+    "AWS::LakeFormation::Permissions": "troposphere.lakeformation:Permissions",
+    "AWS::Lambda::Alias": "troposphere.awslambda:Alias",
+    "AWS::Lambda::CodeSigningConfig": "troposphere.awslambda:CodeSigningConfig",
+    "AWS::Lambda::EventInvokeConfig": "troposphere.awslambda:EventInvokeConfig",
+    "AWS::Lambda::EventSourceMapping": "troposphere.awslambda:EventSourceMapping",
+    "AWS::Lambda::Function": "troposphere.awslambda:Function",
+    "AWS::Lambda::LayerVersion": "troposphere.awslambda:LayerVersion",
+    "AWS::Lambda::LayerVersionPermission": "troposphere.awslambda:LayerVersionPermission",
+    "AWS::Lambda::Permission": "troposphere.awslambda:Permission",
+    "AWS::Lambda::Version": "troposphere.awslambda:Version",
+    "AWS::LicenseManager::Grant": "troposphere.licensemanager:Grant",
+    "AWS::LicenseManager::License": "troposphere.licensemanager:License",
+    "AWS::Lightsail::Database": "troposphere.lightsail:Database",
+    "AWS::Lightsail::Disk": "troposphere.lightsail:Disk",
+    "AWS::Lightsail::Instance": "troposphere.lightsail:Instance",
+    "AWS::Lightsail::StaticIp": "troposphere.lightsail:StaticIp",
+    "AWS::Location::GeofenceCollection": "troposphere.location:GeofenceCollection",
+    "AWS::Location::Map": "troposphere.location:Map",
+    "AWS::Location::PlaceIndex": "troposphere.location:PlaceIndex",
+    "AWS::Location::RouteCalculator": "troposphere.location:RouteCalculator",
+    "AWS::Location::Tracker": "troposphere.location:Tracker",
+    "AWS::Location::TrackerConsumer": "troposphere.location:TrackerConsumer",
+    "AWS::Logs::Destination": "troposphere.logs:Destination",
+    "AWS::Logs::LogGroup": "troposphere.logs:LogGroup",
+    "AWS::Logs::LogStream": "troposphere.logs:LogStream",
+    "AWS::Logs::MetricFilter": "troposphere.logs:MetricFilter",
+    "AWS::Logs::QueryDefinition": "troposphere.logs:QueryDefinition",
+    "AWS::Logs::ResourcePolicy": "troposphere.logs:ResourcePolicy",
+    "AWS::Logs::SubscriptionFilter": "troposphere.logs:SubscriptionFilter",
+    "AWS::LookoutEquipment::InferenceScheduler": "troposphere.lookoutequipment:InferenceScheduler",
+    "AWS::LookoutMetrics::Alert": "troposphere.lookoutmetrics:Alert",
+    "AWS::LookoutMetrics::AnomalyDetector": "troposphere.lookoutmetrics:AnomalyDetector",
+    "AWS::LookoutVision::Project": "troposphere.lookoutvision:Project",
+    "AWS::MSK::Cluster": "troposphere.msk:Cluster",
+    "AWS::MWAA::Environment": "troposphere.mwaa:Environment",
+    "AWS::Macie::CustomDataIdentifier": "troposphere.macie:CustomDataIdentifier",
+    "AWS::Macie::FindingsFilter": "troposphere.macie:FindingsFilter",
+    "AWS::Macie::Session": "troposphere.macie:Session",
+    "AWS::ManagedBlockchain::Member": "troposphere.managedblockchain:Member",
+    "AWS::ManagedBlockchain::Node": "troposphere.managedblockchain:Node",
+    "AWS::MediaConnect::Flow": "troposphere.mediaconnect:Flow",
+    "AWS::MediaConnect::FlowEntitlement": "troposphere.mediaconnect:FlowEntitlement",
+    "AWS::MediaConnect::FlowOutput": "troposphere.mediaconnect:FlowOutput",
+    "AWS::MediaConnect::FlowSource": "troposphere.mediaconnect:FlowSource",
+    "AWS::MediaConnect::FlowVpcInterface": "troposphere.mediaconnect:FlowVpcInterface",
+    "AWS::MediaConvert::JobTemplate": "troposphere.mediaconvert:JobTemplate",
+    "AWS::MediaConvert::Preset": "troposphere.mediaconvert:Preset",
+    "AWS::MediaConvert::Queue": "troposphere.mediaconvert:Queue",
+    "AWS::MediaLive::Channel": "troposphere.medialive:Channel",
+    "AWS::MediaLive::Input": "troposphere.medialive:Input",
+    "AWS::MediaLive::InputSecurityGroup": "troposphere.medialive:InputSecurityGroup",
+    "AWS::MediaPackage::Asset": "troposphere.mediapackage:Asset",
+    "AWS::MediaPackage::Channel": "troposphere.mediapackage:Channel",
+    "AWS::MediaPackage::OriginEndpoint": "troposphere.mediapackage:OriginEndpoint",
+    "AWS::MediaPackage::PackagingConfiguration": "troposphere.mediapackage:PackagingConfiguration",
+    "AWS::MediaPackage::PackagingGroup": "troposphere.mediapackage:PackagingGroup",
+    "AWS::MediaStore::Container": "troposphere.mediastore:Container",
+    "AWS::MemoryDB::ACL": "troposphere.memorydb:ACL",
+    "AWS::MemoryDB::Cluster": "troposphere.memorydb:Cluster",
+    "AWS::MemoryDB::ParameterGroup": "troposphere.memorydb:ParameterGroup",
+    "AWS::MemoryDB::SubnetGroup": "troposphere.memorydb:SubnetGroup",
+    "AWS::MemoryDB::User": "troposphere.memorydb:User",
+    "AWS::Neptune::DBCluster": "troposphere.neptune:DBCluster",
+    "AWS::Neptune::DBClusterParameterGroup": "troposphere.neptune:DBClusterParameterGroup",
+    "AWS::Neptune::DBInstance": "troposphere.neptune:DBInstance",
+    "AWS::Neptune::DBParameterGroup": "troposphere.neptune:DBParameterGroup",
+    "AWS::Neptune::DBSubnetGroup": "troposphere.neptune:DBSubnetGroup",
+    "AWS::NetworkFirewall::Firewall": "troposphere.networkfirewall:Firewall",
+    "AWS::NetworkFirewall::FirewallPolicy": "troposphere.networkfirewall:FirewallPolicy",
+    "AWS::NetworkFirewall::LoggingConfiguration": "troposphere.networkfirewall:LoggingConfiguration",
+    "AWS::NetworkFirewall::RuleGroup": "troposphere.networkfirewall:RuleGroup",
+    "AWS::NetworkManager::CustomerGatewayAssociation": "troposphere.networkmanager:CustomerGatewayAssociation",
+    "AWS::NetworkManager::Device": "troposphere.networkmanager:Device",
+    "AWS::NetworkManager::GlobalNetwork": "troposphere.networkmanager:GlobalNetwork",
+    "AWS::NetworkManager::Link": "troposphere.networkmanager:Link",
+    "AWS::NetworkManager::LinkAssociation": "troposphere.networkmanager:LinkAssociation",
+    "AWS::NetworkManager::Site": "troposphere.networkmanager:Site",
+    "AWS::NetworkManager::TransitGatewayRegistration": "troposphere.networkmanager:TransitGatewayRegistration",
+    "AWS::NimbleStudio::LaunchProfile": "troposphere.nimblestudio:LaunchProfile",
+    "AWS::NimbleStudio::StreamingImage": "troposphere.nimblestudio:StreamingImage",
+    "AWS::NimbleStudio::Studio": "troposphere.nimblestudio:Studio",
+    "AWS::NimbleStudio::StudioComponent": "troposphere.nimblestudio:StudioComponent",
+    "AWS::OpenSearchService::Domain": "troposphere.opensearchservice:Domain",
+    "AWS::OpsWorks::App": "troposphere.opsworks:App",
+    "AWS::OpsWorks::ElasticLoadBalancerAttachment": "troposphere.opsworks:ElasticLoadBalancerAttachment",
+    "AWS::OpsWorks::Instance": "troposphere.opsworks:Instance",
+    "AWS::OpsWorks::Layer": "troposphere.opsworks:Layer",
+    "AWS::OpsWorks::Stack": "troposphere.opsworks:Stack",
+    "AWS::OpsWorks::UserProfile": "troposphere.opsworks:UserProfile",
+    "AWS::OpsWorks::Volume": "troposphere.opsworks:Volume",
+    "AWS::OpsWorksCM::Server": "troposphere.opsworks:Server",
+    "AWS::Panorama::ApplicationInstance": "troposphere.panorama:ApplicationInstance",
+    "AWS::Panorama::Package": "troposphere.panorama:Package",
+    "AWS::Panorama::PackageVersion": "troposphere.panorama:PackageVersion",
+    "AWS::Pinpoint::ADMChannel": "troposphere.pinpoint:ADMChannel",
+    "AWS::Pinpoint::APNSChannel": "troposphere.pinpoint:APNSChannel",
+    "AWS::Pinpoint::APNSSandboxChannel": "troposphere.pinpoint:APNSSandboxChannel",
+    "AWS::Pinpoint::APNSVoipChannel": "troposphere.pinpoint:APNSVoipChannel",
+    "AWS::Pinpoint::APNSVoipSandboxChannel": "troposphere.pinpoint:APNSVoipSandboxChannel",
+    "AWS::Pinpoint::App": "troposphere.pinpoint:App",
+    "AWS::Pinpoint::ApplicationSettings": "troposphere.pinpoint:ApplicationSettings",
+    "AWS::Pinpoint::BaiduChannel": "troposphere.pinpoint:BaiduChannel",
+    "AWS::Pinpoint::Campaign": "troposphere.pinpoint:Campaign",
+    "AWS::Pinpoint::EmailChannel": "troposphere.pinpoint:EmailChannel",
+    "AWS::Pinpoint::EmailTemplate": "troposphere.pinpoint:EmailTemplate",
+    "AWS::Pinpoint::EventStream": "troposphere.pinpoint:EventStream",
+    "AWS::Pinpoint::GCMChannel": "troposphere.pinpoint:GCMChannel",
+    "AWS::Pinpoint::InAppTemplate": "troposphere.pinpoint:InAppTemplate",
+    "AWS::Pinpoint::PushTemplate": "troposphere.pinpoint:PushTemplate",
+    "AWS::Pinpoint::SMSChannel": "troposphere.pinpoint:SMSChannel",
+    "AWS::Pinpoint::Segment": "troposphere.pinpoint:Segment",
+    "AWS::Pinpoint::SmsTemplate": "troposphere.pinpoint:SmsTemplate",
+    "AWS::Pinpoint::VoiceChannel": "troposphere.pinpoint:VoiceChannel",
+    "AWS::PinpointEmail::ConfigurationSet": "troposphere.pinpointemail:ConfigurationSet",
+    "AWS::PinpointEmail::ConfigurationSetEventDestination": "troposphere.pinpointemail:ConfigurationSetEventDestination",
+    "AWS::PinpointEmail::DedicatedIpPool": "troposphere.pinpointemail:DedicatedIpPool",
+    "AWS::PinpointEmail::Identity": "troposphere.pinpointemail:Identity",
+    "AWS::QLDB::Ledger": "troposphere.qldb:Ledger",
+    "AWS::QLDB::Stream": "troposphere.qldb:Stream",
+    "AWS::QuickSight::Analysis": "troposphere.quicksight:Analysis",
+    "AWS::QuickSight::Dashboard": "troposphere.quicksight:Dashboard",
+    "AWS::QuickSight::Template": "troposphere.quicksight:Template",
+    "AWS::QuickSight::Theme": "troposphere.quicksight:Theme",
+    "AWS::RAM::ResourceShare": "troposphere.ram:ResourceShare",
+    "AWS::RDS::DBCluster": "troposphere.rds:DBCluster",
+    "AWS::RDS::DBClusterParameterGroup": "troposphere.rds:DBClusterParameterGroup",
+    "AWS::RDS::DBInstance": "troposphere.rds:DBInstance",
+    "AWS::RDS::DBParameterGroup": "troposphere.rds:DBParameterGroup",
+    "AWS::RDS::DBProxy": "troposphere.rds:DBProxy",
+    "AWS::RDS::DBProxyEndpoint": "troposphere.rds:DBProxyEndpoint",
+    "AWS::RDS::DBProxyTargetGroup": "troposphere.rds:DBProxyTargetGroup",
+    "AWS::RDS::DBSecurityGroup": "troposphere.rds:DBSecurityGroup",
+    "AWS::RDS::DBSecurityGroupIngress": "troposphere.rds:DBSecurityGroupIngress",
+    "AWS::RDS::DBSubnetGroup": "troposphere.rds:DBSubnetGroup",
+    "AWS::RDS::EventSubscription": "troposphere.rds:EventSubscription",
+    "AWS::RDS::GlobalCluster": "troposphere.rds:GlobalCluster",
+    "AWS::RDS::OptionGroup": "troposphere.rds:OptionGroup",
+    "AWS::RUM::AppMonitor": "troposphere.rum:AppMonitor",
+    "AWS::Redshift::Cluster": "troposphere.redshift:Cluster",
+    "AWS::Redshift::ClusterParameterGroup": "troposphere.redshift:ClusterParameterGroup",
+    "AWS::Redshift::ClusterSecurityGroup": "troposphere.redshift:ClusterSecurityGroup",
+    "AWS::Redshift::ClusterSecurityGroupIngress": "troposphere.redshift:ClusterSecurityGroupIngress",
+    "AWS::Redshift::ClusterSubnetGroup": "troposphere.redshift:ClusterSubnetGroup",
+    "AWS::Redshift::EndpointAccess": "troposphere.redshift:EndpointAccess",
+    "AWS::Redshift::EndpointAuthorization": "troposphere.redshift:EndpointAuthorization",
+    "AWS::Redshift::EventSubscription": "troposphere.redshift:EventSubscription",
+    "AWS::Redshift::ScheduledAction": "troposphere.redshift:ScheduledAction",
+    "AWS::Rekognition::Project": "troposphere.rekognition:Project",
+    "AWS::ResourceGroups::Group": "troposphere.resourcegroups:Group",
+    "AWS::RoboMaker::Fleet": "troposphere.robomaker:Fleet",
+    "AWS::RoboMaker::Robot": "troposphere.robomaker:Robot",
+    "AWS::RoboMaker::RobotApplication": "troposphere.robomaker:RobotApplication",
+    "AWS::RoboMaker::RobotApplicationVersion": "troposphere.robomaker:RobotApplicationVersion",
+    "AWS::RoboMaker::SimulationApplication": "troposphere.robomaker:SimulationApplication",
+    "AWS::RoboMaker::SimulationApplicationVersion": "troposphere.robomaker:SimulationApplicationVersion",
+    "AWS::Route53::DNSSEC": "troposphere.route53:DNSSEC",
+    "AWS::Route53::HealthCheck": "troposphere.route53:HealthCheck",
+    "AWS::Route53::HostedZone": "troposphere.route53:HostedZone",
+    "AWS::Route53::KeySigningKey": "troposphere.route53:KeySigningKey",
+    "AWS::Route53::RecordSet": "troposphere.route53:RecordSetType",
+    "AWS::Route53::RecordSetGroup": "troposphere.route53:RecordSetGroup",
+    "AWS::Route53RecoveryControl::Cluster": "troposphere.route53recoverycontrol:Cluster",
+    "AWS::Route53RecoveryControl::ControlPanel": "troposphere.route53recoverycontrol:ControlPanel",
+    "AWS::Route53RecoveryControl::RoutingControl": "troposphere.route53recoverycontrol:RoutingControl",
+    "AWS::Route53RecoveryControl::SafetyRule": "troposphere.route53recoverycontrol:SafetyRule",
+    "AWS::Route53RecoveryReadiness::Cell": "troposphere.route53recoveryreadiness:Cell",
+    "AWS::Route53RecoveryReadiness::ReadinessCheck": "troposphere.route53recoveryreadiness:ReadinessCheck",
+    "AWS::Route53RecoveryReadiness::RecoveryGroup": "troposphere.route53recoveryreadiness:RecoveryGroup",
+    "AWS::Route53RecoveryReadiness::ResourceSet": "troposphere.route53recoveryreadiness:ResourceSet",
+    "AWS::Route53Resolver::FirewallDomainList": "troposphere.route53:FirewallDomainList",
+    "AWS::Route53Resolver::FirewallRuleGroup": "troposphere.route53:FirewallRuleGroup",
+    "AWS::Route53Resolver::FirewallRuleGroupAssociation": "troposphere.route53:FirewallRuleGroupAssociation",
+    "AWS::Route53Resolver::ResolverConfig": "troposphere.route53:ResolverConfig",
+    "AWS::Route53Resolver::ResolverDNSSECConfig": "troposphere.route53:ResolverDNSSECConfig",
+    "AWS::Route53Resolver::ResolverEndpoint": "troposphere.route53:ResolverEndpoint",
+    "AWS::Route53Resolver::ResolverQueryLoggingConfig": "troposphere.route53:ResolverQueryLoggingConfig",
+    "AWS::Route53Resolver::ResolverQueryLoggingConfigAssociation": "troposphere.route53:ResolverQueryLoggingConfigAssociation",
+    "AWS::Route53Resolver::ResolverRule": "troposphere.route53:ResolverRule",
+    "AWS::Route53Resolver::ResolverRuleAssociation": "troposphere.route53:ResolverRuleAssociation",
+    "AWS::S3::AccessPoint": "troposphere.s3:AccessPoint",
+    "AWS::S3::Bucket": "troposphere.s3:Bucket",
+    "AWS::S3::BucketPolicy": "troposphere.s3:BucketPolicy",
+    "AWS::S3::MultiRegionAccessPoint": "troposphere.s3:MultiRegionAccessPoint",
+    "AWS::S3::MultiRegionAccessPointPolicy": "troposphere.s3:MultiRegionAccessPointPolicy",
+    "AWS::S3::StorageLens": "troposphere.s3:StorageLens",
+    "AWS::S3ObjectLambda::AccessPoint": "troposphere.s3objectlambda:AccessPoint",
+    "AWS::S3ObjectLambda::AccessPointPolicy": "troposphere.s3objectlambda:AccessPointPolicy",
+    "AWS::S3Outposts::AccessPoint": "troposphere.s3outposts:AccessPoint",
+    "AWS::S3Outposts::Bucket": "troposphere.s3outposts:Bucket",
+    "AWS::S3Outposts::BucketPolicy": "troposphere.s3outposts:BucketPolicy",
+    "AWS::S3Outposts::Endpoint": "troposphere.s3outposts:Endpoint",
+    "AWS::SDB::Domain": "troposphere.sdb:Domain",
+    "AWS::SES::ConfigurationSet": "troposphere.ses:ConfigurationSet",
+    "AWS::SES::ConfigurationSetEventDestination": "troposphere.ses:ConfigurationSetEventDestination",
+    "AWS::SES::ContactList": "troposphere.ses:ContactList",
+    "AWS::SES::ReceiptFilter": "troposphere.ses:ReceiptFilter",
+    "AWS::SES::ReceiptRule": "troposphere.ses:ReceiptRule",
+    "AWS::SES::ReceiptRuleSet": "troposphere.ses:ReceiptRuleSet",
+    "AWS::SES::Template": "troposphere.ses:Template",
+    "AWS::SNS::Subscription": "troposphere.sns:SubscriptionResource",
+    "AWS::SNS::Topic": "troposphere.sns:Topic",
+    "AWS::SNS::TopicPolicy": "troposphere.sns:TopicPolicy",
+    "AWS::SQS::Queue": "troposphere.sqs:Queue",
+    "AWS::SQS::QueuePolicy": "troposphere.sqs:QueuePolicy",
+    "AWS::SSM::Association": "troposphere.ssm:Association",
+    "AWS::SSM::Document": "troposphere.ssm:Document",
+    "AWS::SSM::MaintenanceWindow": "troposphere.ssm:MaintenanceWindow",
+    "AWS::SSM::MaintenanceWindowTarget": "troposphere.ssm:MaintenanceWindowTarget",
+    "AWS::SSM::MaintenanceWindowTask": "troposphere.ssm:MaintenanceWindowTask",
+    "AWS::SSM::Parameter": "troposphere.ssm:Parameter",
+    "AWS::SSM::PatchBaseline": "troposphere.ssm:PatchBaseline",
+    "AWS::SSM::ResourceDataSync": "troposphere.ssm:ResourceDataSync",
+    "AWS::SSMContacts::Contact": "troposphere.ssmcontacts:Contact",
+    "AWS::SSMContacts::ContactChannel": "troposphere.ssmcontacts:ContactChannel",
+    "AWS::SSMIncidents::ReplicationSet": "troposphere.ssmincidents:ReplicationSet",
+    "AWS::SSMIncidents::ResponsePlan": "troposphere.ssmincidents:ResponsePlan",
+    "AWS::SSO::Assignment": "troposphere.sso:Assignment",
+    "AWS::SSO::InstanceAccessControlAttributeConfiguration": "troposphere.sso:InstanceAccessControlAttributeConfiguration",
+    "AWS::SSO::PermissionSet": "troposphere.sso:PermissionSet",
+    "AWS::SageMaker::App": "troposphere.sagemaker:App",
+    "AWS::SageMaker::AppImageConfig": "troposphere.sagemaker:AppImageConfig",
+    "AWS::SageMaker::CodeRepository": "troposphere.sagemaker:CodeRepository",
+    "AWS::SageMaker::DataQualityJobDefinition": "troposphere.sagemaker:DataQualityJobDefinition",
+    "AWS::SageMaker::Device": "troposphere.sagemaker:Device",
+    "AWS::SageMaker::DeviceFleet": "troposphere.sagemaker:DeviceFleet",
+    "AWS::SageMaker::Domain": "troposphere.sagemaker:Domain",
+    "AWS::SageMaker::Endpoint": "troposphere.sagemaker:Endpoint",
+    "AWS::SageMaker::EndpointConfig": "troposphere.sagemaker:EndpointConfig",
+    "AWS::SageMaker::FeatureGroup": "troposphere.sagemaker:FeatureGroup",
+    "AWS::SageMaker::Image": "troposphere.sagemaker:Image",
+    "AWS::SageMaker::ImageVersion": "troposphere.sagemaker:ImageVersion",
+    "AWS::SageMaker::Model": "troposphere.sagemaker:Model",
+    "AWS::SageMaker::ModelBiasJobDefinition": "troposphere.sagemaker:ModelBiasJobDefinition",
+    "AWS::SageMaker::ModelExplainabilityJobDefinition": "troposphere.sagemaker:ModelExplainabilityJobDefinition",
+    "AWS::SageMaker::ModelPackageGroup": "troposphere.sagemaker:ModelPackageGroup",
+    "AWS::SageMaker::ModelQualityJobDefinition": "troposphere.sagemaker:ModelQualityJobDefinition",
+    "AWS::SageMaker::MonitoringSchedule": "troposphere.sagemaker:MonitoringSchedule",
+    "AWS::SageMaker::NotebookInstance": "troposphere.sagemaker:NotebookInstance",
+    "AWS::SageMaker::NotebookInstanceLifecycleConfig": "troposphere.sagemaker:NotebookInstanceLifecycleConfig",
+    "AWS::SageMaker::Pipeline": "troposphere.sagemaker:Pipeline",
+    "AWS::SageMaker::Project": "troposphere.sagemaker:Project",
+    "AWS::SageMaker::UserProfile": "troposphere.sagemaker:UserProfile",
+    "AWS::SageMaker::Workteam": "troposphere.sagemaker:Workteam",
+    "AWS::SecretsManager::ResourcePolicy": "troposphere.secretsmanager:ResourcePolicy",
+    "AWS::SecretsManager::RotationSchedule": "troposphere.secretsmanager:RotationSchedule",
+    "AWS::SecretsManager::Secret": "troposphere.secretsmanager:Secret",
+    "AWS::SecretsManager::SecretTargetAttachment": "troposphere.secretsmanager:SecretTargetAttachment",
+    "AWS::SecurityHub::Hub": "troposphere.securityhub:Hub",
+    "AWS::Serverless::Api": "troposphere.serverless:Api",
+    "AWS::Serverless::Application": "troposphere.serverless:Application",
+    "AWS::Serverless::Function": "troposphere.serverless:Function",
+    "AWS::Serverless::HttpApi": "troposphere.serverless:HttpApi",
+    "AWS::Serverless::LayerVersion": "troposphere.serverless:LayerVersion",
+    "AWS::Serverless::SimpleTable": "troposphere.serverless:SimpleTable",
+    "AWS::ServiceCatalog::AcceptedPortfolioShare": "troposphere.servicecatalog:AcceptedPortfolioShare",
+    "AWS::ServiceCatalog::CloudFormationProduct": "troposphere.servicecatalog:CloudFormationProduct",
+    "AWS::ServiceCatalog::CloudFormationProvisionedProduct": "troposphere.servicecatalog:CloudFormationProvisionedProduct",
+    "AWS::ServiceCatalog::LaunchNotificationConstraint": "troposphere.servicecatalog:LaunchNotificationConstraint",
+    "AWS::ServiceCatalog::LaunchRoleConstraint": "troposphere.servicecatalog:LaunchRoleConstraint",
+    "AWS::ServiceCatalog::LaunchTemplateConstraint": "troposphere.servicecatalog:LaunchTemplateConstraint",
+    "AWS::ServiceCatalog::Portfolio": "troposphere.servicecatalog:Portfolio",
+    "AWS::ServiceCatalog::PortfolioPrincipalAssociation": "troposphere.servicecatalog:PortfolioPrincipalAssociation",
+    "AWS::ServiceCatalog::PortfolioProductAssociation": "troposphere.servicecatalog:PortfolioProductAssociation",
+    "AWS::ServiceCatalog::PortfolioShare": "troposphere.servicecatalog:PortfolioShare",
+    "AWS::ServiceCatalog::ResourceUpdateConstraint": "troposphere.servicecatalog:ResourceUpdateConstraint",
+    "AWS::ServiceCatalog::ServiceAction": "troposphere.servicecatalog:ServiceAction",
+    "AWS::ServiceCatalog::ServiceActionAssociation": "troposphere.servicecatalog:ServiceActionAssociation",
+    "AWS::ServiceCatalog::StackSetConstraint": "troposphere.servicecatalog:StackSetConstraint",
+    "AWS::ServiceCatalog::TagOption": "troposphere.servicecatalog:TagOption",
+    "AWS::ServiceCatalog::TagOptionAssociation": "troposphere.servicecatalog:TagOptionAssociation",
+    "AWS::ServiceCatalogAppRegistry::Application": "troposphere.servicecatalogappregistry:Application",
+    "AWS::ServiceCatalogAppRegistry::AttributeGroup": "troposphere.servicecatalogappregistry:AttributeGroup",
+    "AWS::ServiceCatalogAppRegistry::AttributeGroupAssociation": "troposphere.servicecatalogappregistry:AttributeGroupAssociation",
+    "AWS::ServiceCatalogAppRegistry::ResourceAssociation": "troposphere.servicecatalogappregistry:ResourceAssociation",
+    "AWS::ServiceDiscovery::HttpNamespace": "troposphere.servicediscovery:HttpNamespace",
+    "AWS::ServiceDiscovery::Instance": "troposphere.servicediscovery:Instance",
+    "AWS::ServiceDiscovery::PrivateDnsNamespace": "troposphere.servicediscovery:PrivateDnsNamespace",
+    "AWS::ServiceDiscovery::PublicDnsNamespace": "troposphere.servicediscovery:PublicDnsNamespace",
+    "AWS::ServiceDiscovery::Service": "troposphere.servicediscovery:Service",
+    "AWS::Signer::ProfilePermission": "troposphere.signer:ProfilePermission",
+    "AWS::Signer::SigningProfile": "troposphere.signer:SigningProfile",
+    "AWS::StepFunctions::Activity": "troposphere.stepfunctions:Activity",
+    "AWS::StepFunctions::StateMachine": "troposphere.stepfunctions:StateMachine",
+    "AWS::Synthetics::Canary": "troposphere.synthetics:Canary",
+    "AWS::Timestream::Database": "troposphere.timestream:Database",
+    "AWS::Timestream::ScheduledQuery": "troposphere.timestream:ScheduledQuery",
+    "AWS::Timestream::Table": "troposphere.timestream:Table",
+    "AWS::Transfer::Server": "troposphere.transfer:Server",
+    "AWS::Transfer::User": "troposphere.transfer:User",
+    "AWS::WAF::ByteMatchSet": "troposphere.waf:ByteMatchSet",
+    "AWS::WAF::IPSet": "troposphere.waf:IPSet",
+    "AWS::WAF::Rule": "troposphere.waf:Rule",
+    "AWS::WAF::SizeConstraintSet": "troposphere.waf:SizeConstraintSet",
+    "AWS::WAF::SqlInjectionMatchSet": "troposphere.waf:SqlInjectionMatchSet",
+    "AWS::WAF::WebACL": "troposphere.waf:WebACL",
+    "AWS::WAF::XssMatchSet": "troposphere.waf:XssMatchSet",
+    "AWS::WAFRegional::ByteMatchSet": "troposphere.wafregional:ByteMatchSet",
+    "AWS::WAFRegional::GeoMatchSet": "troposphere.wafregional:GeoMatchSet",
+    "AWS::WAFRegional::IPSet": "troposphere.wafregional:IPSet",
+    "AWS::WAFRegional::RateBasedRule": "troposphere.wafregional:RateBasedRule",
+    "AWS::WAFRegional::RegexPatternSet": "troposphere.wafregional:RegexPatternSet",
+    "AWS::WAFRegional::Rule": "troposphere.wafregional:Rule",
+    "AWS::WAFRegional::SizeConstraintSet": "troposphere.wafregional:SizeConstraintSet",
+    "AWS::WAFRegional::SqlInjectionMatchSet": "troposphere.wafregional:SqlInjectionMatchSet",
+    "AWS::WAFRegional::WebACL": "troposphere.wafregional:WebACL",
+    "AWS::WAFRegional::WebACLAssociation": "troposphere.wafregional:WebACLAssociation",
+    "AWS::WAFRegional::XssMatchSet": "troposphere.wafregional:XssMatchSet",
+    "AWS::WAFv2::IPSet": "troposphere.wafv2:IPSet",
+    "AWS::WAFv2::LoggingConfiguration": "troposphere.wafv2:LoggingConfiguration",
+    "AWS::WAFv2::RegexPatternSet": "troposphere.wafv2:RegexPatternSet",
+    "AWS::WAFv2::RuleGroup": "troposphere.wafv2:RuleGroup",
+    "AWS::WAFv2::WebACL": "troposphere.wafv2:WebACL",
+    "AWS::WAFv2::WebACLAssociation": "troposphere.wafv2:WebACLAssociation",
+    "AWS::Wisdom::Assistant": "troposphere.wisdom:Assistant",
+    "AWS::Wisdom::AssistantAssociation": "troposphere.wisdom:AssistantAssociation",
+    "AWS::Wisdom::KnowledgeBase": "troposphere.wisdom:KnowledgeBase",
+    "AWS::WorkSpaces::ConnectionAlias": "troposphere.workspaces:ConnectionAlias",
+    "AWS::WorkSpaces::Workspace": "troposphere.workspaces:Workspace",
+    "AWS::XRay::Group": "troposphere.xray:Group",
+    "Alexa::ASK::Skill": "troposphere.ask:Skill",
+    "AlexaSkill": "troposphere.serverless:AlexaSkillEvent",
+    "Api": "troposphere.serverless:ApiEvent",
+    "CloudWatchEvent": "troposphere.serverless:CloudWatchEvent",
+    "DynamoDB": "troposphere.serverless:DynamoDBEvent",
+    "IoTRule": "troposphere.serverless:IoTRuleEvent",
+    "Kinesis": "troposphere.serverless:KinesisEvent",
+    "S3": "troposphere.serverless:S3Event",
+    "SNS": "troposphere.serverless:SNSEvent",
+    "SQS": "troposphere.serverless:SQSEvent",
+    "Schedule": "troposphere.serverless:ScheduleEvent",
+}
+
+FUNCTIONS = {
+    "AWSHelperFn": "troposphere:AWSHelperFn",
+    "And": "troposphere:And",
+    "ApiGlobals": "troposphere.serverless:ApiGlobals",
+    "Authentication": "troposphere.cloudformation:Authentication",
+    "Base64": "troposphere:Base64",
+    "Cidr": "troposphere:Cidr",
+    "Condition": "troposphere:Condition",
+    "Equals": "troposphere:Equals",
+    "Export": "troposphere:Export",
+    "FindInMap": "troposphere:FindInMap",
+    "FunctionGlobals": "troposphere.serverless:FunctionGlobals",
+    "GenericHelperFn": "troposphere:GenericHelperFn",
+    "GetAZs": "troposphere:GetAZs",
+    "GetAtt": "troposphere:GetAtt",
+    "Globals": "troposphere.serverless:Globals",
+    "GlobalsHelperFn": "troposphere.serverless:GlobalsHelperFn",
+    "HttpApiGlobals": "troposphere.serverless:HttpApiGlobals",
+    "If": "troposphere:If",
+    "ImportValue": "troposphere:ImportValue",
+    "Init": "troposphere.cloudformation:Init",
+    "InitConfigSets": "troposphere.cloudformation:InitConfigSets",
+    "InitFileContext": "troposphere.cloudformation:InitFileContext",
+    "InitFiles": "troposphere.cloudformation:InitFiles",
+    "InitServices": "troposphere.cloudformation:InitServices",
+    "Ipv6Addresses": "troposphere.ec2:Ipv6Addresses",
+    "Join": "troposphere:Join",
+    "Metadata": "troposphere.autoscaling:Metadata",
+    "Name": "troposphere:Name",
+    "Not": "troposphere:Not",
+    "Or": "troposphere:Or",
+    "Ref": "troposphere:Ref",
+    "Select": "troposphere:Select",
+    "SimpleTableGlobals": "troposphere.serverless:SimpleTableGlobals",
+    "Split": "troposphere:Split",
+    "Sub": "troposphere:Sub",
+    "Tag": "troposphere:Tag",
+    "Tags": "troposphere:Tags",
+}
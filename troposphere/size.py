@@ -0,0 +1,124 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Size accounting of template bodies.
+
+size_report() gives the number of bytes each section and each resource
+takes up in the pretty (Template.to_json()) and minified
+(Template.to_json(minify=True)) output, to see whether the template can be
+passed inline and which resources use up the budget.
+
+The size of a section or resource is that of its "Name": value entry,
+including the indentation of its nested lines, but not the separator and
+indentation in front of the entry itself.
+
+Usage:
+    report = template.size_report()
+    if not report.fits_inline:
+        for title, size in report.largest(5):
+            print(title, size.minified)
+"""
+
+import collections
+import json
+
+from . import MAX_TEMPLATE_BODY_SIZE, MINIFIED_SEPARATORS
+
+# The formatting of Template.to_json()
+PRETTY_INDENT = 4
+PRETTY_SEPARATORS = (",", ": ")
+
+Size = collections.namedtuple("Size", ["minified", "pretty"])
+Size.__doc__ = """Byte counts of the minified and pretty output"""
+
+
+class SizeReport:
+    """The sizes of a template body, see size_report().
+
+    minified and pretty are the total byte counts, sections and resources
+    map each name to its Size.
+    """
+
+    def __init__(self, minified, pretty, sections, resources):
+        self.minified = minified
+        self.pretty = pretty
+        self.sections = sections
+        self.resources = resources
+
+    @property
+    def fits_inline(self):
+        """Whether the minified body can be passed as TemplateBody."""
+        return self.minified <= MAX_TEMPLATE_BODY_SIZE
+
+    def largest(self, n=None):
+        """Returns the n largest (title, Size) resources, largest first."""
+        ordered = sorted(
+            self.resources.items(), key=lambda item: item[1].minified, reverse=True
+        )
+        return ordered if n is None else ordered[:n]
+
+    def __repr__(self):
+        return "SizeReport(minified=%d, pretty=%d)" % (self.minified, self.pretty)
+
+
+def _minified(value):
+    return len(
+        json.dumps(
+            value, sort_keys=True, separators=MINIFIED_SEPARATORS, ensure_ascii=False
+        ).encode("utf-8")
+    )
+
+
+def _pretty(value, depth):
+    """Returns the size of value when nested depth levels deep."""
+    text = json.dumps(
+        value, indent=PRETTY_INDENT, sort_keys=True, separators=PRETTY_SEPARATORS
+    )
+    # Each line after the first is indented by the depth of value
+    return len(text) + text.count("\n") * PRETTY_INDENT * depth
+
+
+def _entry(name, size):
+    """Returns the Size of the "name": value entry for a value of size."""
+    return Size(
+        len(json.dumps(name, ensure_ascii=False).encode("utf-8"))
+        + len(MINIFIED_SEPARATORS[1])
+        + size.minified,
+        len(json.dumps(name)) + len(PRETTY_SEPARATORS[1]) + size.pretty,
+    )
+
+
+def _mapping(entries, depth):
+    """Returns the Size of a mapping depth levels deep from its entry sizes."""
+    n = len(entries)
+    if not n:
+        return Size(2, 2)
+    minified = 2 + (n - 1) + sum(size.minified for size in entries)
+    # Each entry is on its own line and the closing brace on the next
+    pretty = 2 + (n - 1) + sum(size.pretty for size in entries)
+    pretty += n * (1 + PRETTY_INDENT * (depth + 1)) + 1 + PRETTY_INDENT * depth
+    return Size(minified, pretty)
+
+
+def size_report(template, validation=True):
+    """Returns the SizeReport of template."""
+    data = template._encode(validation)
+    sections = {}
+    resources = {}
+    for name, value in data.items():
+        if name == "Resources":
+            for title, resource in value.items():
+                resources[title] = _entry(
+                    title, Size(_minified(resource), _pretty(resource, 2))
+                )
+            size = _mapping(list(resources.values()), 1)
+        else:
+            size = Size(_minified(value), _pretty(value, 1))
+        sections[name] = _entry(name, size)
+    total = _mapping(list(sections.values()), 0)
+    return SizeReport(total.minified, total.pretty, sections, resources)
+
+
+__all__ = ["Size", "SizeReport", "size_report"]
@@ -11,19 +11,38 @@ Usage:
 
     template = TemplateGenerator(json_template)
     template.to_json()
+
+Large templates can be read one resource at a time instead:
+
+    for title, resource in TemplateGenerator.iter_resources("template.yaml"):
+        print(title, resource.resource_type)
+
+Many template files can be imported across a process pool:
+
+    for result in TemplateGenerator.from_files(paths, workers=8):
+        if result.error is not None:
+            print(result.path, result.error.message)
 """
 
+import codecs
+import collections
+import concurrent.futures
 import importlib
 import inspect
+import json
 import os
 import pkgutil
 from collections.abc import Mapping, Sequence
 
+import yaml
+from cfn_tools.yaml_loader import TAG_MAP, CfnYamlLoader
+
 from troposphere import AWSObject  # covers resources
 from troposphere import GenericHelperFn  # covers ref, fn::, etc
 from troposphere import Parameter  # AWSDeclarations
 from troposphere import (
     AWSHelperFn,
+    BaseAWSObject,
     Export,
     Output,
     Ref,
@@ -31,22 +50,301 @@ from troposphere import (
     Template,
     autoscaling,
     cloudformation,
+    registry,
 )
 from troposphere.policies import CreationPolicy, UpdatePolicy
 
+DEPRECATED_MODULES = ["troposphere.dynamodb2"]
+EXCLUDE_MODULES = DEPRECATED_MODULES + [
+    "troposphere.openstack.heat",
+    "troposphere.openstack.neutron",
+    "troposphere.openstack.nova",
+]
 
-class TemplateGenerator(Template):
-    DEPRECATED_MODULES = ["troposphere.dynamodb2"]
-    EXCLUDE_MODULES = DEPRECATED_MODULES + [
-        "troposphere.openstack.heat",
-        "troposphere.openstack.neutron",
-        "troposphere.openstack.nova",
+# Types _convert_definition() returns as-is, checked before the slower
+# isinstance() checks against Mapping and Sequence
+_SCALAR_TYPES = frozenset([str, int, float, bool, type(None)])
+
+# How _create_instance() converts a property value, see _props_plan()
+_CREATE = 0
+_BOOLEAN = 1
+_CONVERT = 2
+
+
+def _members_predicate(m):
+    return inspect.isclass(m) and not inspect.isbuiltin(m)
+
+
+def _module_members(module):
+    """
+    Returns the (name, class) pairs found in a module. This only looks at
+    the module namespace so troposphere submodules are not imported through
+    the lazy attribute access of the package.
+    """
+    return sorted((k, v) for k, v in vars(module).items() if _members_predicate(v))
+
+
+def _troposphere_module_names():
+    """Returns the names of the modules TemplateGenerator can use classes from"""
+    dirname = os.path.join(os.path.dirname(__file__))
+    module_names = [
+        pkg_name
+        for importer, pkg_name, is_pkg in pkgutil.walk_packages(
+            [dirname], prefix="troposphere."
+        )
+        if not is_pkg and pkg_name not in EXCLUDE_MODULES
     ]
+    module_names.append("troposphere")
+    return sorted(module_names)
+
+
+def _build_registry():
+    """
+    Imports all troposphere modules and returns the contents of
+    troposphere.registry: the module names, a map of `ResourceType:
+    "module:Class"` and a map of `FunctionName: "module:Class"`.
+
+    Where more than one class is found for a name, the one from the core
+    troposphere module or named after the resource type is used, otherwise
+    the first one in module order.
+    """
+    module_names = _troposphere_module_names()
+    resources = {}
+    functions = {}
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for name, m in _module_members(module):
+            if m.__module__ != module_name:
+                # only index classes where they are defined
+                continue
+            path = "%s:%s" % (module_name, name)
+            if issubclass(m, (AWSObject, cloudformation.AWSCustomObject)) and hasattr(
+                m, "resource_type"
+            ):
+                if m.resource_type not in resources or (
+                    m.resource_type.split(":")[-1] == name
+                ):
+                    resources[m.resource_type] = path
+            if issubclass(m, AWSHelperFn):
+                if name not in functions or module_name == "troposphere":
+                    functions[name] = path
+    return module_names, resources, functions
+
+
+class _TextReader:
+    """Reads text from a text or binary file object"""
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._prefix = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    def unread(self, text):
+        """Returns text to be read again by the next read()."""
+        self._prefix = text + self._prefix
+
+    def read(self, size=-1):
+        if self._prefix:
+            text, self._prefix = self._prefix, ""
+            return text
+        data = self._fp.read(size)
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data, final=not data)
+        return data
+
+
+class _JSONResources:
+    """
+    Yields the `(logical_id, definition)` pairs of the Resources of a JSON
+    template, only keeping the text of the current resource in memory.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self):
+        """Reads more text, returns False at the end of the file."""
+        if self._eof:
+            return False
+        # Read at least as much as is buffered so decoding a large value
+        # is only retried a logarithmic number of times
+        data = self._fp.read(max(self._chunk_size, len(self._buffer) - self._pos))
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+        self._eof = not data
+        return not self._eof
+
+    def _peek(self):
+        """Returns the next character which is not whitespace, or ""."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in " \t\n\r":
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer) or not self._fill():
+                return buffer[pos : pos + 1]
+
+    def _next(self, expected):
+        char = self._peek()
+        if not char or char not in expected:
+            self._error("Expecting %s" % " or ".join(repr(c) for c in expected))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may not be complete
+            if end < len(self._buffer) or not self._fill():
+                self._pos = end
+                return value
+
+    def _error(self, msg):
+        raise json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def _members(self):
+        """Yields the keys of an object, leaving its values to be read."""
+        self._next("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key = self._value()
+            self._next(":")
+            yield key
+            if self._next(",}") == "}":
+                return
+
+    def __iter__(self):
+        for key in self._members():
+            if key != "Resources":
+                self._value()
+                continue
+            for logical_id in self._members():
+                yield logical_id, self._value()
+        if self._peek():
+            self._error("Extra data")
+
+
+class _YAMLLoader(CfnYamlLoader):
+    """CfnYamlLoader building plain dicts, which are faster to convert"""
+
+
+_YAMLLoader.add_constructor(
+    TAG_MAP, lambda loader, node: dict(loader.construct_pairs(node, deep=True))
+)
+
+
+def _yaml_resources(fp):
+    """
+    Yields the `(logical_id, definition)` pairs of the Resources of a YAML
+    template, composing the nodes of one resource at a time.
+    """
+    loader = _YAMLLoader(fp)
+    try:
+        loader.get_event()  # StreamStartEvent
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStartEvent
+        if not loader.check_event(yaml.MappingStartEvent):
+            raise ValueError("The template is not a mapping")
+        loader.get_event()
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = loader.construct_object(loader.compose_node(None, None))
+            if key != "Resources" or not loader.check_event(yaml.MappingStartEvent):
+                loader.compose_node(None, None)
+                continue
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                logical_id = loader.construct_object(loader.compose_node(None, None))
+                definition = loader.construct_document(loader.compose_node(None, None))
+                yield logical_id, definition
+            loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def _load_template(path):
+    """Returns the parsed JSON or YAML template in the file at path."""
+    with open(path, "rb") as f:
+        text = codecs.decode(f.read(), "utf-8-sig")
+    if text.lstrip().startswith("{"):
+        return json.loads(text)
+    template = yaml.load(text, Loader=_YAMLLoader)
+    if not isinstance(template, Mapping):
+        raise ValueError("The template is not a mapping")
+    return template
+
+
+ImportResult = collections.namedtuple("ImportResult", ["path", "template", "error"])
+ImportResult.__doc__ = """The TemplateGenerator of a file or the ImportFailure"""
+
+ImportFailure = collections.namedtuple(
+    "ImportFailure", ["type", "message", "resource", "resource_type"]
+)
+ImportFailure.__doc__ = """Why a file could not be imported, see from_files().
+
+type is the name of the exception class. resource and resource_type are
+set for ResourceTypeNotFound and resource for ResourceTypeNotDefined.
+"""
+
+
+def _import_file(cls, path, kwargs):
+    """Returns the ImportResult of path, run by the from_files() workers."""
+    try:
+        template = cls(_load_template(path), **kwargs)
+    except Exception as ex:
+        failure = ImportFailure(
+            type(ex).__name__,
+            str(ex),
+            getattr(ex, "resource", None),
+            getattr(ex, "resource_type", None),
+        )
+        return ImportResult(path, None, failure)
+    return ImportResult(path, template, None)
+
+
+def _new_custom_object(resource_type):
+    """Unpickles an object of a class generated for a Custom:: type."""
+    cls = TemplateGenerator({})._generate_custom_type(resource_type)
+    return cls.__new__(cls)
+
+
+def _reduce_custom_object(obj, protocol):
+    # The generated class cannot be found by name so it is generated again
+    reduced = object.__reduce_ex__(obj, protocol)
+    return (_new_custom_object, (obj.resource_type,)) + reduced[2:]
+
+
+class TemplateGenerator(Template):
+    DEPRECATED_MODULES = DEPRECATED_MODULES
+    EXCLUDE_MODULES = EXCLUDE_MODULES
 
-    _inspect_members = set()
-    _inspect_resources = {}
     _custom_members = set()
-    _inspect_functions = {}
+    _custom_resources = {}
+    # Classes from the troposphere modules imported so far
+    _loaded_modules = set()
+    _members = set()
+    _resources = {}
+    _functions = {}
+    # Classes generated for Custom:: resource types
+    _custom_types = {}
+    # Property conversion plans of the classes seen so far
+    _plans = {}
 
     def __init__(self, cf_template, **kwargs):
         """
@@ -56,6 +354,12 @@ class TemplateGenerator(Template):
         super().__init__()
         if "CustomMembers" in kwargs:
             self._custom_members = set(kwargs["CustomMembers"])
+            self._custom_resources = {}
+            for custom_member in self._custom_members:
+                if hasattr(custom_member, "resource_type"):
+                    self._custom_resources.setdefault(
+                        custom_member.resource_type, custom_member
+                    )
 
         self._reference_map = {}
         if "AWSTemplateFormatVersion" in cf_template:
@@ -79,43 +383,176 @@ class TemplateGenerator(Template):
         for k, v in cf_template.get("Outputs", {}).items():
             self.add_output(self._create_instance(Output, v, k))
 
+    @classmethod
+    def iter_resources(cls, source, format=None, chunk_size=65536, **kwargs):
+        """
+        Yields `(logical_id, resource)` pairs for the Resources of a JSON or
+        YAML CloudFormation template, converting one resource at a time.
+
+        Unlike TemplateGenerator(), neither the parsed template nor all of
+        its troposphere objects are held in memory, so large templates can
+        be analyzed or transformed resource by resource. The other sections
+        of the template are skipped.
+
+        :param source: Path or file object (text or binary) of the template
+        :param str format: "json" or "yaml", guessed from the file name or
+                           contents if None
+        :param int chunk_size: Number of characters of JSON read at a time
+        :param kwargs: Passed to TemplateGenerator, such as CustomMembers
+        """
+        if isinstance(source, (str, bytes, os.PathLike)):
+            if format is None:
+                extension = os.path.splitext(os.fsdecode(source))[1].lower()
+                format = "json" if extension == ".json" else None
+            with open(source, "rb") as fp:
+                yield from cls.iter_resources(fp, format, chunk_size, **kwargs)
+            return
+
+        reader = _TextReader(source)
+        if format is None:
+            # A JSON template is an object, a YAML one starts with a key,
+            # a comment or a document marker
+            start = reader.read(chunk_size)
+            format = "json" if start.lstrip().startswith("{") else "yaml"
+            reader.unread(start)
+        if format == "json":
+            definitions = _JSONResources(reader, chunk_size)
+        elif format == "yaml":
+            definitions = _yaml_resources(reader)
+        else:
+            raise ValueError("format must be json or yaml, not %r" % format)
+
+        generator = cls({}, **kwargs)
+        for logical_id, definition in definitions:
+            yield logical_id, generator._convert_definition(
+                definition,
+                logical_id,
+                generator._get_resource_type_cls(logical_id, definition),
+            )
+
+    @classmethod
+    def from_files(cls, paths, workers=None, **kwargs):
+        """
+        Imports the JSON or YAML templates in the files at paths across a
+        pool of worker processes, returning an ImportResult for each path
+        in order.
+
+        A file which cannot be read or converted, for example because of a
+        ResourceTypeNotFound, gives an ImportResult with the ImportFailure
+        as error and does not stop the other files from being imported.
+
+        Workers look resource types up in troposphere.registry and keep the
+        modules and classes they load for all the files they are given, so
+        each module is imported at most once per worker.
+
+        :param paths: Paths of the template files
+        :param int workers: Number of processes, os.cpu_count() if None.
+                            1 imports the files in this process.
+        :param kwargs: Passed to TemplateGenerator, such as CustomMembers.
+                       Custom members must be importable by the workers.
+        """
+        paths = list(paths)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(paths))
+        if workers <= 1:
+            return [_import_file(cls, path, kwargs) for path in paths]
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            return list(
+                executor.map(
+                    _import_file,
+                    [cls] * len(paths),
+                    paths,
+                    [kwargs] * len(paths),
+                    chunksize=max(1, len(paths) // (workers * 4)),
+                )
+            )
+
     @property
     def inspect_members(self):
         """
         Returns the list of all troposphere members we are able to
         construct
         """
-        if not self._inspect_members:
-            TemplateGenerator._inspect_members = self._import_all_troposphere_modules()
-        return self._inspect_members
+        return self._import_all_troposphere_modules()
 
     @property
     def inspect_resources(self):
         """Returns a map of `ResourceType: ResourceClass`"""
-        if not self._inspect_resources:
-            d = {}
-            for m in self.inspect_members:
-                if issubclass(
-                    m, (AWSObject, cloudformation.AWSCustomObject)
-                ) and hasattr(m, "resource_type"):
-                    d[m.resource_type] = m
-
-            TemplateGenerator._inspect_resources = d
-
-        return self._inspect_resources
+        for resource_type in registry.RESOURCE_TYPES:
+            self._get_resource_class(resource_type)
+        return self._resources
 
     @property
     def inspect_functions(self):
         """Returns a map of `FunctionName: FunctionClass`"""
-        if not self._inspect_functions:
-            d = {}
-            for m in self.inspect_members:
-                if issubclass(m, AWSHelperFn):
-                    d[m.__name__] = m
+        for name in registry.FUNCTIONS:
+            self._get_function_class(name)
+        return self._functions
+
+    def _load_module(self, name):
+        """Imports a troposphere module and records its members"""
+        module = importlib.import_module(name)
+        if name not in self._loaded_modules:
+            self._members.update(m[1] for m in _module_members(module))
+            self._loaded_modules.add(name)
+        return module
+
+    def _load_class(self, path):
+        module_name, class_name = path.split(":")
+        return getattr(self._load_module(module_name), class_name)
+
+    def _get_resource_class(self, resource_type):
+        """
+        Returns the troposphere class for a resource type, only importing
+        the module it is defined in.
+        """
+        try:
+            return self._resources[resource_type]
+        except KeyError:
+            if resource_type not in registry.RESOURCE_TYPES:
+                return None
+            cls = self._load_class(registry.RESOURCE_TYPES[resource_type])
+            self._resources[resource_type] = cls
+            return cls
+
+    def _get_function_class(self, name):
+        try:
+            return self._functions[name]
+        except KeyError:
+            if name not in registry.FUNCTIONS:
+                return None
+            cls = self._load_class(registry.FUNCTIONS[name])
+            self._functions[name] = cls
+            return cls
 
-            TemplateGenerator._inspect_functions = d
+    def _is_member(self, cls):
+        """
+        Returns whether `cls` is a troposphere member we are able to
+        construct.
+        """
+        return cls in self._custom_members or self._is_troposphere_member(cls)
 
-        return self._inspect_functions
+    def _is_troposphere_member(self, cls):
+        """
+        Returns whether `cls` is a troposphere member, leaving out the
+        CustomMembers of this instance.
+        """
+        if cls in self._members:
+            return True
+        module_name = getattr(cls, "__module__", None)
+        if module_name not in registry.MODULES:
+            return False
+        if module_name not in self._loaded_modules:
+            self._load_module(module_name)
+            if cls in self._members:
+                return True
+        # A class replaced in its module by a later one of the same name,
+        # which is still used by the props of the classes in between
+        if inspect.isclass(cls) and issubclass(cls, (BaseAWSObject, AWSHelperFn)):
+            self._members.add(cls)
+            return True
+        return False
 
     def _get_resource_type_cls(self, name, resource):
         """Attempts to return troposphere class that represents Type of
@@ -135,15 +572,11 @@ class TemplateGenerator(Template):
 
         # Attempt to find troposphere resource with:
         #   `resource_type` == resource['Type']
-        try:
-            return self.inspect_resources[resource["Type"]]
-        except KeyError:
-            # is there a custom mapping?
-            for custom_member in self._custom_members:
-                if custom_member.resource_type == resource["Type"]:
-                    return custom_member
-            # If no resource with `resource_type` == resource['Type'] found
-            return None
+        cls = self._get_resource_class(resource["Type"])
+        if cls is not None:
+            return cls
+        # is there a custom mapping?
+        return self._custom_resources.get(resource["Type"])
 
     def _convert_definition(self, definition, ref=None, cls=None):
         """
@@ -156,7 +589,10 @@ class TemplateGenerator(Template):
                         is from, can be None
         :param type cls: Troposphere class which represents provided definition
         """
-        if isinstance(definition, Mapping):
+        if type(definition) in _SCALAR_TYPES:
+            return definition
+
+        if isinstance(definition, dict) or isinstance(definition, Mapping):
             if "Type" in definition:  # this is an AWS Resource
                 expected_type = None
                 if cls is not None:
@@ -182,19 +618,17 @@ class TemplateGenerator(Template):
                     return self._create_instance(expected_type, args, ref)
 
             if len(definition) == 1:  # This might be a function?
-                function_type = self._get_function_type(list(definition.keys())[0])
+                ((key, value),) = definition.items()
+                function_type = self._get_function_type(key)
                 if function_type:
-                    return self._create_instance(
-                        function_type, list(definition.values())[0]
-                    )
+                    return self._create_instance(function_type, value)
 
             # nothing special here - return as dict
-            d = {}
-            for k, v in definition.items():
-                d[k] = self._convert_definition(v)
-            return d
+            return {k: self._convert_definition(v) for k, v in definition.items()}
 
-        elif isinstance(definition, Sequence) and not isinstance(definition, str):
+        elif isinstance(definition, list) or (
+            isinstance(definition, Sequence) and not isinstance(definition, str)
+        ):
             return [self._convert_definition(v) for v in definition]
 
         # anything else is returned as-is
@@ -216,6 +650,17 @@ class TemplateGenerator(Template):
         If `cls` is a list and contains a single troposphere type, the
          returned value will be a list of instances of that type.
         """
+        if isinstance(cls, tuple) and isinstance(args, Mapping):
+            # a choice of types such as (ApplicationLocation, str), build
+            # the troposphere object if there is one
+            for choice in cls:
+                if (
+                    inspect.isclass(choice)
+                    and issubclass(choice, BaseAWSObject)
+                    and self._is_member(choice)
+                ):
+                    return self._create_instance(choice, args, ref)
+
         if isinstance(cls, Sequence):
             if len(cls) == 1:
                 # a list of 1 type means we must provide a list of such objects
@@ -223,9 +668,7 @@ class TemplateGenerator(Template):
                     args = [args]
                 return [self._create_instance(cls[0], v) for v in args]
 
-        if isinstance(cls, Sequence) or cls not in self.inspect_members.union(
-            self._custom_members
-        ):
+        if isinstance(cls, Sequence) or not self._is_member(cls):
             # this object doesn't map to any known object. could be a string
             # or int, or a Ref... or a list of types such as
             # [basestring, FindInMap, Ref] or maybe a
@@ -276,31 +719,26 @@ class TemplateGenerator(Template):
             # inspecting its type validation metadata
             kwargs = {}
             kwargs.update(args)
-            for prop_name in getattr(cls, "props", []):
-                if prop_name not in kwargs:
-                    continue  # the user did not specify this value; skip it
-                expected_type = cls.props[prop_name][0]
-
-                if (
-                    isinstance(expected_type, Sequence)
-                    or expected_type in self.inspect_members
-                ):
+            plan = self._plans.get(cls)
+            if plan is None:
+                plan = self._props_plan(cls)
+            for prop_name, value in args.items():
+                if prop_name not in plan:
+                    continue  # not a property, converted below
+                step, expected_type = plan[prop_name]
+                if step == _CONVERT and expected_type in self._custom_members:
+                    step = _CREATE
+
+                if step == _CREATE:
                     kwargs[prop_name] = self._create_instance(
-                        expected_type, kwargs[prop_name], prop_name
+                        expected_type, value, prop_name
                     )
-                elif expected_type == bool:
-                    if kwargs[prop_name] in ("True", "true", "1"):
-                        kwargs[prop_name] = True
-                    elif kwargs[prop_name] in ("False", "false", "0"):
-                        kwargs[prop_name] = False
-                    else:
-                        kwargs[prop_name] = self._convert_definition(
-                            kwargs[prop_name], prop_name
-                        )
+                elif step == _BOOLEAN and value in ("True", "true", "1"):
+                    kwargs[prop_name] = True
+                elif step == _BOOLEAN and value in ("False", "false", "0"):
+                    kwargs[prop_name] = False
                 else:
-                    kwargs[prop_name] = self._convert_definition(
-                        kwargs[prop_name], prop_name
-                    )
+                    kwargs[prop_name] = self._convert_definition(value, prop_name)
 
             args = self._convert_definition(kwargs)
             if isinstance(args, Ref):
@@ -313,6 +751,27 @@ class TemplateGenerator(Template):
 
         return cls(self._convert_definition(args))
 
+    def _props_plan(self, cls):
+        """
+        Returns a map of `PropertyName: (step, expected_type)` telling
+        _create_instance() how to convert each property of `cls`. The plan
+        does not depend on CustomMembers so it is shared by all instances.
+        """
+        plan = {}
+        for prop_name, prop in getattr(cls, "props", {}).items():
+            expected_type = prop[0]
+            if isinstance(expected_type, Sequence) or self._is_troposphere_member(
+                expected_type
+            ):
+                step = _CREATE
+            elif expected_type == bool:
+                step = _BOOLEAN
+            else:
+                step = _CONVERT
+            plan[prop_name] = (step, expected_type)
+        self._plans[cls] = plan
+        return plan
+
     def _normalize_properties(self, definition):
         """
         Inspects the definition and returns a copy of it that is updated
@@ -366,13 +825,18 @@ class TemplateGenerator(Template):
         """
         if not resource_type.startswith("Custom::"):
             raise TypeError("Custom types must start with Custom::")
+        if resource_type in self._custom_types:
+            return self._custom_types[resource_type]
         custom_type = type(
             str(resource_type.replace("::", "")),
-            (self.inspect_resources["AWS::CloudFormation::CustomResource"],),
-            {"resource_type": resource_type},
+            (self._get_resource_class("AWS::CloudFormation::CustomResource"),),
+            {
+                "resource_type": resource_type,
+                "__reduce_ex__": _reduce_custom_object,
+            },
         )
-        self.inspect_members.add(custom_type)
-        self.inspect_resources[resource_type] = custom_type
+        self._members.add(custom_type)
+        self._custom_types[resource_type] = custom_type
         return custom_type
 
     def _generate_autoscaling_metadata(self, cls, args):
@@ -401,39 +865,15 @@ class TemplateGenerator(Template):
         Only Fn:: and Ref functions are supported here so that other
         functions specific to troposphere are skipped.
         """
-        if (
-            function_name.startswith("Fn::")
-            and function_name[4:] in self.inspect_functions
-        ):
-            return self.inspect_functions[function_name[4:]]
-        return self.inspect_functions["Ref"] if function_name == "Ref" else None
+        if function_name.startswith("Fn::"):
+            return self._get_function_class(function_name[4:])
+        return self._get_function_class("Ref") if function_name == "Ref" else None
 
     def _import_all_troposphere_modules(self):
-        """Imports all troposphere modules and returns them"""
-        dirname = os.path.join(os.path.dirname(__file__))
-        module_names = [
-            pkg_name
-            for importer, pkg_name, is_pkg in pkgutil.walk_packages(
-                [dirname], prefix="troposphere."
-            )
-            if not is_pkg and pkg_name not in self.EXCLUDE_MODULES
-        ]
-        module_names.append("troposphere")
-
-        modules = []
-        for name in module_names:
-            modules.append(importlib.import_module(name))
-
-        def members_predicate(m):
-            return inspect.isclass(m) and not inspect.isbuiltin(m)
-
-        members = []
-        for module in modules:
-            members.extend(
-                (m[1] for m in inspect.getmembers(module, members_predicate))
-            )
-
-        return set(members)
+        """Imports all troposphere modules and returns their members"""
+        for name in registry.MODULES:
+            self._load_module(name)
+        return self._members
 
 
 class ResourceTypeNotFound(Exception):
@@ -0,0 +1,110 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Validation of a whole template, separate from encoding it.
+
+Encoding a template validates each object as it is reached and stops at
+the first error. The functions here instead run the same checks over every
+object and collect all of the errors, each with its path in the template.
+
+Usage:
+    try:
+        template.validate_all()
+    except ValidationError as e:
+        for path, error in e.errors:
+            print(path, error)
+"""
+
+from . import AWSHelperFn, BaseAWSObject, Tags, encode_to_dict
+
+# Number of objects sent to each worker of a process pool at a time
+CHUNKSIZE = 16
+
+
+class ValidationError(ValueError):
+    """Raised with all of the (path, exception) errors found in a template."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            "%d validation error(s):\n%s"
+            % (len(errors), "\n".join("%s: %s" % (p, e) for p, e in errors))
+        )
+
+
+def validate_object(obj, path):
+    """Returns (path, exception) for every validation error in obj.
+
+    obj is validated the same way as when it is encoded, without stopping
+    at the first error.
+    """
+    errors = []
+    # Children are pushed in reverse so errors are in document order
+    stack = [(obj, path)]
+    while stack:
+        value, path = stack.pop()
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            continue
+        elif isinstance(value, dict):
+            children = [(v, "%s.%s" % (path, k)) for k, v in value.items()]
+            stack.extend(reversed(children))
+        elif isinstance(value, (list, tuple)):
+            children = [(v, "%s[%d]" % (path, i)) for i, v in enumerate(value)]
+            stack.extend(reversed(children))
+        elif isinstance(value, BaseAWSObject):
+            dictname = value._class_meta().dictname
+            if value.do_validation:
+                required = value._required_errors()
+                prefix = "%s.%s" % (path, dictname) if dictname else path
+                for name, error in required:
+                    errors.append(("%s.%s" % (prefix, name), error))
+                # validate() may rely on the required properties being set
+                if not required:
+                    try:
+                        value.validate()
+                    except Exception as e:
+                        errors.append((path, e))
+            children = [(v, "%s.%s" % (path, k)) for k, v in value.resource.items()]
+            stack.extend(reversed(children))
+        elif isinstance(value, Tags):
+            stack.append((value.tags, path))
+        elif isinstance(value, AWSHelperFn):
+            stack.append((value.data, path))
+        else:
+            # Objects with their own to_dict validate themselves
+            try:
+                encode_to_dict(value)
+            except Exception as e:
+                errors.append((path, e))
+    return errors
+
+
+def _validate_item(item):
+    return validate_object(*item)
+
+
+def validate_template(template, executor=None):
+    """Returns (path, exception) for every validation error in template.
+
+    The parameters, outputs and resources are validated independently,
+    using executor.map() when a concurrent.futures executor is given.
+    """
+    items = [
+        (obj, "%s.%s" % (section, title))
+        for section, objects in (
+            ("Parameters", template.parameters),
+            ("Outputs", template.outputs),
+            ("Resources", template.resources),
+        )
+        for title, obj in objects.items()
+    ]
+    if executor is None:
+        results = map(_validate_item, items)
+    else:
+        results = executor.map(_validate_item, items, chunksize=CHUNKSIZE)
+    return [error for errors in results for error in errors]
+
+
+__all__ = ["ValidationError", "validate_object", "validate_template"]
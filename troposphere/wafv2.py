@@ -251,7 +251,7 @@ class RateBasedStatementTwo(AWSProperty):
         "AggregateKeyType": (str, False),
         "ForwardedIPConfig": (ForwardedIPConfiguration, False),
         "Limit": (integer, False),
-        "ScopeDownStatement": StatementThree,
+        "ScopeDownStatement": (StatementThree, False),
     }
 
 
@@ -0,0 +1,472 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+"""
+Direct YAML output for troposphere objects.
+
+Template.to_yaml() used to render the template to JSON and hand the text to
+cfn_flip, which parsed it back and dumped it with PyYAML. This module walks
+the encoded template instead and writes the block structure itself. The
+cfn_flip dumpers are still used to decide how each distinct scalar is
+represented, so the output is identical to:
+
+    cfn_flip.to_yaml(template.to_json(), clean_up=..., long_form=...)
+
+This relies on internals of cfn_flip and PyYAML's Emitter. If a release of
+either no longer has them the template is rendered to JSON and converted
+by cfn_flip.to_yaml() as before.
+
+Usage:
+    with open("template.yaml", "w") as f:
+        template.write_yaml(f)
+"""
+
+import json
+import sys
+
+from . import _encode_shared
+from .json_writer import _keystr
+
+try:
+    from cfn_clean import (
+        cfn_literal_parser,
+        clean,
+        convert_join,
+        has_intrinsic_functions,
+    )
+    from cfn_flip.yaml_dumper import CONVERTED_SUFFIXES, FN_PREFIX, get_dumper
+    from cfn_tools._config import config
+    from cfn_tools.literal import LiteralString
+    from cfn_tools.odict import ODict
+    from yaml.events import ScalarEvent
+    from yaml.nodes import ScalarNode
+except ImportError as ex:
+    _import_error = ex
+else:
+    _import_error = None
+
+# Number of chunks buffered before they are written out
+BUFFER_CHUNKS = 4096
+
+# Resource properties cfn_flip keeps as a literal JSON block
+LITERAL_PROPERTIES = {"AWS::StepFunctions::StateMachine": "DefinitionString"}
+
+_BREAKS = frozenset("\n\r\x85\u2028\u2029")
+
+# Dumper and Emitter internals YAMLWriter uses
+_DUMPER_ATTRIBUTES = (
+    "DEFAULT_TAG_PREFIXES",
+    "analysis",
+    "analyze_scalar",
+    "best_indent",
+    "best_width",
+    "choose_scalar_style",
+    "column",
+    "event",
+    "increase_indent",
+    "indent",
+    "indention",
+    "indents",
+    "open_ended",
+    "prepare_tag",
+    "process_scalar",
+    "process_tag",
+    "represent_data",
+    "represent_scalar",
+    "resolve",
+    "simple_key_context",
+    "stream",
+    "style",
+    "tag_prefixes",
+    "whitespace",
+    "write_indent",
+    "write_indicator",
+)
+
+
+class _Buffer(list):
+    write = list.append
+
+
+class _Literal:
+    """A value cfn_flip turns into a LiteralString before dumping."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _SortedDict(dict):
+    """A dict cfn_clean left as a plain dict.
+
+    PyYAML dumps these with its own dict representer, which sorts the keys
+    and never uses the short form function tags.
+    """
+
+
+def _sorted_dicts(value):
+    """Marks the plain dicts in the output of cfn_clean.convert_join."""
+    if type(value) is dict:
+        return _SortedDict((k, _sorted_dicts(v)) for k, v in value.items())
+    elif isinstance(value, dict):
+        return ODict((k, _sorted_dicts(v)) for k, v in value.items())
+    elif isinstance(value, list):
+        return [_sorted_dicts(v) for v in value]
+    return value
+
+
+def _leaf(value, validation=True):
+    """Returns value as it would come back from a JSON round trip."""
+    if isinstance(value, str):
+        return str.__str__(value)
+    elif isinstance(value, bool) or value is None:
+        return value
+    elif isinstance(value, int):
+        return int.__int__(value)
+    elif isinstance(value, float):
+        return float.__float__(value)
+    encoded = _encode_shared(value, validation)
+    if encoded is value:
+        raise TypeError(
+            "Object of type %s is not JSON serializable" % value.__class__.__name__
+        )
+    return encoded
+
+
+class YAMLWriter:
+    """Writes a template using the cfn_flip YAML formatting."""
+
+    def __init__(
+        self,
+        clean_up=False,
+        long_form=False,
+        sort_keys=True,
+        validation=True,
+        minify=False,
+    ):
+        """
+        Raises ImportError or AttributeError if the installed cfn_flip or
+        PyYAML lack the internals used.
+        """
+        if _import_error is not None:
+            raise _import_error
+        if minify:
+            # Short form functions and no folding of long scalars
+            long_form = False
+        self.clean_up = clean_up
+        self.long_form = long_form
+        self.sort_keys = sort_keys
+        self.validation = validation
+        self.dumper = get_dumper(clean_up, long_form)(
+            None,
+            default_flow_style=False,
+            allow_unicode=True,
+            width=sys.maxsize if minify else config.max_col_width,
+        )
+        for name in _DUMPER_ATTRIBUTES:
+            if not hasattr(self.dumper, name):
+                raise AttributeError("YAML dumper has no attribute %r" % name)
+        self.dumper.tag_prefixes = self.dumper.DEFAULT_TAG_PREFIXES.copy()
+        self._scalars = {}
+        self._tags = {}
+        self._fp = None
+        self._in_type = 0
+
+    def _keys(self, mapping):
+        if self.sort_keys or type(mapping) is _SortedDict:
+            keys = sorted(mapping)
+        else:
+            keys = mapping
+        for key in keys:
+            if type(key) is str:
+                yield key, key
+            else:
+                yield key, str.__str__(_keystr(key))
+
+    def _plain(self, value):
+        """Returns a copy of value shaped like the output of json.loads."""
+        if isinstance(value, dict):
+            return ODict((k, self._plain(value[key])) for key, k in self._keys(value))
+        elif isinstance(value, (list, tuple)):
+            return [self._plain(v) for v in value]
+        value = _leaf(value, self.validation)
+        if isinstance(value, (dict, list, tuple)):
+            return self._plain(value)
+        return value
+
+    def _literal(self, resource, prop, clean_up):
+        # Same as cfn_literal_parser
+        properties = resource.get("Properties")
+        if not properties or not isinstance(properties, dict):
+            return resource
+        definition = properties.get(prop)
+        if not definition or not isinstance(definition, dict):
+            return resource
+        definition = self._plain(definition)
+        if clean_up:
+            definition = clean(definition)
+        if not isinstance(definition, dict) or has_intrinsic_functions(
+            definition.keys()
+        ):
+            return resource
+        keys = list(resource)
+        if self.sort_keys or keys.index("Properties") < keys.index("Type"):
+            # cfn_literal_parser reaches the properties before the type
+            definition = cfn_literal_parser(definition)
+        resource = dict(resource)
+        resource["Properties"] = dict(properties)
+        resource["Properties"][prop] = _Literal(
+            json.dumps(definition, indent=2, separators=(",", ": "))
+        )
+        return resource
+
+    def _scalar_plan(self, value, tag):
+        """Works out how the dumper emits a scalar.
+
+        Returns the emitter event and scalar analysis, whether the scalar can
+        be a simple key and, as a mapping value and as a key, the text to write
+        when the emitter is not needed. The text is a (text, foldable, quoted)
+        tuple where foldable text can only be written as is when it fits on
+        the line.
+        """
+        dumper = self.dumper
+        if tag is not None:
+            node = dumper.represent_scalar(tag, value)
+        elif type(value) is _Literal:
+            node = dumper.represent_data(LiteralString(value.value))
+        else:
+            node = dumper.represent_data(value)
+        detected_tag = dumper.resolve(ScalarNode, node.value, (True, False))
+        default_tag = dumper.resolve(ScalarNode, node.value, (False, True))
+        event = ScalarEvent(
+            None,
+            node.tag,
+            (node.tag == detected_tag, node.tag == default_tag),
+            node.value,
+            style=node.style,
+        )
+        analysis = dumper.analyze_scalar(node.value)
+        prepared_tag = dumper.prepare_tag(node.tag)
+        scalar = analysis.scalar
+        simple = (
+            len(prepared_tag) + len(scalar) < 128
+            and not analysis.empty
+            and not analysis.multiline
+        )
+
+        dumper.event = event
+        dumper.analysis = analysis
+        texts = []
+        for simple_key in (False, True):
+            dumper.simple_key_context = simple_key
+            style = dumper.choose_scalar_style()
+            if style == "" and scalar:
+                texts.append((scalar, " " in scalar and not simple_key, False))
+            elif style == "'" and not (
+                " " in scalar or "'" in scalar or _BREAKS.intersection(scalar)
+            ):
+                text = "'%s'" % scalar
+                if not event.implicit[1]:
+                    text = "%s %s" % (prepared_tag, text)
+                texts.append((text, False, True))
+            else:
+                texts.append(None)
+        dumper.event = dumper.analysis = None
+        dumper.simple_key_context = False
+        return event, analysis, simple, texts[0], texts[1]
+
+    def _scalar(self, value, tag=None):
+        if isinstance(value, float):
+            # -0.0 == 0.0 so floats are not cached
+            return self._write_scalar(self._scalar_plan(value, tag), False)
+        key = (type(value), value, tag)
+        plan = self._scalars.get(key)
+        if plan is None:
+            plan = self._scalars[key] = self._scalar_plan(value, tag)
+        self._write_scalar(plan, False)
+
+    def _write_scalar(self, plan, simple_key):
+        dumper = self.dumper
+        fast = plan[4] if simple_key else plan[3]
+        if fast is not None:
+            text, foldable, quoted = fast
+            if not dumper.whitespace:
+                text = " " + text
+            if not foldable or dumper.column + len(text) <= dumper.best_width:
+                dumper.stream.write(text)
+                dumper.column += len(text)
+                dumper.whitespace = dumper.indention = False
+                if quoted:
+                    dumper.open_ended = False
+                return
+
+        # Let the emitter write anything more involved
+        dumper.event, dumper.analysis = plan[0], plan[1]
+        dumper.style = None
+        dumper.simple_key_context = simple_key
+        dumper.process_tag()
+        dumper.increase_indent(flow=True)
+        dumper.process_scalar()
+        dumper.indent = dumper.indents.pop()
+        dumper.event = None
+        dumper.simple_key_context = False
+
+    def _tag(self, tag):
+        if tag is not None:
+            prepared = self._tags.get(tag)
+            if prepared is None:
+                prepared = self._tags[tag] = self.dumper.prepare_tag(tag)
+            self.dumper.write_indicator(prepared, True)
+
+    def _mapping(self, mapping, clean_up, tag=None):
+        dumper = self.dumper
+        self._tag(tag)
+        if not mapping:
+            dumper.write_indicator("{", True, whitespace=True)
+            dumper.write_indicator("}", False)
+            return
+
+        resource_type = mapping.get("Type")
+        if (
+            type(resource_type) is str
+            and resource_type in LITERAL_PROPERTIES
+            and not self._in_type
+        ):
+            mapping = self._literal(
+                mapping, LITERAL_PROPERTIES[resource_type], clean_up
+            )
+
+        dumper.indents.append(dumper.indent)
+        dumper.indent = (
+            0 if dumper.indent is None else dumper.indent + dumper.best_indent
+        )
+        for key, text in self._keys(mapping):
+            dumper.write_indent()
+            plan = self._scalars.get((str, text, None))
+            if plan is None:
+                plan = self._scalars[(str, text, None)] = self._scalar_plan(text, None)
+            if plan[2]:
+                self._write_scalar(plan, True)
+                dumper.write_indicator(":", False)
+            else:
+                dumper.write_indicator("?", True, indention=True)
+                self._write_scalar(plan, False)
+                dumper.write_indent()
+                dumper.write_indicator(":", True, indention=True)
+            if text == "Type":
+                # cfn_literal_parser does not look inside the value of Type
+                self._in_type += 1
+                self._node(mapping[key], clean_up)
+                self._in_type -= 1
+            else:
+                self._node(mapping[key], clean_up)
+            if len(dumper.stream) >= BUFFER_CHUNKS:
+                self._fp.write("".join(dumper.stream))
+                dumper.stream.clear()
+        dumper.indent = dumper.indents.pop()
+
+    def _sequence(self, sequence, clean_up, tag=None):
+        dumper = self.dumper
+        self._tag(tag)
+        if not sequence:
+            dumper.write_indicator("[", True, whitespace=True)
+            dumper.write_indicator("]", False)
+            return
+
+        dumper.indents.append(dumper.indent)
+        dumper.indent = (
+            0 if dumper.indent is None else dumper.indent + dumper.best_indent
+        )
+        for item in sequence:
+            dumper.write_indent()
+            dumper.write_indicator("-", True, indention=True)
+            self._node(item, clean_up)
+        dumper.indent = dumper.indents.pop()
+
+    def _node(self, value, clean_up, tag=None):
+        """Writes a value, tag is set for the argument of a short form function."""
+        if type(value) is str:
+            return self._scalar(value, tag)
+        if not isinstance(value, (dict, list, tuple, _Literal)):
+            value = _leaf(value, self.validation)
+
+        if isinstance(value, dict):
+            if clean_up and "Fn::Join" in value:
+                # Same as cfn_clean.clean, which has already cleaned up the
+                # result so it is not cleaned again.
+                value = convert_join(self._plain(value["Fn::Join"]))
+                return self._node(_sorted_dicts(value), False, tag)
+            if (
+                tag is None
+                and not self.long_form
+                and len(value) == 1
+                and type(value) is not _SortedDict
+            ):
+                ((key, text),) = self._keys(value)
+                if text in CONVERTED_SUFFIXES:
+                    return self._function(text, value[key], clean_up)
+                if text.startswith(FN_PREFIX):
+                    return self._function(text[4:], value[key], clean_up)
+            self._mapping(value, clean_up, tag)
+        elif isinstance(value, (list, tuple)):
+            self._sequence(value, clean_up, tag)
+        else:
+            self._scalar(value, tag)
+
+    def _function(self, name, value, clean_up):
+        # Same as cfn_flip.yaml_dumper.fn_representer
+        tag = "!" + name
+        if tag == "!GetAtt" and isinstance(value, (list, tuple)):
+            value = ".".join(value)
+        self._node(value, clean_up, tag)
+
+    def write(self, o, fp):
+        """Writes the YAML text for the template data o to fp."""
+        dumper = self.dumper
+        buffer = dumper.stream = _Buffer()
+        self._fp = fp
+        try:
+            self._node(o, self.clean_up)
+            dumper.indent = None
+            dumper.write_indent()
+            if dumper.open_ended:
+                dumper.write_indicator("...", True)
+                dumper.write_indent()
+        finally:
+            dumper.stream = self._fp = None
+        fp.write("".join(buffer))
+
+
+def dump(
+    obj,
+    fp,
+    clean_up=False,
+    long_form=False,
+    sort_keys=True,
+    validation=True,
+    minify=False,
+):
+    """Serializes obj to fp as CloudFormation YAML.
+
+    Takes the same arguments as Template.to_yaml.
+    """
+    try:
+        writer = YAMLWriter(
+            clean_up=clean_up,
+            long_form=long_form,
+            sort_keys=sort_keys,
+            validation=validation,
+            minify=minify,
+        )
+    except (ImportError, AttributeError):
+        import cfn_flip
+
+        text = json.dumps(_encode_shared(obj, validation), sort_keys=sort_keys)
+        fp.write(cfn_flip.to_yaml(text, clean_up=clean_up, long_form=long_form))
+        return
+    writer.write(obj, fp)
+
+
+__all__ = ["YAMLWriter", "dump"]